@@ -10,12 +10,22 @@ Analyzers:
 - Diagram Adapters: Architecture diagram generation via Terravision or other tools
 """
 
+from typing import TYPE_CHECKING, Any
+
 from orisha.analyzers.ast_parser import ASTParser
 from orisha.analyzers.base import ToolAdapter, ToolExecutionError, ToolNotAvailableError
 from orisha.analyzers.dependency import DependencyParser, DirectDependencyResolver
 from orisha.analyzers.diagrams import DiagramGenerator, TerravisionAdapter
-from orisha.analyzers.registry import ToolRegistry, get_registry, reset_registry
-from orisha.analyzers.sbom import SBOMAdapter, SyftAdapter
+from orisha.analyzers.registry import (
+    SBOMAdapterSource,
+    ToolRegistry,
+    get_registry,
+    reset_registry,
+)
+from orisha.analyzers.sbom import SBOMAdapter
+
+if TYPE_CHECKING:
+    from orisha.analyzers.sbom.syft import SyftAdapter
 
 __all__ = [
     "ASTParser",
@@ -29,12 +39,52 @@ __all__ = [
     "ToolExecutionError",
     "ToolNotAvailableError",
     "ToolRegistry",
+    "create_default_registry",
     "get_registry",
     "reset_registry",
     "setup_default_adapters",
 ]
 
 
+def __getattr__(name: str) -> Any:
+    """Import SBOM adapter classes on first access (PEP 562)."""
+    if name == "SyftAdapter":
+        from orisha.analyzers import sbom
+
+        return sbom.SyftAdapter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _load_syft_adapter() -> type[SBOMAdapter]:
+    """Import the Syft adapter when the SBOM tool is first used."""
+    from orisha.analyzers.sbom.syft import SyftAdapter
+
+    return SyftAdapter
+
+
+# Shipped SBOM adapters: (name, adapter class or factory, is_default)
+DEFAULT_SBOM_ADAPTERS: tuple[tuple[str, SBOMAdapterSource, bool], ...] = (
+    ("syft", _load_syft_adapter, True),
+)
+
+# Shipped diagram adapters: (name, adapter class, is_default)
+DEFAULT_DIAGRAM_ADAPTERS: tuple[tuple[str, type[DiagramGenerator], bool], ...] = (
+    ("terravision", TerravisionAdapter, True),
+)
+
+
+def create_default_registry() -> ToolRegistry:
+    """Create a registry holding the shipped default tool adapters.
+
+    Returns:
+        New ToolRegistry
+    """
+    return ToolRegistry(
+        sbom_adapters=DEFAULT_SBOM_ADAPTERS,
+        diagram_adapters=DEFAULT_DIAGRAM_ADAPTERS,
+    )
+
+
 def setup_default_adapters(registry: ToolRegistry | None = None) -> ToolRegistry:
     """Register all default tool adapters.
 
@@ -47,10 +97,10 @@ def setup_default_adapters(registry: ToolRegistry | None = None) -> ToolRegistry
     if registry is None:
         registry = get_registry()
 
-    # Register SBOM adapters
-    registry.register_sbom_adapter("syft", SyftAdapter, is_default=True)
+    for name, adapter_source, is_default in DEFAULT_SBOM_ADAPTERS:
+        registry.register_sbom_adapter(name, adapter_source, is_default=is_default)
 
-    # Register diagram adapters
-    registry.register_diagram_adapter("terravision", TerravisionAdapter, is_default=True)
+    for name, adapter_class, is_default in DEFAULT_DIAGRAM_ADAPTERS:
+        registry.register_diagram_adapter(name, adapter_class, is_default=is_default)
 
     return registry
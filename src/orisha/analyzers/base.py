@@ -7,6 +7,8 @@ All tool adapters MUST implement this interface. Each adapter:
 4. Handles tool-specific errors gracefully
 """
 
+import os
+import shutil
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any, Generic, TypeVar
@@ -14,6 +16,34 @@ from typing import Any, Generic, TypeVar
 # Generic type for the canonical output format
 T = TypeVar("T")
 
+# Executable paths found on PATH, by (tool, PATH value). Only successful
+# lookups are kept, so a tool installed later in the process is still found,
+# and changing PATH starts a fresh lookup.
+_tool_locations: dict[tuple[str, str], str] = {}
+
+
+def locate_tool(tool: str) -> str | None:
+    """Find an executable on PATH, remembering where it was found.
+
+    Args:
+        tool: Executable name (e.g., "syft")
+
+    Returns:
+        Absolute path to the executable, or None if it is not on PATH
+    """
+    key = (tool, os.environ.get("PATH", ""))
+    location = _tool_locations.get(key)
+    if location is None:
+        location = shutil.which(tool)
+        if location is not None:
+            _tool_locations[key] = location
+    return location
+
+
+def clear_tool_locations() -> None:
+    """Forget remembered executable paths (e.g. after uninstalling a tool)."""
+    _tool_locations.clear()
+
 
 class ToolAdapter(ABC, Generic[T]):
     """Abstract interface for pluggable analysis tools.
@@ -658,6 +658,36 @@ class DirectDependencyResolver:
 
         return False
 
+    def as_set(self) -> frozenset[tuple[str, str]]:
+        """Get all direct dependencies as a set of lookup keys.
+
+        A package is direct exactly when `package_key(name, ecosystem)` is in
+        this set, which lets callers checking many packages use a plain
+        membership test instead of calling is_direct for each one.
+
+        Returns:
+            Frozen set of (lookup name, ecosystem) pairs
+        """
+        return frozenset(
+            self.package_key(name, ecosystem)
+            for ecosystem, names in self._direct_deps.items()
+            for name in names
+        )
+
+    def package_key(self, name: str, ecosystem: str) -> tuple[str, str]:
+        """Get the key identifying a package in the set from as_set.
+
+        Args:
+            name: Package name
+            ecosystem: Package ecosystem (npm, pypi, go, maven)
+
+        Returns:
+            Tuple of (lookup name, ecosystem); PyPI names are normalized
+        """
+        if ecosystem == "pypi":
+            return self._normalize_pypi_name(name), ecosystem
+        return name, ecosystem
+
     def get_direct_dependencies(self, ecosystem: str) -> set[str]:
         """Get all direct dependency names for an ecosystem.
 
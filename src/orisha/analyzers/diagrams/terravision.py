@@ -9,14 +9,25 @@ before analysis begins. No fallback parsing is provided - run `orisha check`
 to verify dependencies.
 """
 
+import contextlib
 import json
 import logging
+import os
+import shutil
 import subprocess
+import sys
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
-from orisha.analyzers.base import ToolExecutionError, ToolNotAvailableError
+try:
+    import ijson
+except ImportError:  # Optional: install with `pip install orisha[streaming]`
+    ijson = None  # type: ignore[assignment]
+
+from orisha.analyzers.base import ToolExecutionError, ToolNotAvailableError, locate_tool
 from orisha.analyzers.diagrams.base import DiagramGenerator
 from orisha.models.canonical import (
     ArchitectureSource,
@@ -52,6 +63,16 @@ RESOURCE_PREFIX_TO_PROVIDER: dict[str, str] = {
     "cloudflare_": "cloudflare",
 }
 
+# architecture.json files larger than this are streamed with ijson (if installed)
+# instead of being loaded into memory as a single dict
+GRAPH_STREAM_THRESHOLD_BYTES = 10 * 1024 * 1024
+
+# Resource attributes that are internal identifiers rather than useful properties
+_EXCLUDE_ATTR_KEYS: frozenset[str] = frozenset({"module", "id", "arn", "tags_all"})
+
+# Temporary files Terravision writes into the working directory
+_TV_TEMP_FILES: tuple[str, ...] = ("architecture.dot.png", "architecture.json", "tfdata.json")
+
 
 class TerravisionAdapter(DiagramGenerator):
     """Diagram adapter using Terravision for Terraform.
@@ -78,37 +99,54 @@ class TerravisionAdapter(DiagramGenerator):
         """
         super().__init__(name=name)
         self.use_debug = use_debug
+        # Results of the `terravision --version` probe (None until probed)
+        self._available: bool | None = None
+        self._version_line: str | None = None
+        # Absolute path of the terravision executable, resolved once by the probe
+        self._binary_path: str | None = None
+
+    def _probe(self) -> None:
+        """Run `terravision --version` once and cache availability and version.
+
+        A single invocation answers both check_available() and get_version(),
+        so repeated calls do not fork a new process each time. The executable is
+        resolved on PATH here so later invocations skip the lookup.
+        """
+        binary_path = locate_tool("terravision")
+        if binary_path is None:
+            self._available = False
+            return
 
-    def check_available(self) -> bool:
-        """Check if Terravision is installed and accessible."""
         try:
             result = subprocess.run(
-                ["terravision", "--version"],
+                [binary_path, "--version"],
                 capture_output=True,
                 text=True,
                 timeout=10,
             )
-            return result.returncode == 0
         except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
-            return False
+            self._available = False
+            return
+
+        self._available = result.returncode == 0
+        if self._available:
+            self._binary_path = binary_path
+            output = result.stdout.strip()
+            # Extract version from output
+            if output:
+                self._version_line = output.split("\n")[0].strip()
+
+    def check_available(self) -> bool:
+        """Check if Terravision is installed and accessible (cached)."""
+        if self._available is None:
+            self._probe()
+        return bool(self._available)
 
     def get_version(self) -> str | None:
-        """Get Terravision version string."""
-        try:
-            result = subprocess.run(
-                ["terravision", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            if result.returncode == 0:
-                output = result.stdout.strip()
-                # Extract version from output
-                if output:
-                    return output.split("\n")[0].strip()
-            return None
-        except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
-            return None
+        """Get Terravision version string (cached)."""
+        if self._available is None:
+            self._probe()
+        return self._version_line
 
     def execute(self, input_path: Path) -> CanonicalArchitecture:
         """Generate architecture diagram for the given path.
@@ -123,6 +161,9 @@ class TerravisionAdapter(DiagramGenerator):
             ToolNotAvailableError: If Terravision is not installed
             ToolExecutionError: If execution fails
         """
+        # Read the clock once so the recorded timestamp marks when analysis started
+        generated_at = datetime.now(UTC)
+
         # Find Terraform files
         tf_files = self._find_terraform_files(input_path)
         if not tf_files:
@@ -131,7 +172,7 @@ class TerravisionAdapter(DiagramGenerator):
                 source=ArchitectureSource(
                     tool="terravision",
                     tool_version=self.version or "unknown",
-                    generated_at=datetime.now(UTC),
+                    generated_at=generated_at,
                     source_files=[],
                     source_type="terraform",
                 )
@@ -145,7 +186,36 @@ class TerravisionAdapter(DiagramGenerator):
                 "Install from: https://github.com/patrickchugh/terravision",
             )
 
-        return self._execute_terravision(input_path, tf_files)
+        return self._execute_terravision(input_path, tf_files, generated_at)
+
+    def execute_batch(
+        self,
+        input_paths: list[Path],
+        max_workers: int | None = None,
+    ) -> list[CanonicalArchitecture]:
+        """Generate architecture diagrams for several paths concurrently.
+
+        Each Terravision run is an external process dominated by I/O and
+        `terraform plan`, so runs for independent paths are overlapped on a
+        thread pool rather than executed one after another.
+
+        Args:
+            input_paths: Repository or directory paths containing Terraform files
+            max_workers: Maximum concurrent Terravision runs (defaults to CPU count)
+
+        Returns:
+            CanonicalArchitecture for each input path, in the same order
+
+        Raises:
+            ToolNotAvailableError: If Terravision is not installed
+            ToolExecutionError: If any execution fails
+        """
+        if not input_paths:
+            return []
+
+        workers = min(max_workers or os.cpu_count() or 1, len(input_paths))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.execute, input_paths))
 
     def get_supported_sources(self) -> list[str]:
         """Get list of infrastructure source types this tool supports."""
@@ -164,27 +234,22 @@ class TerravisionAdapter(DiagramGenerator):
         Returns:
             List of .tf file paths
         """
-        tf_files: list[Path] = []
         if directory.is_file() and directory.suffix == ".tf":
             return [directory]
 
-        for pattern in ["*.tf", "**/*.tf"]:
-            tf_files.extend(directory.glob(pattern))
-
-        # Filter out common non-main directories
-        filtered = []
-        for tf_file in tf_files:
-            # Skip .terraform directory
-            if ".terraform" in tf_file.parts:
-                continue
-            filtered.append(tf_file)
+        # rglob matches the root directory and all subdirectories exactly once,
+        # so no dedup is needed. Skip the .terraform provider/module cache.
+        tf_files = [
+            tf_file for tf_file in directory.rglob("*.tf") if ".terraform" not in tf_file.parts
+        ]
 
-        return sorted(set(filtered))
+        return sorted(tf_files)
 
     def _execute_terravision(
         self,
         input_path: Path,
         tf_files: list[Path],
+        generated_at: datetime | None = None,
     ) -> CanonicalArchitecture:
         """Execute Terravision and transform output.
 
@@ -195,12 +260,11 @@ class TerravisionAdapter(DiagramGenerator):
         Args:
             input_path: Input directory
             tf_files: List of Terraform files
+            generated_at: Analysis start time (defaults to now)
 
         Returns:
             CanonicalArchitecture
         """
-        import shutil
-
         # Output paths - terravision creates these in cwd
         diagram_path = input_path / "architecture.dot.png"
         graph_json_path = input_path / "architecture.json"
@@ -208,7 +272,7 @@ class TerravisionAdapter(DiagramGenerator):
 
         # Build draw command - generates PNG + architecture.json
         cmd = [
-            "terravision",
+            self._binary_path or "terravision",
             "draw",
             "--source", str(input_path),
             "--format", "png",
@@ -244,44 +308,55 @@ class TerravisionAdapter(DiagramGenerator):
                 f"Terravision failed with exit code {result.returncode}: {result.stderr}",
             )
 
-        # Read and parse outputs
+        # Read and parse outputs. Files are read as raw bytes: json.loads detects
+        # the UTF encoding itself, so the text-mode decoding layer is skipped.
         try:
             tfdata: dict[str, Any] = {}
             tv_output: dict[str, Any] = {}
 
             # With --debug, tfdata.json has everything: graphdict, meta_data, plandata
-            if self.use_debug and tfdata_path.exists():
+            if self.use_debug:
                 try:
-                    tfdata = json.loads(tfdata_path.read_text())
+                    tfdata = json.loads(tfdata_path.read_bytes())
                     # graphdict contains the adjacency list (same as graphdata output)
                     tv_output = tfdata.get("graphdict", {})
                     logger.info("Loaded graph and metadata from tfdata.json")
+                except FileNotFoundError:
+                    pass
                 except json.JSONDecodeError:
                     logger.warning("Failed to parse tfdata.json")
 
-            # Fallback to architecture.json if tfdata not available
-            if not tv_output and graph_json_path.exists():
-                tv_output = json.loads(graph_json_path.read_text())
-                logger.info("Loaded graph from architecture.json")
-
+            # Fallback to architecture.json if tfdata not available. Very large
+            # graphs are streamed node by node rather than loaded whole.
+            stream_graph = False
             if not tv_output:
+                try:
+                    graph_json_size: int | None = graph_json_path.stat().st_size
+                except FileNotFoundError:
+                    graph_json_size = None
+                if graph_json_size is not None:
+                    if ijson is not None and graph_json_size > GRAPH_STREAM_THRESHOLD_BYTES:
+                        stream_graph = True
+                    else:
+                        tv_output = json.loads(graph_json_path.read_bytes())
+                        logger.info("Loaded graph from architecture.json")
+
+            if not tv_output and not stream_graph:
                 raise ToolExecutionError(
                     self.name,
                     "Terravision did not produce graph output",
                 )
 
             # Copy diagram to docs directory if it exists
-            rendered_image_path: Path | None = None
-            if diagram_path.exists():
-                docs_dir = input_path / "docs"
-                docs_dir.mkdir(exist_ok=True)
-                dest_path = docs_dir / "architecture.png"
-                shutil.copy2(diagram_path, dest_path)
-                rendered_image_path = dest_path
-                logger.info("Copied architecture diagram to %s", dest_path)
+            rendered_image_path = self._copy_rendered_diagram(diagram_path, input_path)
+
+            if stream_graph:
+                return self._transform_streamed_graph(
+                    graph_json_path, input_path, tf_files, rendered_image_path, generated_at
+                )
 
             return self._transform_terravision_output(
-                tv_output, input_path, tf_files, tfdata, rendered_image_path
+                tv_output, input_path, tf_files, tfdata, rendered_image_path, generated_at
             )
         except json.JSONDecodeError as e:
             raise ToolExecutionError(
@@ -291,18 +366,96 @@ class TerravisionAdapter(DiagramGenerator):
         finally:
             self._cleanup_terravision_files(input_path)
 
+    def _copy_rendered_diagram(self, diagram_path: Path, input_path: Path) -> Path | None:
+        """Copy Terravision's rendered PNG into the docs directory.
+
+        Args:
+            diagram_path: Path to the PNG written by Terravision
+            input_path: Input directory
+
+        Returns:
+            Path to the copied diagram, or None if Terravision rendered no diagram
+        """
+        try:
+            diagram_size = diagram_path.stat().st_size
+        except FileNotFoundError:
+            return None
+
+        docs_dir = input_path / "docs"
+        docs_dir.mkdir(exist_ok=True)
+        dest_path = docs_dir / "architecture.png"
+        # Build artifact: copy contents only (zero-copy sendfile on Linux),
+        # skipping copy2's permission/timestamp syscalls
+        shutil.copyfile(diagram_path, dest_path)
+        logger.info("Copied architecture diagram to %s (%d bytes)", dest_path, diagram_size)
+        return dest_path
+
+    def _transform_streamed_graph(
+        self,
+        graph_json_path: Path,
+        input_path: Path,
+        tf_files: list[Path],
+        rendered_image_path: Path | None,
+        generated_at: datetime | None = None,
+    ) -> CanonicalArchitecture:
+        """Transform architecture.json by streaming its top-level entries with ijson.
+
+        Each (node_id, connections) pair is fed into the graph as it is parsed, so
+        the full adjacency list is never materialized as one Python dict.
+
+        Args:
+            graph_json_path: Path to Terravision's architecture.json
+            input_path: Original input path
+            tf_files: List of Terraform files
+            rendered_image_path: Path to rendered PNG diagram if available
+            generated_at: Analysis start time (defaults to now)
+
+        Returns:
+            CanonicalArchitecture
+
+        Raises:
+            ToolExecutionError: If the file cannot be parsed or has no nodes
+        """
+        with graph_json_path.open("rb") as f:
+            try:
+                architecture = self._transform_terravision_output(
+                    ijson.kvitems(f, ""),
+                    input_path,
+                    tf_files,
+                    None,
+                    rendered_image_path,
+                    generated_at,
+                )
+            except ijson.JSONError as e:
+                raise ToolExecutionError(
+                    self.name,
+                    f"Failed to parse Terravision JSON output: {e}",
+                ) from e
+
+        if not architecture.graph.nodes:
+            raise ToolExecutionError(
+                self.name,
+                "Terravision did not produce graph output",
+            )
+
+        logger.info("Streamed graph from architecture.json")
+        return architecture
+
     def _cleanup_terravision_files(self, input_path: Path) -> None:
         """Remove temporary files created by Terravision."""
-        for filename in ["architecture.dot.png", "architecture.json", "tfdata.json"]:
-            (input_path / filename).unlink(missing_ok=True)
+        base = os.fspath(input_path)
+        for filename in _TV_TEMP_FILES:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(os.path.join(base, filename))
 
     def _transform_terravision_output(
         self,
-        tv_output: dict[str, Any],
+        tv_output: Mapping[str, Any] | Iterable[tuple[str, Any]],
         input_path: Path,
         tf_files: list[Path],
         tfdata: dict[str, Any] | None = None,
         rendered_image_path: Path | None = None,
+        generated_at: datetime | None = None,
     ) -> CanonicalArchitecture:
         """Transform Terravision JSON output to CanonicalArchitecture.
 
@@ -316,11 +469,14 @@ class TerravisionAdapter(DiagramGenerator):
         resource attributes from the Terraform plan.
 
         Args:
-            tv_output: Parsed Terravision JSON output (adjacency list)
+            tv_output: Parsed Terravision JSON output (adjacency list), or an
+                iterable of (node_id, connections) pairs when streaming
             input_path: Original input path
             tf_files: List of Terraform files
             tfdata: Optional rich metadata from tfdata.json (debug mode)
-            rendered_image_path: Path to rendered PNG diagram if available
+            rendered_image_path: Path to the copied PNG diagram (already known to
+                exist), or None if no diagram was rendered
+            generated_at: Analysis start time (defaults to now)
 
         Returns:
             CanonicalArchitecture
@@ -331,39 +487,54 @@ class TerravisionAdapter(DiagramGenerator):
 
         # Terravision outputs adjacency list: {"resource.name": ["connected_resource", ...]}
         # Keys are node IDs in format "resource_type.resource_name"
-        for node_id, connections in tv_output.items():
+        nodes: list[tuple[str, NodeMetadata]] = []
+        # Resource types repeat heavily, so resolve each type's provider only once
+        provider_cache: dict[str, str] = {}
+        # Node IDs reappear as edge targets and resource types repeat across nodes;
+        # interning makes every occurrence share one string object in large graphs
+        intern = sys.intern
+        items = tv_output.items() if isinstance(tv_output, Mapping) else tv_output
+        for raw_node_id, connections in items:
+            node_id = intern(raw_node_id)
             # Parse resource type and name from node ID (e.g., "aws_lambda_function.bedrock_proxy")
-            parts = node_id.split(".", 1)
-            if len(parts) == 2:
-                resource_type, resource_name = parts
+            resource_type, sep, resource_name = node_id.partition(".")
+            if sep:
+                resource_type = intern(resource_type)
             else:
                 resource_type = "unknown"
                 resource_name = node_id
 
-            provider = self._get_provider_from_resource_type(resource_type)
+            provider = provider_cache.get(resource_type)
+            if provider is None:
+                provider = self._get_provider_from_resource_type(resource_type)
+                provider_cache[resource_type] = provider
 
             # Get rich attributes from meta_data if available
             attributes = self._extract_resource_attributes(node_id, meta_data)
 
-            graph.add_node(
-                node_id,
-                NodeMetadata(
-                    type=resource_type,
-                    provider=provider,
-                    name=resource_name,
-                    attributes=attributes,
-                ),
+            nodes.append(
+                (
+                    node_id,
+                    NodeMetadata(
+                        type=resource_type,
+                        provider=provider,
+                        name=resource_name,
+                        attributes=attributes,
+                    ),
+                )
             )
 
-            # Add connections (edges)
+            # Add connections (edges) as one adjacency list entry per node
             if isinstance(connections, list):
-                for target in connections:
-                    if target:
-                        graph.add_connection(node_id, target)
+                graph.add_connections_from(
+                    node_id, [intern(target) for target in connections if target]
+                )
+
+        graph.add_nodes(nodes)
 
         # Create rendered image reference if diagram was generated
         rendered_image: RenderedImage | None = None
-        if rendered_image_path and rendered_image_path.exists():
+        if rendered_image_path:
             rendered_image = RenderedImage(
                 format="png",
                 path=rendered_image_path,
@@ -373,8 +544,8 @@ class TerravisionAdapter(DiagramGenerator):
         source = ArchitectureSource(
             tool="terravision",
             tool_version=self.version or "unknown",
-            generated_at=datetime.now(UTC),
-            source_files=[str(f.relative_to(input_path)) for f in tf_files],
+            generated_at=generated_at or datetime.now(UTC),
+            source_files=self._relative_source_files(input_path, tf_files),
             source_type="terraform",
         )
 
@@ -392,6 +563,33 @@ class TerravisionAdapter(DiagramGenerator):
             source=source,
         )
 
+    def _relative_source_files(self, input_path: Path, tf_files: list[Path]) -> list[str]:
+        """Get Terraform file paths relative to the input path.
+
+        tf_files come from globbing input_path, so they share its string prefix and
+        can be sliced directly instead of building a Path per file via relative_to().
+
+        Args:
+            input_path: Original input path
+            tf_files: List of Terraform files
+
+        Returns:
+            Relative file path strings
+        """
+        base = str(input_path)
+        prefix = base if base.endswith(os.sep) else base + os.sep
+        cut = len(prefix)
+        relative: list[str] = []
+        for tf_file in tf_files:
+            path = str(tf_file)
+            if path.startswith(prefix):
+                relative.append(path[cut:])
+            elif path == base:
+                relative.append(".")
+            else:
+                relative.append(path)
+        return relative
+
     def _extract_resource_attributes(
         self,
         node_id: str,
@@ -412,28 +610,20 @@ class TerravisionAdapter(DiagramGenerator):
         if not raw_attrs:
             return {}
 
-        # Keys to always exclude
-        exclude_keys = {"module", "id", "arn", "tags_all"}
-
         # Filter attributes:
-        # - Exclude internal fields
         # - Exclude computed values (True means "will be computed")
         # - Exclude None values
+        # - Exclude internal fields
         # - Exclude empty lists/dicts
-        attributes: dict[str, Any] = {}
-        for key, value in raw_attrs.items():
-            if key in exclude_keys:
-                continue
-            if value is True:  # Computed value placeholder
-                continue
-            if value is None:
-                continue
-            if isinstance(value, (list, dict)) and not value:
-                continue
-            # Include meaningful values
-            attributes[key] = value
-
-        return attributes
+        # Cheapest identity checks run first; isinstance only runs for falsy values.
+        return {
+            key: value
+            for key, value in raw_attrs.items()
+            if value is not True
+            and value is not None
+            and key not in _EXCLUDE_ATTR_KEYS
+            and (value or not isinstance(value, (list, dict)))
+        }
 
     def _get_provider_from_resource_type(self, resource_type: str) -> str:
         """Get cloud provider from Terraform resource type.
@@ -8,13 +8,203 @@ Detects public entry points in a codebase:
 """
 
 import logging
+import math
+import mmap
+import os
 import re
+from bisect import bisect_right
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
+from functools import cache
+from itertools import repeat
 from pathlib import Path
 
+from orisha.analyzers.scan_cache import ScanCache
 from orisha.models.canonical.module import EntryPoint
 
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns used in per-line scanning. Files are scanned as raw bytes;
+# only the captured groups that become EntryPoint fields are decoded.
+_DEF_RE = re.compile(rb"(?:async\s+)?def\s+(\w+)\s*\(")
+_NAME_MAIN_RE = re.compile(
+    rb"""__name__\s*==\s*['"]__main__['"]|['"]__main__['"]\s*==\s*__name__"""
+)
+_GO_FUNC_MAIN_RE = re.compile(rb"\s*func\s+main\s*\(\s*\)")
+_HTTP_HANDLEFUNC_RE = re.compile(rb'http\.HandleFunc\s*\(\s*["\']([^"\']+)["\']')
+_SPRING_MAPPING_RE = re.compile(
+    rb'@(GetMapping|PostMapping|PutMapping|DeleteMapping|RequestMapping)\s*\(\s*["\']?([^"\')\s]*)'
+)
+
+# Whole lines containing a literal every pattern of a language needs. Only these
+# lines are sliced out of the file buffer; the rest are never materialized.
+_PY_CANDIDATE_LINE_RE = re.compile(rb"(?m)^[^\n]*(?:@|__name__)[^\n]*")
+_JS_CANDIDATE_LINE_RE = re.compile(rb"(?m)^[^\n]*(?:app\.|router\.)[^\n]*")
+_GO_CANDIDATE_LINE_RE = re.compile(rb"(?m)^[^\n]*(?:func|http\.HandleFunc)[^\n]*")
+_JAVA_CANDIDATE_LINE_RE = re.compile(rb"(?m)^[^\n]*(?:public static void main|Mapping)[^\n]*")
+_JS_HANDLER_RE = re.compile(rb"exports\.handler|export const handler")
+_NEWLINE_RE = re.compile(rb"\n")
+
+# Source file extensions scanned for entry points
+SOURCE_EXTENSIONS: tuple[str, ...] = (".py", ".js", ".ts", ".tsx", ".go", ".java")
+
+# Directories never descended into when looking for source files
+SKIP_DIRS: frozenset[str] = frozenset(
+    {
+        ".git",
+        ".venv",
+        "venv",
+        "node_modules",
+        "__pycache__",
+        "dist",
+        "build",
+        "tests",
+        "test",
+        "spec",
+        "specs",
+    }
+)
+
+# Files larger than this are generated or vendored code in practice and are skipped
+MAX_SCAN_FILE_BYTES = 512 * 1024
+
+# Files at least this large are memory-mapped instead of read into memory
+MMAP_MIN_BYTES = 256 * 1024
+
+# Leading bytes checked for a NUL byte to recognize binary files
+BINARY_SNIFF_BYTES = 4096
+
+# Generated or bundled sources that never contain hand-written entry points
+GENERATED_FILE_SUFFIXES: tuple[str, ...] = (
+    "_pb2.py",
+    "_pb2_grpc.py",
+    ".min.js",
+    ".bundle.js",
+)
+
+# Cache file name used for persisted scan results under a repository's .orisha dir
+ENTRY_POINT_CACHE_FILE = "entry_points_cache.json"
+
+# Bumped whenever detection rules change, invalidating persisted scan results
+ENTRY_POINT_CACHE_VERSION = 1
+
+# Scans of more files than this are spread across worker processes
+PARALLEL_SCAN_MIN_FILES = 32
+
+# Files handed to a worker per task, to amortize inter-process overhead
+_PARALLEL_CHUNKSIZE = 32
+
+# Spring mapping annotation to HTTP method
+SPRING_MAPPING_METHODS: dict[str, str | None] = {
+    "GetMapping": "GET",
+    "PostMapping": "POST",
+    "PutMapping": "PUT",
+    "DeleteMapping": "DELETE",
+    "RequestMapping": None,
+}
+
+
+def _decode(value: bytes) -> str:
+    """Decode a captured byte string, replacing invalid UTF-8 sequences."""
+    return value.decode("utf-8", "replace")
+
+
+class _LineIndex:
+    """Maps byte offsets in a file buffer to 1-based line numbers.
+
+    The newline offsets are collected in one pass on the first lookup, so files
+    without a candidate line never pay for it; every lookup after that is a
+    binary search.
+    """
+
+    def __init__(self, content: bytes | mmap.mmap) -> None:
+        """Initialize the index.
+
+        Args:
+            content: File contents (bytes or a read-only memory map)
+        """
+        self._content = content
+        self._line_starts: list[int] | None = None
+
+    def line_at(self, offset: int) -> int:
+        """Return the line number containing a byte offset."""
+        if self._line_starts is None:
+            self._line_starts = [0]
+            self._line_starts.extend(m.end() for m in _NEWLINE_RE.finditer(self._content))
+        return bisect_right(self._line_starts, offset)
+
+
+def _iter_candidate_lines(
+    content: bytes | mmap.mmap, pattern: re.Pattern[bytes], line_index: _LineIndex
+) -> Iterator[tuple[int, int, bytes]]:
+    """Yield the lines of a file buffer matched by a candidate-line pattern.
+
+    Args:
+        content: File contents (bytes or a read-only memory map)
+        pattern: Multiline pattern matching a whole candidate line
+        line_index: Line index over ``content``
+
+    Yields:
+        Tuple of (1-based line number, offset of the line end, line bytes)
+    """
+    for match in pattern.finditer(content):
+        start, end = match.span()
+        yield line_index.line_at(start), end, content[start:end]
+
+
+def _following_lines(
+    content: bytes | mmap.mmap, line_end: int, limit: int
+) -> Iterator[tuple[int, int, bytes]]:
+    """Yield up to ``limit`` lines after the line ending at ``line_end``.
+
+    Args:
+        content: File contents (bytes or a read-only memory map)
+        line_end: Offset of the end of the current line
+        limit: Maximum number of lines to yield
+
+    Yields:
+        Tuple of (distance from the current line, offset of the line end, line bytes)
+    """
+    size = len(content)
+    pos = line_end + 1
+    for distance in range(1, limit + 1):
+        if pos > size:
+            return
+        newline = content.find(b"\n", pos)
+        end = size if newline == -1 else newline
+        yield distance, end, content[pos:end]
+        pos = end + 1
+
+
+def _fuse_patterns(
+    patterns: list[tuple[re.Pattern[bytes], tuple[str, str]]],
+    prefix: bytes = b"",
+) -> tuple[re.Pattern[bytes], dict[str, tuple[str, str, int, int]]]:
+    """Fuse (pattern, (ep_type, framework)) pairs into one alternation regex.
+
+    Each alternative is wrapped in a named group ``g<i>``. The wrapper closes after
+    the alternative's own groups, so ``match.lastgroup`` names the alternative
+    that matched and one search replaces one search per pattern.
+
+    Args:
+        patterns: Compiled patterns with their entry point type and framework
+        prefix: Pattern every alternative must be preceded by (e.g. an anchor)
+
+    Returns:
+        Tuple of (fused regex, group name -> (ep_type, framework, start, count)),
+        where ``match.groups()[start:start + count]`` are the alternative's groups
+    """
+    alternation = b"|".join(
+        b"(?P<g%d>%s)" % (i, pattern.pattern) for i, (pattern, _) in enumerate(patterns)
+    )
+    fused = re.compile(b"%s(?:%s)" % (prefix, alternation))
+    meta: dict[str, tuple[str, str, int, int]] = {}
+    for i, (pattern, (ep_type, framework)) in enumerate(patterns):
+        name = f"g{i}"
+        meta[name] = (ep_type, framework, fused.groupindex[name], pattern.groups)
+    return fused, meta
+
 
 class EntryPointDetector:
     """Detects entry points across multiple frameworks and languages.
@@ -26,82 +216,144 @@ class EntryPointDetector:
     - Main functions
     """
 
-    # Patterns for detecting decorators (Python)
-    PYTHON_DECORATOR_PATTERNS = {
+    # Patterns for detecting decorators (Python), compiled once at class load
+    PYTHON_DECORATOR_PATTERNS: list[tuple[re.Pattern[bytes], tuple[str, str]]] = [
         # Typer CLI
-        r'@app\.command\s*\(\s*["\']?(\w*)["\']?\s*\)': ("cli_command", "typer"),
-        r'@cli\.command\s*\(\s*["\']?(\w*)["\']?\s*\)': ("cli_command", "typer"),
-        # Click CLI
-        r'@click\.command\s*\(\s*["\']?(\w*)["\']?\s*\)': ("cli_command", "click"),
-        r'@cli\.command\s*\(\s*["\']?(\w*)["\']?\s*\)': ("cli_command", "click"),
+        (re.compile(rb'@app\.command\s*\(\s*["\']?(\w*)["\']?\s*\)'), ("cli_command", "typer")),
+        # Click CLI (Typer sub-apps named `cli` use the same decorator)
+        (re.compile(rb'@click\.command\s*\(\s*["\']?(\w*)["\']?\s*\)'), ("cli_command", "click")),
+        (re.compile(rb'@cli\.command\s*\(\s*["\']?(\w*)["\']?\s*\)'), ("cli_command", "click")),
         # FastAPI
-        r'@app\.(get|post|put|delete|patch)\s*\(\s*["\']([^"\']+)["\']': (
-            "api_endpoint",
-            "fastapi",
+        (
+            re.compile(rb'@app\.(get|post|put|delete|patch)\s*\(\s*["\']([^"\']+)["\']'),
+            ("api_endpoint", "fastapi"),
         ),
-        r'@router\.(get|post|put|delete|patch)\s*\(\s*["\']([^"\']+)["\']': (
-            "api_endpoint",
-            "fastapi",
+        (
+            re.compile(rb'@router\.(get|post|put|delete|patch)\s*\(\s*["\']([^"\']+)["\']'),
+            ("api_endpoint", "fastapi"),
         ),
         # Flask
-        r'@app\.route\s*\(\s*["\']([^"\']+)["\']': ("api_endpoint", "flask"),
-        r'@bp\.route\s*\(\s*["\']([^"\']+)["\']': ("api_endpoint", "flask"),
-        r'@blueprint\.route\s*\(\s*["\']([^"\']+)["\']': ("api_endpoint", "flask"),
-    }
+        (re.compile(rb'@app\.route\s*\(\s*["\']([^"\']+)["\']'), ("api_endpoint", "flask")),
+        (re.compile(rb'@bp\.route\s*\(\s*["\']([^"\']+)["\']'), ("api_endpoint", "flask")),
+        (
+            re.compile(rb'@blueprint\.route\s*\(\s*["\']([^"\']+)["\']'),
+            ("api_endpoint", "flask"),
+        ),
+    ]
 
     # Patterns for JavaScript/TypeScript
-    JS_PATTERNS = {
+    JS_PATTERNS: list[tuple[re.Pattern[bytes], tuple[str, str]]] = [
         # Express.js
-        r'app\.(get|post|put|delete|patch)\s*\(\s*["\']([^"\']+)["\']': (
-            "api_endpoint",
-            "express",
+        (
+            re.compile(rb'app\.(get|post|put|delete|patch)\s*\(\s*["\']([^"\']+)["\']'),
+            ("api_endpoint", "express"),
         ),
-        r'router\.(get|post|put|delete|patch)\s*\(\s*["\']([^"\']+)["\']': (
-            "api_endpoint",
-            "express",
+        (
+            re.compile(rb'router\.(get|post|put|delete|patch)\s*\(\s*["\']([^"\']+)["\']'),
+            ("api_endpoint", "express"),
         ),
-    }
+    ]
+
+    # Each pattern list fused into a single alternation (see _fuse_patterns).
+    # Decorators are matched from the line start past any indentation.
+    _PYTHON_DECORATOR_RE, _PYTHON_DECORATOR_META = _fuse_patterns(
+        PYTHON_DECORATOR_PATTERNS, prefix=rb"[ \t]*"
+    )
+    _JS_RE, _JS_META = _fuse_patterns(JS_PATTERNS)
 
-    def __init__(self, repo_path: Path) -> None:
+    def __init__(self, repo_path: Path, cache_path: Path | None = None) -> None:
         """Initialize the entry point detector.
 
         Args:
             repo_path: Path to repository root
+            cache_path: Optional JSON file persisting scan results between runs.
+                Files whose mtime and size are unchanged are not rescanned.
         """
         self.repo_path = repo_path
+        self.cache_path = cache_path
+        self._scan_cache: ScanCache[list[EntryPoint]] | None = None
+        if cache_path is not None:
+            self._scan_cache = ScanCache(
+                cache_path,
+                ENTRY_POINT_CACHE_VERSION,
+                encode=lambda entry_points: [asdict(ep) for ep in entry_points],
+                decode=lambda data: [EntryPoint(**ep) for ep in data],
+                description="entry point",
+            )
+        # Language detector by lowercase file suffix
+        self._detectors: dict[
+            str, Callable[[str, bytes | mmap.mmap, _LineIndex], list[EntryPoint]]
+        ] = {
+            ".py": self._detect_python_entry_points,
+            ".js": self._detect_js_entry_points,
+            ".ts": self._detect_js_entry_points,
+            ".tsx": self._detect_js_entry_points,
+            ".mjs": self._detect_js_entry_points,
+            ".go": self._detect_go_entry_points,
+            ".java": self._detect_java_entry_points,
+        }
 
-    def detect_entry_points(self, file_paths: list[Path] | None = None) -> list[EntryPoint]:
+    def detect_entry_points(
+        self, file_paths: list[Path] | None = None, complete: bool = False
+    ) -> list[EntryPoint]:
         """Detect entry points in the repository.
 
         Args:
             file_paths: Optional specific files to scan. If None, scans all supported files.
+            complete: Whether file_paths lists every source file of the repository
+                (as find_source_files does), so cached files not in it can be dropped
 
         Returns:
             List of detected entry points
         """
-        entry_points: list[EntryPoint] = []
-
+        full_scan = complete or file_paths is None
         if file_paths is None:
             file_paths = self._find_source_files()
 
+        # Entry points found per file
+        found: dict[Path, list[EntryPoint]] = {}
+
+        # Reuse cached results for unchanged files; only the rest are scanned
+        stats: dict[Path, tuple[str, int, int]] = {}
+        to_scan = file_paths
+        if self._scan_cache is not None:
+            to_scan = self._scan_cache.split(self.repo_path, file_paths, stats, found)
+
+        # Each file is an independent, regex-bound task, so large scans run in
+        # worker processes to use every core
+        if len(to_scan) > PARALLEL_SCAN_MIN_FILES:
+            # No more workers than there are chunks to hand out
+            workers = min(os.cpu_count() or 1, math.ceil(len(to_scan) / _PARALLEL_CHUNKSIZE))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(
+                    executor.map(
+                        _scan_file,
+                        repeat(self.repo_path),
+                        to_scan,
+                        chunksize=_PARALLEL_CHUNKSIZE,
+                    )
+                )
+        else:
+            results = [self._scan_one(file_path) for file_path in to_scan]
+
+        for file_path, (file_entry_points, error) in zip(to_scan, results, strict=True):
+            if error is not None:
+                logger.warning(f"Failed to detect entry points in {file_path}: {error}")
+                continue
+            found[file_path] = file_entry_points
+
+        # Entry points deduplicated by (name, file, line), in file order
+        unique: dict[tuple[str, str, int], EntryPoint] = {}
         for file_path in file_paths:
-            try:
-                file_entry_points = self._detect_in_file(file_path)
-                entry_points.extend(file_entry_points)
-            except Exception as e:
-                logger.warning(f"Failed to detect entry points in {file_path}: {e}")
-
-        # Deduplicate by (name, file, line)
-        seen: set[tuple[str, str, int]] = set()
-        unique_entry_points: list[EntryPoint] = []
-        for ep in entry_points:
-            key = (ep.name, ep.file, ep.line)
-            if key not in seen:
-                seen.add(key)
-                unique_entry_points.append(ep)
-
-        logger.info(f"Detected {len(unique_entry_points)} entry points")
-        return unique_entry_points
+            for ep in found.get(file_path, ()):
+                unique.setdefault((ep.name, ep.file, ep.line), ep)
+
+        if self._scan_cache is not None:
+            # A full scan rebuilds the cache, dropping files that no longer exist
+            self._scan_cache.update(stats, found, complete=full_scan)
+
+        logger.info(f"Detected {len(unique)} entry points")
+        return list(unique.values())
 
     def _find_source_files(self) -> list[Path]:
         """Find all source files in the repository.
@@ -109,30 +361,21 @@ class EntryPointDetector:
         Returns:
             List of source file paths
         """
-        extensions = [".py", ".js", ".ts", ".tsx", ".go", ".java"]
-        skip_dirs = {
-            ".git",
-            ".venv",
-            "venv",
-            "node_modules",
-            "__pycache__",
-            "dist",
-            "build",
-            "tests",
-            "test",
-            "spec",
-            "specs",
-        }
+        return find_source_files(self.repo_path)
+
+    def _scan_one(self, file_path: Path) -> tuple[list[EntryPoint], str | None]:
+        """Detect entry points in one file, capturing any error instead of raising.
 
-        files: list[Path] = []
-        for ext in extensions:
-            for file_path in self.repo_path.rglob(f"*{ext}"):
-                # Skip excluded directories
-                if any(skip_dir in file_path.parts for skip_dir in skip_dirs):
-                    continue
-                files.append(file_path)
+        Args:
+            file_path: Path to source file
 
-        return files
+        Returns:
+            Tuple of (entry points, error message or None)
+        """
+        try:
+            return self._detect_in_file(file_path), None
+        except Exception as e:
+            return [], str(e)
 
     def _detect_in_file(self, file_path: Path) -> list[EntryPoint]:
         """Detect entry points in a single file.
@@ -143,92 +386,86 @@ class EntryPointDetector:
         Returns:
             List of entry points found in the file
         """
-        entry_points: list[EntryPoint] = []
+        detector = self._detectors.get(file_path.suffix.lower())
+        if detector is None or file_path.name.endswith(GENERATED_FILE_SUFFIXES):
+            return []
         rel_path = str(file_path.relative_to(self.repo_path))
 
         try:
-            content = file_path.read_text(encoding="utf-8")
-            lines = content.split("\n")
-        except (UnicodeDecodeError, PermissionError):
+            with open(file_path, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                if size == 0:
+                    return []
+                if size > MAX_SCAN_FILE_BYTES:
+                    logger.debug(f"Skipping {rel_path}: {size} bytes exceeds scan limit")
+                    return []
+                # Large files are scanned through the page cache without copying
+                content: bytes | mmap.mmap = (
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    if size >= MMAP_MIN_BYTES
+                    else f.read()
+                )
+        except (OSError, ValueError):
             return []
 
-        suffix = file_path.suffix.lower()
-
-        if suffix == ".py":
-            entry_points.extend(self._detect_python_entry_points(rel_path, content, lines))
-        elif suffix in (".js", ".ts", ".tsx", ".mjs"):
-            entry_points.extend(self._detect_js_entry_points(rel_path, content, lines))
-        elif suffix == ".go":
-            entry_points.extend(self._detect_go_entry_points(rel_path, content, lines))
-        elif suffix == ".java":
-            entry_points.extend(self._detect_java_entry_points(rel_path, content, lines))
-
-        return entry_points
+        try:
+            if content.find(b"\0", 0, BINARY_SNIFF_BYTES) != -1:
+                logger.debug(f"Skipping {rel_path}: binary content")
+                return []
+            return detector(rel_path, content, _LineIndex(content))
+        finally:
+            if isinstance(content, mmap.mmap):
+                content.close()
 
     def _detect_python_entry_points(
-        self, file_path: str, content: str, lines: list[str]
+        self, file_path: str, content: bytes | mmap.mmap, line_index: _LineIndex
     ) -> list[EntryPoint]:
         """Detect Python entry points (decorators and main blocks)."""
         entry_points: list[EntryPoint] = []
 
-        # Track decorator matches to find the function they decorate
-        for line_num, line in enumerate(lines, 1):
-            stripped = line.strip()
-
-            # Check for decorator patterns
-            for pattern, (ep_type, framework) in self.PYTHON_DECORATOR_PATTERNS.items():
-                match = re.search(pattern, stripped)
-                if match:
-                    # Get the function name from the next non-decorator line
-                    func_name, func_line, docstring = self._find_decorated_function(
-                        lines, line_num - 1
-                    )
-                    if func_name:
-                        # Determine entry point name
-                        if ep_type == "api_endpoint":
-                            # For API endpoints, use the path
-                            if "fastapi" in framework or "flask" in framework:
-                                groups = match.groups()
-                                if len(groups) >= 2:
-                                    method = groups[0].upper()
-                                    path = groups[1]
-                                    name = f"{method} {path}"
-                                else:
-                                    path = groups[0] if groups else func_name
-                                    name = path
-                                    method = None
-                            else:
-                                name = func_name
-                                method = None
-                                path = None
-
-                            entry_points.append(
-                                EntryPoint(
-                                    name=name,
-                                    type=ep_type,
-                                    file=file_path,
-                                    line=func_line,
-                                    description=docstring,
-                                    method=method if "method" in dir() else None,
-                                )
-                            )
+        # Track decorator matches to find the function they decorate. Every
+        # pattern below needs "@" or "__name__", so only those lines are visited.
+        for line_num, line_end, line in _iter_candidate_lines(
+            content, _PY_CANDIDATE_LINE_RE, line_index
+        ):
+            # Check for decorator patterns (one match over the fused alternation)
+            match = self._PYTHON_DECORATOR_RE.match(line)
+            if match:
+                ep_type, _framework, start, count = self._PYTHON_DECORATOR_META[
+                    match.lastgroup or ""
+                ]
+                groups = [_decode(g) for g in match.groups()[start : start + count] if g]
+
+                # Get the function name from the next non-decorator line
+                func_name, func_line, docstring = self._find_decorated_function(
+                    content, line_end, line_num
+                )
+                if func_name:
+                    method: str | None = None
+                    if ep_type == "api_endpoint":
+                        # For API endpoints (FastAPI/Flask), use the method and path
+                        if len(groups) >= 2:
+                            method = groups[0].upper()
+                            name = f"{method} {groups[1]}"
                         else:
-                            # For CLI commands
-                            cmd_name = match.group(1) if match.groups() else func_name
-                            if not cmd_name:
-                                cmd_name = func_name
-                            entry_points.append(
-                                EntryPoint(
-                                    name=cmd_name,
-                                    type=ep_type,
-                                    file=file_path,
-                                    line=func_line,
-                                    description=docstring,
-                                )
-                            )
+                            name = groups[0] if groups else func_name
+                    else:
+                        # For CLI commands, use the explicit name or the function name
+                        name = (groups[0] if groups else None) or func_name
+
+                    entry_points.append(
+                        EntryPoint(
+                            name=name,
+                            type=ep_type,
+                            file=file_path,
+                            line=func_line,
+                            description=docstring,
+                            method=method,
+                        )
+                    )
 
             # Check for if __name__ == "__main__" pattern
-            if "__name__" in stripped and "__main__" in stripped:
+            if _NAME_MAIN_RE.search(line):
                 entry_points.append(
                     EntryPoint(
                         name="__main__",
@@ -242,116 +479,120 @@ class EntryPointDetector:
         return entry_points
 
     def _find_decorated_function(
-        self, lines: list[str], decorator_line_idx: int
+        self, content: bytes | mmap.mmap, decorator_line_end: int, decorator_line_num: int
     ) -> tuple[str | None, int, str | None]:
         """Find the function following a decorator.
 
         Args:
-            lines: All lines in the file
-            decorator_line_idx: Index of the decorator line
+            content: File contents
+            decorator_line_end: Offset of the end of the decorator line
+            decorator_line_num: Line number of the decorator
 
         Returns:
             Tuple of (function_name, line_number, docstring)
         """
         # Look for 'def' or 'async def' after the decorator
-        for i in range(decorator_line_idx + 1, min(decorator_line_idx + 10, len(lines))):
-            line = lines[i].strip()
+        for distance, line_end, raw_line in _following_lines(content, decorator_line_end, 9):
+            line = raw_line.strip()
 
             # Skip other decorators
-            if line.startswith("@"):
+            if line.startswith(b"@"):
                 continue
 
             # Check for function definition
-            match = re.match(r"(?:async\s+)?def\s+(\w+)\s*\(", line)
+            match = _DEF_RE.match(line)
             if match:
-                func_name = match.group(1)
-                line_num = i + 1
+                func_name = _decode(match.group(1))
 
                 # Try to extract docstring
-                docstring = self._extract_python_docstring(lines, i)
-                return func_name, line_num, docstring
+                docstring = self._extract_python_docstring(content, line_end)
+                return func_name, decorator_line_num + distance, docstring
 
         return None, 0, None
 
-    def _extract_python_docstring(self, lines: list[str], func_line_idx: int) -> str | None:
+    def _extract_python_docstring(
+        self, content: bytes | mmap.mmap, func_line_end: int
+    ) -> str | None:
         """Extract docstring from a Python function.
 
         Args:
-            lines: All lines in the file
-            func_line_idx: Index of the function definition line
+            content: File contents
+            func_line_end: Offset of the end of the function definition line
 
         Returns:
             Docstring content or None
         """
         # Look for docstring in the lines following the function definition
-        for i in range(func_line_idx + 1, min(func_line_idx + 5, len(lines))):
-            line = lines[i].strip()
-            if line.startswith('"""') or line.startswith("'''"):
+        for _distance, _line_end, raw_line in _following_lines(content, func_line_end, 4):
+            line = raw_line.strip()
+            if line.startswith((b'"""', b"'''")):
                 # Single-line docstring
-                if line.count('"""') >= 2 or line.count("'''") >= 2:
-                    return line.strip('"\'').strip()
+                if line.count(b'"""') >= 2 or line.count(b"'''") >= 2:
+                    return _decode(line.strip(b'"\'').strip())
                 # Multi-line docstring - just get first line
-                return line.strip('"\'').strip()
-            elif line and not line.startswith("#"):
+                return _decode(line.strip(b'"\'').strip())
+            elif line and not line.startswith(b"#"):
                 # Non-empty, non-comment line before docstring
                 break
         return None
 
     def _detect_js_entry_points(
-        self, file_path: str, content: str, lines: list[str]
+        self, file_path: str, content: bytes | mmap.mmap, line_index: _LineIndex
     ) -> list[EntryPoint]:
         """Detect JavaScript/TypeScript entry points."""
         entry_points: list[EntryPoint] = []
 
-        for line_num, line in enumerate(lines, 1):
-            for pattern, (ep_type, framework) in self.JS_PATTERNS.items():
-                match = re.search(pattern, line)
-                if match:
-                    groups = match.groups()
-                    if len(groups) >= 2:
-                        method = groups[0].upper()
-                        path = groups[1]
-                        name = f"{method} {path}"
-                    else:
-                        name = groups[0] if groups else "unknown"
-                        method = None
+        # Route patterns need an "app." or "router." receiver
+        for line_num, _line_end, line in _iter_candidate_lines(
+            content, _JS_CANDIDATE_LINE_RE, line_index
+        ):
+            match = self._JS_RE.search(line)
+            if match:
+                ep_type, _framework, start, count = self._JS_META[match.lastgroup or ""]
+                groups = [_decode(g) for g in match.groups()[start : start + count] if g]
+                if len(groups) >= 2:
+                    method: str | None = groups[0].upper()
+                    name = f"{method} {groups[1]}"
+                else:
+                    name = groups[0] if groups else "unknown"
+                    method = None
 
-                    entry_points.append(
-                        EntryPoint(
-                            name=name,
-                            type=ep_type,
-                            file=file_path,
-                            line=line_num,
-                            method=method,
-                        )
+                entry_points.append(
+                    EntryPoint(
+                        name=name,
+                        type=ep_type,
+                        file=file_path,
+                        line=line_num,
+                        method=method,
                     )
+                )
 
         # Check for exports.handler (Lambda)
-        if "exports.handler" in content or "export const handler" in content:
-            for line_num, line in enumerate(lines, 1):
-                if "exports.handler" in line or "export const handler" in line:
-                    entry_points.append(
-                        EntryPoint(
-                            name="handler",
-                            type="handler",
-                            file=file_path,
-                            line=line_num,
-                            description="Lambda/Cloud function handler",
-                        )
-                    )
-                    break
+        handler_match = _JS_HANDLER_RE.search(content)
+        if handler_match:
+            entry_points.append(
+                EntryPoint(
+                    name="handler",
+                    type="handler",
+                    file=file_path,
+                    line=line_index.line_at(handler_match.start()),
+                    description="Lambda/Cloud function handler",
+                )
+            )
 
         return entry_points
 
     def _detect_go_entry_points(
-        self, file_path: str, content: str, lines: list[str]
+        self, file_path: str, content: bytes | mmap.mmap, line_index: _LineIndex
     ) -> list[EntryPoint]:
         """Detect Go entry points."""
         entry_points: list[EntryPoint] = []
 
-        for line_num, line in enumerate(lines, 1):
+        for line_num, _line_end, line in _iter_candidate_lines(
+            content, _GO_CANDIDATE_LINE_RE, line_index
+        ):
             # Check for main function
-            if re.match(r"\s*func\s+main\s*\(\s*\)", line):
+            if _GO_FUNC_MAIN_RE.match(line):
                 entry_points.append(
                     EntryPoint(
                         name="main",
@@ -362,11 +603,9 @@ class EntryPointDetector:
                 )
 
             # Check for HTTP handlers (common patterns)
-            handler_match = re.search(
-                r'http\.HandleFunc\s*\(\s*["\']([^"\']+)["\']', line
-            )
+            handler_match = _HTTP_HANDLEFUNC_RE.search(line)
             if handler_match:
-                path = handler_match.group(1)
+                path = _decode(handler_match.group(1))
                 entry_points.append(
                     EntryPoint(
                         name=path,
@@ -379,14 +618,16 @@ class EntryPointDetector:
         return entry_points
 
     def _detect_java_entry_points(
-        self, file_path: str, content: str, lines: list[str]
+        self, file_path: str, content: bytes | mmap.mmap, line_index: _LineIndex
     ) -> list[EntryPoint]:
         """Detect Java entry points."""
         entry_points: list[EntryPoint] = []
 
-        for line_num, line in enumerate(lines, 1):
+        for line_num, _line_end, line in _iter_candidate_lines(
+            content, _JAVA_CANDIDATE_LINE_RE, line_index
+        ):
             # Check for main method
-            if "public static void main" in line:
+            if b"public static void main" in line:
                 entry_points.append(
                     EntryPoint(
                         name="main",
@@ -397,22 +638,11 @@ class EntryPointDetector:
                 )
 
             # Check for Spring endpoints
-            spring_match = re.search(
-                r'@(GetMapping|PostMapping|PutMapping|DeleteMapping|RequestMapping)\s*\(\s*["\']?([^"\')\s]*)',
-                line,
-            )
+            spring_match = _SPRING_MAPPING_RE.search(line)
             if spring_match:
-                mapping_type = spring_match.group(1)
-                path = spring_match.group(2) or "/"
-
-                method_map = {
-                    "GetMapping": "GET",
-                    "PostMapping": "POST",
-                    "PutMapping": "PUT",
-                    "DeleteMapping": "DELETE",
-                    "RequestMapping": None,
-                }
-                method = method_map.get(mapping_type)
+                mapping_type = _decode(spring_match.group(1))
+                path = _decode(spring_match.group(2)) or "/"
+                method = SPRING_MAPPING_METHODS.get(mapping_type)
 
                 entry_points.append(
                     EntryPoint(
@@ -427,8 +657,71 @@ class EntryPointDetector:
         return entry_points
 
 
+def find_source_files(repo_path: Path) -> list[Path]:
+    """Find all source files in a repository.
+
+    Walks the tree once with os.scandir, pruning SKIP_DIRS at the directory
+    boundary so excluded trees (node_modules, .venv, ...) are never entered.
+    The result can be shared by other analyzers that need the same listing.
+
+    Args:
+        repo_path: Path to repository root
+
+    Returns:
+        List of source file paths
+    """
+    files: list[Path] = []
+    pending = [os.fspath(repo_path)]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in SKIP_DIRS:
+                        pending.append(entry.path)
+                elif entry.name.endswith(SOURCE_EXTENSIONS):
+                    files.append(Path(entry.path))
+
+    return files
+
+
+@cache
+def _worker_detector(repo_path: Path) -> EntryPointDetector:
+    """Get the detector a worker process scans with, building it once per process.
+
+    Args:
+        repo_path: Path to repository root
+
+    Returns:
+        Detector for the repository
+    """
+    return EntryPointDetector(repo_path)
+
+
+def _scan_file(repo_path: Path, file_path: Path) -> tuple[list[EntryPoint], str | None]:
+    """Detect entry points in one file.
+
+    Module-level so it can be pickled and run in a worker process; in-process
+    scans call the detector's _scan_one directly.
+
+    Args:
+        repo_path: Path to repository root
+        file_path: Path to source file
+
+    Returns:
+        Tuple of (entry points, error message or None)
+    """
+    return _worker_detector(repo_path)._scan_one(file_path)
+
+
 def detect_entry_points(
-    repo_path: Path, file_paths: list[Path] | None = None
+    repo_path: Path,
+    file_paths: list[Path] | None = None,
+    cache_path: Path | None = None,
+    complete: bool = False,
 ) -> list[EntryPoint]:
     """Detect entry points in a repository.
 
@@ -437,9 +730,11 @@ def detect_entry_points(
     Args:
         repo_path: Path to repository root
         file_paths: Optional specific files to scan
+        cache_path: Optional JSON file persisting scan results between runs
+        complete: Whether file_paths lists every source file of the repository
 
     Returns:
         List of detected entry points
     """
-    detector = EntryPointDetector(repo_path)
-    return detector.detect_entry_points(file_paths)
+    detector = EntryPointDetector(repo_path, cache_path)
+    return detector.detect_entry_points(file_paths, complete)
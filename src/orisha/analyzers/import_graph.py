@@ -4,14 +4,50 @@ Extracts import relationships between modules to generate system flow diagrams.
 """
 
 import logging
+import os
 import re
+import sys
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from pathlib import Path
 
+from orisha.analyzers.entry_points import SOURCE_EXTENSIONS, find_source_files
 from orisha.models.canonical.ast import CanonicalAST, CanonicalModule
 from orisha.models.canonical.module import ImportGraph
 
 logger = logging.getLogger(__name__)
 
+# Precompiled import statement patterns
+_PY_FROM_RE = re.compile(r"from\s+([\w.]+)\s+import")
+_PY_IMPORT_RE = re.compile(r"import\s+([\w.]+)")
+_JS_ES6_RE = re.compile(r"from\s+['\"]([^'\"]+)['\"]")
+_JS_REQUIRE_RE = re.compile(r"require\s*\(\s*['\"]([^'\"]+)['\"]\s*\)")
+_QUOTED_RE = re.compile(r'"([^"]+)"')
+_JAVA_IMPORT_RE = re.compile(r"import\s+(?:static\s+)?([\w.]+);?")
+
+# Graphs with more modules than this parse imports on a thread pool when the
+# interpreter runs without the GIL; with the GIL, regex matching cannot overlap
+PARALLEL_MODULES_MIN = 256
+
+# Top-level source directories stripped from module paths; each is one path segment
+SKIP_PREFIXES: tuple[str, ...] = ("src/", "lib/", "pkg/", "app/", "internal/")
+
+
+def _iter_parent_packages(name: str) -> Iterator[str]:
+    """Yield the parent packages of a slash-separated module name, outermost first.
+
+    Args:
+        name: Module name (e.g., 'orisha/analyzers/import_graph')
+
+    Yields:
+        Parent package names (e.g., 'orisha', 'orisha/analyzers')
+    """
+    end = name.find("/")
+    while end != -1:
+        yield name[:end]
+        end = name.find("/", end + 1)
+
 
 class ImportGraphBuilder:
     """Builds a directed graph of module import relationships.
@@ -27,98 +63,143 @@ class ImportGraphBuilder:
             repo_path: Path to repository root for resolving relative imports
         """
         self.repo_path = repo_path
+        # Repository root with a trailing separator, for prefix checks on paths
+        self._repo_prefix = os.path.join(str(repo_path), "")
         self._internal_modules: set[str] = set()
+        # Normalization results by input; the same paths and imports recur
+        # across modules, so each distinct value is only normalized once
+        self._module_name_cache: dict[str, str | None] = {}
+        self._imported_module_cache: dict[str, str | None] = {}
+        # Import statement parser by language
+        self._import_parsers: dict[str, Callable[[str], list[str]]] = {
+            "python": self._parse_python_import,
+            "javascript": self._parse_js_import,
+            "typescript": self._parse_js_import,
+            "go": self._parse_go_import,
+            "java": self._parse_java_import,
+        }
 
     def build_import_graph(
         self,
         ast_result: CanonicalAST,
         detected_modules: list[CanonicalModule] | None = None,
+        source_files: list[Path] | None = None,
     ) -> ImportGraph:
         """Build an import graph from AST analysis.
 
         Args:
             ast_result: Parsed AST containing modules with imports
             detected_modules: Optional list of detected modules to use for filtering
+            source_files: Optional source file listing of the repository (see
+                find_source_files); walked from repo_path if not given
 
         Returns:
             ImportGraph with nodes and edges representing module dependencies
         """
         # Identify internal modules
         self._internal_modules = self._identify_internal_modules(
-            ast_result, detected_modules
+            ast_result, detected_modules, source_files
         )
 
         nodes: set[str] = set()
-        edges: list[tuple[str, str]] = []
+        # Edges are deduplicated as they are added
+        edges: set[tuple[str, str]] = set()
+
+        # Modules are independent and the internal module set is only read from
+        # here on, so they can be processed concurrently where threads run in parallel
+        gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+        if not gil_enabled and len(ast_result.modules) > PARALLEL_MODULES_MIN:
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                results = list(executor.map(self._module_edges, ast_result.modules))
+        else:
+            results = [self._module_edges(module) for module in ast_result.modules]
+
+        for module_name, module_edges in results:
+            if module_name:
+                nodes.add(module_name)
+                nodes.update(imported for _, imported in module_edges)
+                edges.update(module_edges)
 
-        # Process each module's imports
-        for module in ast_result.modules:
-            module_name = self._normalize_module_name(module.path)
-            if not module_name:
-                continue
+        logger.info(f"Built import graph with {len(nodes)} nodes and {len(edges)} edges")
 
-            nodes.add(module_name)
+        return ImportGraph(nodes=sorted(nodes), edges=list(edges))
 
-            # Parse and filter imports
-            for import_stmt in module.imports:
-                imported_modules = self._parse_import_statement(
-                    import_stmt, module.language
-                )
+    def _module_edges(
+        self, module: CanonicalModule
+    ) -> tuple[str | None, list[tuple[str, str]]]:
+        """Resolve one module's imports to edges between internal modules.
 
-                for imported in imported_modules:
-                    # Filter to internal modules only
-                    normalized = self._normalize_imported_module(imported)
-                    if normalized and normalized in self._internal_modules:
-                        nodes.add(normalized)
-                        edges.append((module_name, normalized))
+        Args:
+            module: Module from the AST result
 
-        # Remove duplicate edges
-        edges = list(set(edges))
+        Returns:
+            Tuple of (normalized module name or None, import edges)
+        """
+        module_name = self._normalize_module_name(module.path)
+        if not module_name:
+            return None, []
 
-        logger.info(f"Built import graph with {len(nodes)} nodes and {len(edges)} edges")
+        internal = self._internal_modules
+        module_edges: list[tuple[str, str]] = []
+
+        # Parse and filter imports
+        for import_stmt in module.imports:
+            for imported in self._parse_import_statement(import_stmt, module.language):
+                # Filter to internal modules only
+                normalized = self._normalize_imported_module(imported)
+                if normalized and normalized in internal:
+                    module_edges.append((module_name, normalized))
 
-        return ImportGraph(nodes=sorted(nodes), edges=edges)
+        return module_name, module_edges
 
     def _identify_internal_modules(
         self,
         ast_result: CanonicalAST,
         detected_modules: list[CanonicalModule] | None = None,
+        source_files: list[Path] | None = None,
     ) -> set[str]:
         """Identify which modules are internal to the repository.
 
+        Python packages are discovered from the same listing as the other
+        analyzers, so packages under SKIP_DIRS (tests, test, spec, specs,
+        build, dist, .venv, venv, node_modules) are not counted as internal.
+        Modules from the AST or from detected_modules are internal wherever
+        they live.
+
         Args:
             ast_result: Parsed AST
             detected_modules: Optional detected modules list
+            source_files: Optional source file listing of the repository
 
         Returns:
             Set of internal module names
         """
-        internal: set[str] = set()
-
-        # Add all modules from AST
-        for module in ast_result.modules:
-            name = self._normalize_module_name(module.path)
-            if name:
-                internal.add(name)
-                # Also add parent packages
-                parts = name.split("/")
-                for i in range(1, len(parts)):
-                    internal.add("/".join(parts[:i]))
+        # Add all modules from AST, plus their parent packages
+        names = [
+            name
+            for module in ast_result.modules
+            if (name := self._normalize_module_name(module.path))
+        ]
+        internal: set[str] = set(names)
+        internal.update(chain.from_iterable(map(_iter_parent_packages, names)))
 
         # Add detected modules if provided
         if detected_modules:
-            for module in detected_modules:
-                internal.add(module.name)
-                internal.add(module.path)
-
-        # Also scan for Python package names
-        if self.repo_path.exists():
-            for init_file in self.repo_path.rglob("__init__.py"):
-                rel_path = init_file.parent.relative_to(self.repo_path)
-                pkg_name = str(rel_path).replace("/", ".").replace("\\", ".")
-                internal.add(pkg_name)
-                # Add dotted form
-                internal.add(str(rel_path).replace("\\", "/"))
+            internal.update(module.name for module in detected_modules)
+            internal.update(module.path for module in detected_modules)
+
+        # Also add Python package names, taken from the source file listing
+        # (which prunes SKIP_DIRS, including test and build trees)
+        if source_files is None:
+            source_files = find_source_files(self.repo_path)
+        package_dirs = [
+            str(init_file.parent.relative_to(self.repo_path)).replace("\\", "/")
+            for init_file in source_files
+            if init_file.name == "__init__.py"
+        ]
+        # Add dotted and slash-separated forms
+        internal.update(package_dirs)
+        internal.update(package_dir.replace("/", ".") for package_dir in package_dirs)
 
         return internal
 
@@ -131,37 +212,48 @@ class ImportGraphBuilder:
         Returns:
             Normalized module name (e.g., 'orisha/cli') or None
         """
+        if path in self._module_name_cache:
+            return self._module_name_cache[path]
+        name = self._resolve_module_name(path)
+        self._module_name_cache[path] = name
+        return name
+
+    def _resolve_module_name(self, path: str) -> str | None:
+        """Compute the module name for a file path (uncached).
+
+        Args:
+            path: File path
+
+        Returns:
+            Normalized module name or None
+        """
         if not path:
             return None
 
         # Handle absolute paths by making them relative to repo_path
-        path_obj = Path(path)
-        if path_obj.is_absolute():
-            try:
-                path = str(path_obj.relative_to(self.repo_path))
-            except ValueError:
+        # (plain string operations; this runs for every module and import)
+        if os.path.isabs(path):
+            if not path.startswith(self._repo_prefix):
                 # Path is not relative to repo_path, skip it
                 return None
+            path = path[len(self._repo_prefix) :]
 
         # Remove leading ./ if present
         if path.startswith("./"):
             path = path[2:]
 
-        # Remove file extension
-        path_obj = Path(path)
-        if path_obj.suffix in (".py", ".js", ".ts", ".tsx", ".go", ".java"):
-            path = str(path_obj.with_suffix(""))
+        # Remove file extension (a leading dot names a hidden file, not a suffix)
+        dot = path.rfind(".")
+        if dot > path.rfind("/") + 1 and path[dot:] in SOURCE_EXTENSIONS:
+            path = path[:dot]
 
         # Remove __init__ suffix for Python packages
         if path.endswith("/__init__"):
             path = path[:-9]
 
-        # Skip common prefixes
-        skip_prefixes = ("src/", "lib/", "pkg/", "app/", "internal/")
-        for prefix in skip_prefixes:
-            if path.startswith(prefix):
-                path = path[len(prefix) :]
-                break
+        # Skip common prefixes (a single segment, so it ends at the first "/")
+        if path.startswith(SKIP_PREFIXES):
+            path = path[path.index("/") + 1 :]
 
         return path if path else None
 
@@ -177,15 +269,8 @@ class ImportGraphBuilder:
         Returns:
             List of imported module names
         """
-        if language == "python":
-            return self._parse_python_import(import_stmt)
-        elif language in ("javascript", "typescript"):
-            return self._parse_js_import(import_stmt)
-        elif language == "go":
-            return self._parse_go_import(import_stmt)
-        elif language == "java":
-            return self._parse_java_import(import_stmt)
-        return []
+        parser = self._import_parsers.get(language)
+        return parser(import_stmt) if parser else []
 
     def _parse_python_import(self, import_stmt: str) -> list[str]:
         """Parse Python import statements.
@@ -202,7 +287,7 @@ class ImportGraphBuilder:
         import_stmt = import_stmt.strip()
 
         # "from X import Y" pattern
-        from_match = re.match(r"from\s+([\w.]+)\s+import", import_stmt)
+        from_match = _PY_FROM_RE.match(import_stmt)
         if from_match:
             module = from_match.group(1)
             # Skip relative imports starting with .
@@ -211,7 +296,7 @@ class ImportGraphBuilder:
             return modules
 
         # "import X" pattern
-        import_match = re.match(r"import\s+([\w.]+)", import_stmt)
+        import_match = _PY_IMPORT_RE.match(import_stmt)
         if import_match:
             module = import_match.group(1)
             modules.append(module.replace(".", "/"))
@@ -231,7 +316,7 @@ class ImportGraphBuilder:
         import_stmt = import_stmt.strip()
 
         # ES6 import pattern
-        es6_match = re.search(r"from\s+['\"]([^'\"]+)['\"]", import_stmt)
+        es6_match = _JS_ES6_RE.search(import_stmt)
         if es6_match:
             module = es6_match.group(1)
             # Only include relative imports (starting with . or ..)
@@ -241,7 +326,7 @@ class ImportGraphBuilder:
             return modules
 
         # CommonJS require pattern
-        require_match = re.search(r"require\s*\(\s*['\"]([^'\"]+)['\"]\s*\)", import_stmt)
+        require_match = _JS_REQUIRE_RE.search(import_stmt)
         if require_match:
             module = require_match.group(1)
             if module.startswith("."):
@@ -263,7 +348,7 @@ class ImportGraphBuilder:
         modules: list[str] = []
 
         # Find all quoted strings in import
-        matches = re.findall(r'"([^"]+)"', import_stmt)
+        matches = _QUOTED_RE.findall(import_stmt)
         for module in matches:
             # Only include if it looks like a local import (doesn't contain domain)
             if "." not in module.split("/")[0]:
@@ -282,7 +367,7 @@ class ImportGraphBuilder:
         import_stmt = import_stmt.strip()
 
         # Match import statement
-        match = re.match(r"import\s+(?:static\s+)?([\w.]+);?", import_stmt)
+        match = _JAVA_IMPORT_RE.match(import_stmt)
         if match:
             # Get the package (everything before the last dot, which is the class)
             full_path = match.group(1)
@@ -296,6 +381,21 @@ class ImportGraphBuilder:
     def _normalize_imported_module(self, imported: str) -> str | None:
         """Normalize an imported module name for comparison.
 
+        Args:
+            imported: Imported module name
+
+        Returns:
+            Normalized name or None if should be filtered out
+        """
+        if imported in self._imported_module_cache:
+            return self._imported_module_cache[imported]
+        normalized = self._resolve_imported_module(imported)
+        self._imported_module_cache[imported] = normalized
+        return normalized
+
+    def _resolve_imported_module(self, imported: str) -> str | None:
+        """Compute the normalized name of an imported module (uncached).
+
         Args:
             imported: Imported module name
 
@@ -322,6 +422,7 @@ def build_import_graph(
     repo_path: Path,
     ast_result: CanonicalAST,
     detected_modules: list[CanonicalModule] | None = None,
+    source_files: list[Path] | None = None,
 ) -> ImportGraph:
     """Build an import graph from AST analysis.
 
@@ -331,9 +432,10 @@ def build_import_graph(
         repo_path: Path to repository root
         ast_result: Parsed AST containing modules with imports
         detected_modules: Optional list of detected modules
+        source_files: Optional source file listing of the repository
 
     Returns:
         ImportGraph with module dependencies
     """
     builder = ImportGraphBuilder(repo_path)
-    return builder.build_import_graph(ast_result, detected_modules)
+    return builder.build_import_graph(ast_result, detected_modules, source_files)
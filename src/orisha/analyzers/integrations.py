@@ -6,17 +6,135 @@ Detects calls to external services:
 - Message queues (boto3 SQS, Kafka, RabbitMQ)
 - Caches (Redis, Memcached)
 - Cloud storage (S3, GCS)
+
+Detection is substring and regex matching over raw file bytes; there is no
+numeric kernel, so JIT compilers such as Numba have nothing to speed up. The
+work is kept in C by prescanning for import literals and fusing each library's
+call patterns into one compiled regex, and spread over cores with a process pool.
 """
 
 import logging
+import math
+import mmap
+import os
 import re
-from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache
+from itertools import groupby, repeat
+from operator import itemgetter
 from pathlib import Path
 
+from orisha.analyzers.entry_points import (
+    BINARY_SNIFF_BYTES,
+    MMAP_MIN_BYTES,
+    PARALLEL_SCAN_MIN_FILES,
+    find_source_files,
+)
+from orisha.analyzers.scan_cache import ScanCache
 from orisha.models.canonical.module import ExternalIntegration
 
 logger = logging.getLogger(__name__)
 
+# Import statement prefix by language; the library's import pattern follows it
+_IMPORT_PREFIXES: dict[str, bytes] = {
+    # "import X" or "from X import"
+    "python": rb"(?:import|from)\s+",
+    # "require('X')" or "import ... from 'X'"
+    "javascript": rb'(?:require\s*\(["\']|from\s+["\'])',
+    # import "X"
+    "go": rb'import\s+.*["\'].*',
+}
+
+# Language of each scanned source file suffix
+_LANGUAGE_BY_SUFFIX: dict[str, str] = {
+    ".py": "python",
+    ".js": "javascript",
+    ".mjs": "javascript",
+    ".ts": "javascript",
+    ".tsx": "javascript",
+    ".go": "go",
+    ".java": "java",
+}
+
+# Cache file name used for persisted scan results under a repository's .orisha dir
+INTEGRATION_CACHE_FILE = "integrations_cache.json"
+
+# Bumped whenever INTEGRATION_PATTERNS change, invalidating persisted scan results
+INTEGRATION_CACHE_VERSION = 1
+
+# Files handed to a worker per task, to amortize inter-process overhead
+_PARALLEL_CHUNKSIZE = 32
+
+# Compiled form of an INTEGRATION_PATTERNS entry: (integration type, literals
+# the import must contain, import regex or None, fused call regex, service name,
+# library name)
+_CompiledIntegration = tuple[
+    str, tuple[bytes, ...], re.Pattern[bytes] | None, re.Pattern[bytes], str, str
+]
+
+
+def _import_literals(import_pattern: str) -> tuple[bytes, ...]:
+    """Get the literal substrings any import matching a library pattern contains.
+
+    Only "*" is a wildcard in import patterns, so the pieces between wildcards
+    must all occur in a file whose import check passes.
+
+    Args:
+        import_pattern: Library pattern (e.g., "boto3.*sqs")
+
+    Returns:
+        Literal byte strings (e.g., (b"boto3.", b"sqs"))
+    """
+    return tuple(piece.encode() for piece in import_pattern.split("*") if piece)
+
+
+def _compile_import_pattern(import_pattern: str, language: str) -> re.Pattern[bytes] | None:
+    """Compile the import check for a library in a language.
+
+    Args:
+        import_pattern: Library pattern ("." is literal, "*" matches anything)
+        language: Programming language
+
+    Returns:
+        Compiled bytes regex, or None if imports of the language are not recognized
+    """
+    prefix = _IMPORT_PREFIXES.get(language)
+    if prefix is None:
+        return None
+    return re.compile(prefix + import_pattern.replace(".", r"\.").replace("*", r".*").encode())
+
+
+def _compile_integration_patterns(
+    patterns: dict[str, dict[str, list[tuple[str, list[str], str]]]],
+) -> dict[str, list[_CompiledIntegration]]:
+    """Compile INTEGRATION_PATTERNS once into a per-language dispatch table.
+
+    Args:
+        patterns: Integration patterns by type and language
+
+    Returns:
+        Compiled entries of every integration type by language, with each
+        entry's call patterns fused into one bytes alternation so a file is
+        scanned once per library, without decoding it
+    """
+    by_language: dict[str, list[_CompiledIntegration]] = {}
+    for int_type, lang_patterns in patterns.items():
+        for language, entries in lang_patterns.items():
+            by_language.setdefault(language, []).extend(
+                (
+                    int_type,
+                    _import_literals(import_pattern),
+                    _compile_import_pattern(import_pattern, language),
+                    re.compile(
+                        "|".join(f"(?:{call_pattern})" for call_pattern in call_patterns).encode()
+                    ),
+                    service_name,
+                    import_pattern.split(".")[0],
+                )
+                for import_pattern, call_patterns, service_name in entries
+            )
+    return by_language
+
 
 class IntegrationDetector:
     """Detects external service integrations in a codebase.
@@ -27,7 +145,7 @@ class IntegrationDetector:
 
     # Integration patterns by type and language
     # Format: (import_pattern, call_patterns, service_name)
-    INTEGRATION_PATTERNS = {
+    INTEGRATION_PATTERNS: dict[str, dict[str, list[tuple[str, list[str], str]]]] = {
         "http": {
             "python": [
                 ("requests", [r"requests\.(get|post|put|delete|patch|head)"], "requests"),
@@ -160,46 +278,133 @@ class IntegrationDetector:
         },
     }
 
-    def __init__(self, repo_path: Path) -> None:
+    # INTEGRATION_PATTERNS compiled once at class load, by language
+    _PATTERNS_BY_LANGUAGE = _compile_integration_patterns(INTEGRATION_PATTERNS)
+
+    # Distinct import literals by language. Libraries share literals (e.g.,
+    # "boto3." for SQS, S3 and Bedrock), so each is searched for once per file.
+    _LITERALS_BY_LANGUAGE = {
+        language: tuple(dict.fromkeys(literal for entry in entries for literal in entry[1]))
+        for language, entries in _PATTERNS_BY_LANGUAGE.items()
+    }
+
+    # Suffixes of files whose language has integration patterns to check
+    _SCANNED_SUFFIXES = frozenset(
+        suffix
+        for language in _PATTERNS_BY_LANGUAGE
+        for suffix, suffix_language in _LANGUAGE_BY_SUFFIX.items()
+        if suffix_language == language
+    )
+
+    def __init__(self, repo_path: Path, cache_path: Path | None = None) -> None:
         """Initialize the integration detector.
 
         Args:
             repo_path: Path to repository root
+            cache_path: Optional JSON file persisting scan results between runs.
+                Files whose mtime and size are unchanged are not rescanned.
         """
         self.repo_path = repo_path
+        self.cache_path = cache_path
+        self._scan_cache: ScanCache[list[tuple[str, str, str]]] | None = None
+        if cache_path is not None:
+            self._scan_cache = ScanCache(
+                cache_path,
+                INTEGRATION_CACHE_VERSION,
+                encode=list,
+                decode=lambda data: [(name, int_type, lib) for name, int_type, lib in data],
+                description="integration",
+            )
 
     def detect_external_integrations(
-        self, file_paths: list[Path] | None = None
+        self, file_paths: list[Path] | None = None, complete: bool = False
     ) -> list[ExternalIntegration]:
         """Detect external integrations in the repository.
 
         Args:
             file_paths: Optional specific files to scan
+            complete: Whether file_paths lists every source file of the repository
+                (as find_source_files does), so cached files not in it can be dropped
 
         Returns:
             List of detected external integrations
         """
-        # Track integrations by (name, type, library)
-        integrations: dict[tuple[str, str, str], set[str]] = defaultdict(set)
-
+        full_scan = complete or file_paths is None
         if file_paths is None:
             file_paths = self._find_source_files()
 
-        for file_path in file_paths:
-            try:
-                self._detect_in_file(file_path, integrations)
-            except Exception as e:
-                logger.warning(f"Failed to detect integrations in {file_path}: {e}")
+        # Files of other languages can never match, so they are dropped before
+        # any stat, cache lookup or hand-off to a worker process
+        file_paths = [
+            file_path
+            for file_path in file_paths
+            if file_path.suffix.lower() in self._SCANNED_SUFFIXES
+        ]
+
+        # Integration keys found per file
+        found: dict[Path, list[tuple[str, str, str]]] = {}
+
+        # Reuse cached results for unchanged files; only the rest are scanned
+        stats: dict[Path, tuple[str, int, int]] = {}
+        to_scan = file_paths
+        if self._scan_cache is not None:
+            to_scan = self._scan_cache.split(self.repo_path, file_paths, stats, found)
+
+        # Files are scanned independently, so large scans run in worker
+        # processes to spread the regex work over every core
+        if len(to_scan) > PARALLEL_SCAN_MIN_FILES:
+            # No more workers than there are chunks to hand out
+            workers = min(os.cpu_count() or 1, math.ceil(len(to_scan) / _PARALLEL_CHUNKSIZE))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(
+                    executor.map(
+                        _scan_file,
+                        repeat(self.repo_path),
+                        to_scan,
+                        chunksize=_PARALLEL_CHUNKSIZE,
+                    )
+                )
+        else:
+            results = [self._scan_one(file_path) for file_path in to_scan]
+
+        for file_path, (keys, error) in zip(to_scan, results, strict=True):
+            if error is not None:
+                logger.warning(f"Failed to detect integrations in {file_path}: {error}")
+                continue
+            found[file_path] = keys
+
+        # Collect flat ((name, type, library), rel_path) pairs, then group
+        # them in one sorted pass instead of growing a set per integration
+        pairs: list[tuple[tuple[str, str, str], str]] = []
+        for file_path, keys in found.items():
+            # Most files use no integration, so only hits need a relative path
+            if keys:
+                try:
+                    rel_path = str(file_path.relative_to(self.repo_path))
+                except ValueError as e:
+                    logger.warning(f"Failed to detect integrations in {file_path}: {e}")
+                    continue
+                pairs.extend((key, rel_path) for key in keys)
+        pairs.sort()
+
+        if self._scan_cache is not None:
+            # A full scan rebuilds the cache, dropping files that no longer exist
+            self._scan_cache.update(stats, found, complete=full_scan)
 
         # Convert to ExternalIntegration objects
         result: list[ExternalIntegration] = []
-        for (name, int_type, library), locations in integrations.items():
+        for (name, int_type, library), group in groupby(pairs, key=itemgetter(0)):
+            # Pairs are sorted, so locations already are; most integrations have
+            # a single location, which needs no duplicate check
+            locations = [rel_path for _, rel_path in group]
+            if len(locations) > 1:
+                locations = list(dict.fromkeys(locations))
             result.append(
                 ExternalIntegration(
                     name=name,
                     type=int_type,
                     library=library,
-                    locations=sorted(locations),
+                    locations=locations,
                 )
             )
 
@@ -207,117 +412,140 @@ class IntegrationDetector:
         return result
 
     def _find_source_files(self) -> list[Path]:
-        """Find all source files in the repository."""
-        extensions = [".py", ".js", ".ts", ".tsx", ".go", ".java"]
-        skip_dirs = {
-            ".git",
-            ".venv",
-            "venv",
-            "node_modules",
-            "__pycache__",
-            "dist",
-            "build",
-            "tests",
-            "test",
-            "spec",
-            "specs",
-        }
-
-        files: list[Path] = []
-        for ext in extensions:
-            for file_path in self.repo_path.rglob(f"*{ext}"):
-                if any(skip_dir in file_path.parts for skip_dir in skip_dirs):
-                    continue
-                files.append(file_path)
+        """Find all source files in the repository.
 
-        return files
+        Uses the same single pruned walk as entry point detection, which scans
+        the same extensions and skips the same directories.
+        """
+        return find_source_files(self.repo_path)
 
-    def _detect_in_file(
-        self,
-        file_path: Path,
-        integrations: dict[tuple[str, str, str], set[str]],
-    ) -> None:
-        """Detect integrations in a single file.
+    def _scan_one(self, file_path: Path) -> tuple[list[tuple[str, str, str]], str | None]:
+        """Detect integrations in one file, capturing any error instead of raising.
 
         Args:
             file_path: Path to source file
-            integrations: Dictionary to accumulate results
-        """
-        rel_path = str(file_path.relative_to(self.repo_path))
 
+        Returns:
+            Tuple of (integration keys, error message or None)
+        """
         try:
-            content = file_path.read_text(encoding="utf-8")
-        except (UnicodeDecodeError, PermissionError):
-            return
+            return self._detect_in_file(file_path), None
+        except Exception as e:
+            return [], str(e)
 
-        suffix = file_path.suffix.lower()
-        language = self._get_language(suffix)
+    def _detect_in_file(self, file_path: Path) -> list[tuple[str, str, str]]:
+        """Detect integrations in a single file.
 
-        if not language:
-            return
+        Args:
+            file_path: Path to source file
 
-        # Check each integration type
-        for int_type, lang_patterns in self.INTEGRATION_PATTERNS.items():
-            if language not in lang_patterns:
-                continue
+        Returns:
+            (name, type, library) keys of the integrations used in the file
+        """
+        found: list[tuple[str, str, str]] = []
+
+        language = self._get_language(file_path.suffix.lower())
+        if language is None:
+            return found
+        entries = self._PATTERNS_BY_LANGUAGE.get(language)
+        if not entries:
+            return found
+
+        try:
+            with open(file_path, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                if size == 0:
+                    return found
+                # Large files are scanned through the page cache without copying
+                content: bytes | mmap.mmap = (
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    if size >= MMAP_MIN_BYTES
+                    else f.read()
+                )
+        except PermissionError:
+            return found
 
-            for import_pattern, call_patterns, service_name in lang_patterns[language]:
-                # Check if library is imported/used
-                if not self._check_import(content, import_pattern, language):
+        try:
+            if content.find(b"\0", 0, BINARY_SNIFF_BYTES) != -1:
+                return found
+
+            # Cheap substring prescan, one search per distinct literal: only
+            # libraries whose import literals all occur in the file can pass
+            # the import check
+            present = {
+                literal
+                for literal in self._LITERALS_BY_LANGUAGE[language]
+                if content.find(literal) != -1
+            }
+
+            for int_type, literals, import_re, call_re, service_name, library in entries:
+                if not present.issuperset(literals):
                     continue
+                # Check if library is imported/used, then for actual usage
+                if self._check_import(content, import_re) and call_re.search(content):
+                    found.append((service_name, int_type, library))
+        finally:
+            if isinstance(content, mmap.mmap):
+                content.close()
 
-                # Check for actual usage
-                for call_pattern in call_patterns:
-                    if re.search(call_pattern, content):
-                        key = (service_name, int_type, import_pattern.split(".")[0])
-                        integrations[key].add(rel_path)
-                        break
+        return found
 
     def _get_language(self, suffix: str) -> str | None:
         """Get language from file suffix."""
-        mapping = {
-            ".py": "python",
-            ".js": "javascript",
-            ".mjs": "javascript",
-            ".ts": "javascript",
-            ".tsx": "javascript",
-            ".go": "go",
-            ".java": "java",
-        }
-        return mapping.get(suffix)
-
-    def _check_import(self, content: str, import_pattern: str, language: str) -> bool:
+        return _LANGUAGE_BY_SUFFIX.get(suffix)
+
+    def _check_import(
+        self, content: bytes | mmap.mmap, import_re: re.Pattern[bytes] | None
+    ) -> bool:
         """Check if a library is imported in the file.
 
         Args:
-            content: File content
-            import_pattern: Pattern to match in imports
-            language: Programming language
+            content: Raw file content
+            import_re: Compiled import check (see _compile_import_pattern), or
+                None if imports of the file's language are not recognized
 
         Returns:
             True if the library is imported
         """
-        # Normalize pattern for regex
-        pattern_regex = import_pattern.replace(".", r"\.").replace("*", r".*")
+        return import_re is not None and import_re.search(content) is not None
+
 
-        if language == "python":
-            # Check for "import X" or "from X import"
-            if re.search(rf"(?:import|from)\s+{pattern_regex}", content):
-                return True
-        elif language == "javascript":
-            # Check for "require('X')" or "import ... from 'X'"
-            if re.search(rf'(?:require\s*\(["\']|from\s+["\']){pattern_regex}', content):
-                return True
-        elif language == "go":
-            # Check for import "X"
-            if re.search(rf'import\s+.*["\'].*{pattern_regex}', content):
-                return True
+@cache
+def _worker_detector(repo_path: Path) -> IntegrationDetector:
+    """Get the detector a worker process scans with, building it once per process.
+
+    Args:
+        repo_path: Path to repository root
+
+    Returns:
+        Detector for the repository
+    """
+    return IntegrationDetector(repo_path)
 
-        return False
+
+def _scan_file(
+    repo_path: Path, file_path: Path
+) -> tuple[list[tuple[str, str, str]], str | None]:
+    """Detect integrations in one file.
+
+    Module-level so it can be pickled and run in a worker process; in-process
+    scans call the detector's _scan_one directly.
+
+    Args:
+        repo_path: Path to repository root
+        file_path: Path to source file
+
+    Returns:
+        Tuple of (integration keys, error message or None)
+    """
+    return _worker_detector(repo_path)._scan_one(file_path)
 
 
 def detect_external_integrations(
-    repo_path: Path, file_paths: list[Path] | None = None
+    repo_path: Path,
+    file_paths: list[Path] | None = None,
+    cache_path: Path | None = None,
+    complete: bool = False,
 ) -> list[ExternalIntegration]:
     """Detect external integrations in a repository.
 
@@ -326,9 +554,11 @@ def detect_external_integrations(
     Args:
         repo_path: Path to repository root
         file_paths: Optional specific files to scan
+        cache_path: Optional JSON file persisting scan results between runs
+        complete: Whether file_paths lists every source file of the repository
 
     Returns:
         List of detected external integrations
     """
-    detector = IntegrationDetector(repo_path)
-    return detector.detect_external_integrations(file_paths)
+    detector = IntegrationDetector(repo_path, cache_path)
+    return detector.detect_external_integrations(file_paths, complete)
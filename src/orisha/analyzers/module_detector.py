@@ -5,7 +5,8 @@ module-level summaries instead of function-by-function explanations.
 """
 
 import logging
-from collections import defaultdict
+import os
+from collections import Counter, defaultdict
 from pathlib import Path
 
 from orisha.models.canonical.ast import CanonicalAST, CanonicalClass, CanonicalFunction
@@ -13,6 +14,56 @@ from orisha.models.canonical.module import CanonicalModule
 
 logger = logging.getLogger(__name__)
 
+# Non-source directory names skipped at any depth. Matches
+# DEFAULT_EXCLUDE_PATTERNS from repomix adapter for consistency.
+SKIP_DIRS: frozenset[str] = frozenset(
+    {
+        # Test directories (FR-031: exclude non-source directories)
+        "tests",
+        "test",
+        "spec",
+        "specs",
+        "__tests__",
+        # Version control
+        ".git",
+        # Virtual environments
+        ".venv",
+        "venv",
+        "vendor",
+        # Node/JS
+        "node_modules",
+        # Python build artifacts
+        "__pycache__",
+        ".pytest_cache",
+        ".mypy_cache",
+        ".ruff_cache",
+        ".eggs",
+        ".tox",
+        ".nox",
+        # Build outputs
+        "dist",
+        "build",
+        "coverage",
+        "htmlcov",
+        # IDE directories
+        ".idea",
+        ".vscode",
+    }
+)
+
+
+def _is_skipped_dir(name: str) -> bool:
+    """Check if a directory name marks a non-source directory.
+
+    Args:
+        name: Directory name (a single path component)
+
+    Returns:
+        True if the directory should be skipped
+    """
+    # The length check avoids the endswith call for names too short to match
+    return name in SKIP_DIRS or (len(name) > 9 and name.endswith(".egg-info"))
+
 
 class ModuleDetector:
     """Detects modules in a codebase based on language-specific conventions.
@@ -91,69 +142,21 @@ class ModuleDetector:
         """
         groups: dict[str, list[Path]] = defaultdict(list)
 
-        # Find all source files
-        for ext in self.LANGUAGE_EXTENSIONS:
-            for file_path in self.repo_path.rglob(f"*{ext}"):
-                # Skip common non-source directories
-                rel_path = file_path.relative_to(self.repo_path)
-                if self._should_skip_path(rel_path):
-                    continue
+        root_path = str(self.repo_path)
 
-                # Group by parent directory
-                parent = str(rel_path.parent) if rel_path.parent != Path(".") else "."
-                groups[parent].append(file_path)
-
-        return groups
+        # Find all source files in one walk. Skipped directories are pruned from
+        # dirnames so they are never opened, which means no file below one is
+        # seen; sorting keeps the order deterministic.
+        for dir_path, dirnames, filenames in os.walk(root_path):
+            dirnames[:] = sorted(d for d in dirnames if not _is_skipped_dir(d))
 
-    def _should_skip_path(self, rel_path: Path) -> bool:
-        """Check if a path should be skipped (non-source directories).
-
-        Matches DEFAULT_EXCLUDE_PATTERNS from repomix adapter for consistency.
-
-        Args:
-            rel_path: Path relative to repository root
+            # Group by parent directory, relative to the repository root
+            parent = dir_path[len(root_path) + 1 :] or "."
+            for filename in sorted(filenames):
+                if os.path.splitext(filename)[1] in self.LANGUAGE_EXTENSIONS:
+                    groups[parent].append(Path(dir_path, filename))
 
-        Returns:
-            True if path should be skipped
-        """
-        skip_dirs = {
-            # Test directories (FR-031: exclude non-source directories)
-            "tests",
-            "test",
-            "spec",
-            "specs",
-            "__tests__",
-            # Version control
-            ".git",
-            # Virtual environments
-            ".venv",
-            "venv",
-            "vendor",
-            # Node/JS
-            "node_modules",
-            # Python build artifacts
-            "__pycache__",
-            ".pytest_cache",
-            ".mypy_cache",
-            ".ruff_cache",
-            ".eggs",
-            ".tox",
-            ".nox",
-            # Build outputs
-            "dist",
-            "build",
-            "coverage",
-            "htmlcov",
-            # IDE directories
-            ".idea",
-            ".vscode",
-        }
-
-        parts = rel_path.parts
-        for part in parts:
-            if part in skip_dirs or part.endswith(".egg-info"):
-                return True
-        return False
+        return groups
 
     def _detect_module_from_directory(
         self, dir_path: str, files: list[Path]
@@ -170,13 +173,31 @@ class ModuleDetector:
         if not files:
             return None
 
+        # Gather everything the checks below need in a single pass over files.
+        # Files sit directly in dir_path (relative to the repo root), so their
+        # relative paths are joined rather than recomputed.
+        languages = self.LANGUAGE_EXTENSIONS
+        lang_counts: Counter[str] = Counter()
+        file_names: set[str] = set()
+        suffixes: set[str] = set()
+        rel_files: list[str] = []
+        for f in files:
+            name = f.name
+            suffix = f.suffix
+            file_names.add(name)
+            suffixes.add(suffix)
+            rel_files.append(name if dir_path == "." else os.path.join(dir_path, name))
+            lang = languages.get(suffix.lower())
+            if lang is not None:
+                lang_counts[lang] += 1
+
         # Determine primary language
-        language = self._detect_primary_language(files)
+        language = self._detect_primary_language(lang_counts)
         if not language:
             return None
 
         # Check if this directory qualifies as a module
-        if not self._is_module_directory(dir_path, files, language):
+        if not self._is_module_directory(dir_path, file_names, suffixes, language):
             # For Python, also check if it's just source files without __init__.py
             # (standalone scripts)
             if language == "python" and len(files) == 1:
@@ -190,7 +211,6 @@ class ModuleDetector:
 
         # Create module
         module_name = self._derive_module_name(dir_path)
-        rel_files = [str(f.relative_to(self.repo_path)) for f in files]
 
         return CanonicalModule(
             name=module_name,
@@ -202,57 +222,52 @@ class ModuleDetector:
             imports=[],
         )
 
-    def _detect_primary_language(self, files: list[Path]) -> str | None:
+    def _detect_primary_language(self, lang_counts: Counter[str]) -> str | None:
         """Detect the primary language of files in a directory.
 
         Args:
-            files: List of source files
+            lang_counts: Number of source files per language, in first-seen order
 
         Returns:
             Primary language name or None
         """
-        lang_counts: dict[str, int] = defaultdict(int)
-
-        for f in files:
-            lang = self.LANGUAGE_EXTENSIONS.get(f.suffix.lower())
-            if lang:
-                lang_counts[lang] += 1
-
         if not lang_counts:
             return None
 
-        # Return language with most files
-        return max(lang_counts, key=lang_counts.get)  # type: ignore[arg-type]
+        # Return language with most files (the first seen wins a tie)
+        return lang_counts.most_common(1)[0][0]
 
-    def _is_module_directory(self, dir_path: str, files: list[Path], language: str) -> bool:
+    def _is_module_directory(
+        self, dir_path: str, file_names: set[str], suffixes: set[str], language: str
+    ) -> bool:
         """Check if a directory qualifies as a module.
 
         Args:
             dir_path: Directory path
-            files: Files in the directory
+            file_names: Names of the files in the directory
+            suffixes: File suffixes present in the directory
             language: Primary language
 
         Returns:
             True if directory is a module
         """
-        file_names = {f.name for f in files}
         entry_files = self.MODULE_ENTRY_FILES.get(language, [])
 
         # Python: needs __init__.py for package (or single file for script)
         if language == "python":
-            return "__init__.py" in file_names or len(files) > 0
+            return "__init__.py" in file_names or len(file_names) > 0
 
         # JavaScript/TypeScript: any directory with source files is a module
         if language in ("javascript", "typescript"):
-            return len(files) > 0
+            return len(file_names) > 0
 
         # Go: any directory with .go files is a package
         if language == "go":
-            return any(f.suffix == ".go" for f in files)
+            return ".go" in suffixes
 
         # Java: any directory with .java files is a package
         if language == "java":
-            return any(f.suffix == ".java" for f in files)
+            return ".java" in suffixes
 
         return False
 
@@ -268,8 +283,9 @@ class ModuleDetector:
         if dir_path == ".":
             return "root"
 
-        # Use the directory name, replacing path separators
-        parts = Path(dir_path).parts
+        # Use the directory name, replacing path separators. dir_path comes from
+        # the walk, so it is split as a string rather than parsed into a Path.
+        parts = dir_path.split(os.sep)
 
         # Skip common prefixes like 'src', 'lib', 'pkg'
         skip_prefixes = {"src", "lib", "pkg", "app", "internal"}
@@ -289,25 +305,32 @@ class ModuleDetector:
             modules: Detected modules to enrich
             ast_result: AST analysis result
         """
+        # Collect names per module in dicts, which dedupe in O(1) while keeping
+        # first-seen order, instead of membership tests on the growing lists
+        class_names = {path: dict.fromkeys(m.classes) for path, m in modules.items()}
+        function_names = {path: dict.fromkeys(m.functions) for path, m in modules.items()}
+
         # Map files to modules
-        file_to_module: dict[str, CanonicalModule] = {}
-        for module in modules.values():
+        file_to_module: dict[str, str] = {}
+        for path, module in modules.items():
             for file_path in module.files:
-                file_to_module[file_path] = module
+                file_to_module[file_path] = path
 
         # Add classes to modules
         for cls in ast_result.classes:
-            if cls.file in file_to_module:
-                module = file_to_module[cls.file]
-                if cls.name not in module.classes:
-                    module.classes.append(cls.name)
+            module_path = file_to_module.get(cls.file)
+            if module_path is not None:
+                class_names[module_path][cls.name] = None
 
         # Add functions to modules
         for func in ast_result.functions:
-            if func.file in file_to_module:
-                module = file_to_module[func.file]
-                if func.name not in module.functions:
-                    module.functions.append(func.name)
+            module_path = file_to_module.get(func.file)
+            if module_path is not None:
+                function_names[module_path][func.name] = None
+
+        for path, module in modules.items():
+            module.classes = list(class_names[path])
+            module.functions = list(function_names[path])
 
         # Extract imports from modules
         for module in ast_result.modules:
@@ -4,12 +4,37 @@ The registry maintains available tool adapters for each capability.
 Tools are configured in YAML config, not hardcoded.
 """
 
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
 from typing import Any
 
-from orisha.analyzers.base import ToolNotAvailableError
+from orisha.analyzers.base import ToolAdapter, ToolNotAvailableError
 from orisha.analyzers.diagrams.base import DiagramGenerator
 from orisha.analyzers.sbom.base import SBOMAdapter
 
+# An SBOM adapter class, or a zero-argument callable that imports and returns it
+SBOMAdapterSource = type[SBOMAdapter] | Callable[[], type[SBOMAdapter]]
+
+# Upper bound on concurrent availability probes (each may spawn a subprocess)
+MAX_AVAILABILITY_WORKERS = 8
+
+
+def _probe_availability(adapter_class: type[ToolAdapter[Any]], name: str) -> bool:
+    """Instantiate an adapter and check whether its tool is available.
+
+    Args:
+        adapter_class: Adapter class to probe
+        name: Tool name to instantiate the adapter with
+
+    Returns:
+        True if the tool is available, False if unavailable or the probe fails
+    """
+    try:
+        return adapter_class(name).check_available()
+    except Exception:
+        return False
+
 
 class ToolRegistry:
     """Registry of available tool adapters for each capability.
@@ -30,12 +55,32 @@ class ToolRegistry:
         diagram_adapters: Registered diagram adapters by name
     """
 
-    def __init__(self) -> None:
-        """Initialize empty registry."""
-        self._sbom_adapters: dict[str, type[SBOMAdapter]] = {}
-        self._diagram_adapters: dict[str, type[DiagramGenerator]] = {}
-        self._default_sbom: str | None = None
-        self._default_diagram: str | None = None
+    def __init__(
+        self,
+        sbom_adapters: Iterable[tuple[str, SBOMAdapterSource, bool]] = (),
+        diagram_adapters: Iterable[tuple[str, type[DiagramGenerator], bool]] = (),
+    ) -> None:
+        """Initialize registry, optionally pre-populated with adapters.
+
+        Args:
+            sbom_adapters: (name, adapter class or factory, is_default) entries
+            diagram_adapters: (name, adapter class, is_default) entries
+        """
+        sbom_entries = tuple(sbom_adapters)
+        diagram_entries = tuple(diagram_adapters)
+        self._sbom_adapters: dict[str, SBOMAdapterSource] = {
+            name: source for name, source, _ in sbom_entries
+        }
+        self._diagram_adapters: dict[str, type[DiagramGenerator]] = {
+            name: adapter_class for name, adapter_class, _ in diagram_entries
+        }
+        # As with register_*, the last entry marked default wins
+        self._default_sbom: str | None = next(
+            (name for name, _, is_default in reversed(sbom_entries) if is_default), None
+        )
+        self._default_diagram: str | None = next(
+            (name for name, _, is_default in reversed(diagram_entries) if is_default), None
+        )
 
     # =========================================================================
     # Registration
@@ -44,14 +89,17 @@ class ToolRegistry:
     def register_sbom_adapter(
         self,
         name: str,
-        adapter_class: type[SBOMAdapter],
+        adapter_class: SBOMAdapterSource,
         is_default: bool = False,
     ) -> None:
         """Register an SBOM adapter.
 
+        The adapter may be given as a factory that returns the class, so the
+        adapter module is only imported when the tool is first used.
+
         Args:
             name: Tool identifier (e.g., "syft")
-            adapter_class: Adapter class to register
+            adapter_class: Adapter class, or a callable returning it, to register
             is_default: Whether this is the default SBOM tool
         """
         self._sbom_adapters[name] = adapter_class
@@ -102,7 +150,23 @@ class ToolRegistry:
                 f"SBOM tool '{tool_name}' not registered. Available: {available}",
             )
 
-        return self._sbom_adapters[tool_name](tool_name)
+        return self._resolve_sbom_adapter(tool_name)(tool_name)
+
+    def _resolve_sbom_adapter(self, name: str) -> type[SBOMAdapter]:
+        """Get a registered SBOM adapter class, calling its factory on first use.
+
+        Args:
+            name: Registered tool name
+
+        Returns:
+            Adapter class (cached in place of the factory)
+        """
+        source = self._sbom_adapters[name]
+        if isinstance(source, type):
+            return source
+        adapter_class = source()
+        self._sbom_adapters[name] = adapter_class
+        return adapter_class
 
     def get_diagram_adapter(self, name: str | None = None) -> DiagramGenerator:
         """Get a diagram generator adapter instance.
@@ -155,24 +219,37 @@ class ToolRegistry:
     def check_tool_availability(self) -> dict[str, dict[str, bool]]:
         """Check availability of all registered tools.
 
+        Probes typically shell out to the tool (e.g. `syft version`), so they
+        run concurrently in a thread pool and the total wait is roughly that of
+        the slowest probe.
+
         Returns:
             Dictionary mapping capability → tool → availability
         """
         result: dict[str, dict[str, bool]] = {"sbom": {}, "diagram": {}}
+        probes: list[tuple[str, str, type[ToolAdapter[Any]]]] = []
 
-        for name, adapter_class in self._sbom_adapters.items():
+        for name in list(self._sbom_adapters):
             try:
-                adapter = adapter_class(name)
-                result["sbom"][name] = adapter.check_available()
+                probes.append(("sbom", name, self._resolve_sbom_adapter(name)))
             except Exception:
                 result["sbom"][name] = False
 
         for name, adapter_class in self._diagram_adapters.items():
-            try:
-                adapter = adapter_class(name)
-                result["diagram"][name] = adapter.check_available()
-            except Exception:
-                result["diagram"][name] = False
+            probes.append(("diagram", name, adapter_class))
+
+        if not probes:
+            return result
+
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_AVAILABILITY_WORKERS, len(probes))
+        ) as executor:
+            futures = {
+                (capability, name): executor.submit(_probe_availability, adapter_class, name)
+                for capability, name, adapter_class in probes
+            }
+            for (capability, name), future in futures.items():
+                result[capability][name] = future.result()
 
         return result
 
@@ -186,23 +263,17 @@ class ToolRegistry:
         }
 
 
-# Global registry instance
-_registry: ToolRegistry | None = None
-
-
+# Global registry instance, created on first use
+@cache
 def get_registry() -> ToolRegistry:
     """Get the global tool registry instance.
 
     Returns:
         Global ToolRegistry instance
     """
-    global _registry
-    if _registry is None:
-        _registry = ToolRegistry()
-    return _registry
+    return ToolRegistry()
 
 
 def reset_registry() -> None:
     """Reset the global registry (primarily for testing)."""
-    global _registry
-    _registry = None
+    get_registry.cache_clear()
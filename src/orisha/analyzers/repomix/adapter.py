@@ -6,13 +6,15 @@ function signatures and structure for holistic LLM analysis.
 """
 
 import logging
-import shutil
+import mmap
+import re
 import subprocess
 import tempfile
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+from orisha.analyzers.base import locate_tool
 from orisha.models.canonical import CompressedCodebase
 
 logger = logging.getLogger(__name__)
@@ -41,6 +43,62 @@ DEFAULT_EXCLUDE_PATTERNS: list[str] = [
     ".eggs/*",
 ]
 
+# First number on a Repomix stdout line (token and file counts)
+_NUMBER_RE = re.compile(r"(\d+)")
+
+# Semantic version on a Repomix stdout line
+_VERSION_RE = re.compile(r"v?(\d+\.\d+\.\d+)")
+
+
+def _read_output(output_path: Path) -> str:
+    """Read a Repomix output file as text.
+
+    The file is memory-mapped and decoded straight from the mapping, so the
+    packed codebase (often many MB) is not first copied into a bytes object.
+    Newlines are normalized as `Path.read_text` would.
+
+    Args:
+        output_path: Path to Repomix output file
+
+    Returns:
+        File content
+    """
+    with open(output_path, "rb") as f:
+        if output_path.stat().st_size == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            content = str(mm, "utf-8")
+
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
+
+
+def _find_repomix_command() -> tuple[str, ...]:
+    """Find Repomix command (global or npx).
+
+    Found executables are remembered per PATH by locate_tool, so repeated
+    adapters do not search PATH again.
+
+    Returns:
+        Command to execute Repomix
+
+    Raises:
+        RuntimeError: If Repomix is not found (a later call searches again,
+            so a newly installed Repomix is found)
+    """
+    # Try global installation
+    if locate_tool("repomix"):
+        return ("repomix",)
+
+    # Try npx
+    if locate_tool("npx"):
+        return ("npx", "repomix")
+
+    raise RuntimeError(
+        "Repomix not found. Install via: npm install -g repomix"
+    )
+
 
 class RepomixAdapter:
     """Adapter for running Repomix codebase compression.
@@ -77,17 +135,7 @@ class RepomixAdapter:
         Raises:
             RuntimeError: If Repomix is not found
         """
-        # Try global installation
-        if shutil.which("repomix"):
-            return ["repomix"]
-
-        # Try npx
-        if shutil.which("npx"):
-            return ["npx", "repomix"]
-
-        raise RuntimeError(
-            "Repomix not found. Install via: npm install -g repomix"
-        )
+        return list(_find_repomix_command())
 
     def compress(
         self,
@@ -97,7 +145,10 @@ class RepomixAdapter:
     ) -> CompressedCodebase:
         """Compress a repository using Repomix.
 
-        Uses --compress flag for tree-sitter skeleton extraction.
+        Uses --compress flag for tree-sitter skeleton extraction. Repomix
+        always writes to a file (a temporary one, removed afterwards, if no
+        output path is given) so that its summary of token and file counts is
+        printed to stdout.
 
         Args:
             repo_path: Path to the repository to compress
@@ -120,11 +171,25 @@ class RepomixAdapter:
         if additional_excludes:
             excludes.extend(additional_excludes)
 
-        # Use temp file if no output path specified
         if output_path is None:
-            temp_dir = tempfile.mkdtemp(prefix="repomix_")
-            output_path = Path(temp_dir) / "repomix-output.txt"
+            with tempfile.TemporaryDirectory(prefix="repomix_") as temp_dir:
+                return self._run(repo_path, Path(temp_dir) / "repomix-output.txt", excludes)
+        return self._run(repo_path, output_path, excludes)
 
+    def _run(self, repo_path: Path, output_path: Path, excludes: list[str]) -> CompressedCodebase:
+        """Run Repomix and read back its output file.
+
+        Args:
+            repo_path: Resolved repository path
+            output_path: Path Repomix writes the packed codebase to
+            excludes: Exclude patterns to pass to Repomix
+
+        Returns:
+            CompressedCodebase with compressed content
+
+        Raises:
+            RuntimeError: If Repomix execution fails
+        """
         # Build command
         cmd = self._repomix_cmd + [
             "--compress",  # Use tree-sitter skeleton extraction
@@ -186,12 +251,10 @@ class RepomixAdapter:
         if not output_path.exists():
             raise RuntimeError(f"Repomix output file not found: {output_path}")
 
-        content = output_path.read_text(encoding="utf-8")
+        content = _read_output(output_path)
 
         # Extract metadata from stdout if available
-        token_count = self._extract_token_count(stdout)
-        file_count = self._extract_file_count(stdout)
-        version = self._extract_version(stdout)
+        token_count, file_count, version = self._extract_metadata(stdout)
 
         return CompressedCodebase(
             compressed_content=content,
@@ -203,37 +266,51 @@ class RepomixAdapter:
             tool_version=version,
         )
 
-    def _extract_token_count(self, stdout: str) -> int:
-        """Extract token count from Repomix output."""
-        # Repomix outputs "Token count: X" or similar
-        for line in stdout.split("\n"):
-            if "token" in line.lower():
-                # Try to extract number
-                import re
-                match = re.search(r"(\d+)", line)
-                if match:
-                    return int(match.group(1))
-        return 0
+    def _extract_metadata(self, stdout: str) -> tuple[int, int, str | None]:
+        """Extract token count, file count and Repomix version from its output.
+
+        Each value comes from the first line that mentions it and carries a
+        number; stdout is scanned once, stopping as soon as all three are found.
+
+        Args:
+            stdout: Repomix stdout
+
+        Returns:
+            Tuple of (token count, file count, version); counts default to 0
+            and the version to None when not found
+        """
+        token_count: int | None = None
+        file_count: int | None = None
+        version: str | None = None
 
-    def _extract_file_count(self, stdout: str) -> int:
-        """Extract file count from Repomix output."""
         for line in stdout.split("\n"):
-            if "file" in line.lower() and ("processed" in line.lower() or "packed" in line.lower()):
-                import re
-                match = re.search(r"(\d+)", line)
+            lower = line.lower()
+
+            # Repomix outputs "Token count: X" or similar
+            if token_count is None and "token" in lower:
+                match = _NUMBER_RE.search(line)
                 if match:
-                    return int(match.group(1))
-        return 0
+                    token_count = int(match.group(1))
+
+            if (
+                file_count is None
+                and "file" in lower
+                and ("processed" in lower or "packed" in lower)
+            ):
+                match = _NUMBER_RE.search(line)
+                if match:
+                    file_count = int(match.group(1))
 
-    def _extract_version(self, stdout: str) -> str | None:
-        """Extract Repomix version from output."""
-        for line in stdout.split("\n"):
-            if "repomix" in line.lower() and ("v" in line.lower() or "version" in line.lower()):
-                import re
-                match = re.search(r"v?(\d+\.\d+\.\d+)", line)
+            # "version" contains "v", so one substring test covers both spellings
+            if version is None and "repomix" in lower and "v" in lower:
+                match = _VERSION_RE.search(line)
                 if match:
-                    return match.group(1)
-        return None
+                    version = match.group(1)
+
+            if token_count is not None and file_count is not None and version is not None:
+                break
+
+        return token_count or 0, file_count or 0, version
 
     def get_version(self) -> str | None:
         """Get Repomix version.
@@ -249,7 +326,9 @@ class RepomixAdapter:
                 timeout=10,
             )
             if result.returncode == 0:
-                return result.stdout.strip().split("\n")[0]
+                first_line = result.stdout.lstrip().partition("\n")[0].strip()
+                match = _VERSION_RE.search(first_line)
+                return match.group(1) if match else first_line
         except Exception:
             pass
         return None
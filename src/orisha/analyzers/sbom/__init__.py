@@ -1,9 +1,28 @@
 """SBOM tool adapters (Principle V: Tool Agnosticism).
 
-All SBOM adapters output CanonicalSBOM format.
+All SBOM adapters output CanonicalSBOM format. Concrete adapters are
+imported on first access so that importing this package stays cheap.
 """
 
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from orisha.analyzers.sbom.base import SBOMAdapter
-from orisha.analyzers.sbom.syft import SyftAdapter
+
+if TYPE_CHECKING:
+    from orisha.analyzers.sbom.syft import SyftAdapter
 
 __all__ = ["SBOMAdapter", "SyftAdapter"]
+
+# Lazily imported adapter classes: attribute name -> defining module
+_LAZY_ADAPTERS = {
+    "SyftAdapter": "orisha.analyzers.sbom.syft",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import an adapter class on first access (PEP 562)."""
+    module_name = _LAZY_ADAPTERS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module_name), name)
@@ -7,11 +7,25 @@ https://github.com/anchore/syft
 import json
 import logging
 import subprocess
+import tempfile
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-from orisha.analyzers.base import ToolExecutionError, ToolNotAvailableError
+try:
+    import ijson
+except ImportError:  # Optional: install with `pip install orisha[streaming]`
+    ijson = None  # type: ignore[assignment]
+
+try:
+    import orjson
+except ImportError:  # Optional: install with `pip install orisha[fast-json]`
+    orjson = None  # type: ignore[assignment]
+
+from orisha.analyzers.base import ToolExecutionError, ToolNotAvailableError, locate_tool
 from orisha.analyzers.dependency import DirectDependencyResolver
 from orisha.analyzers.sbom.base import SBOMAdapter
 from orisha.models.canonical import CanonicalPackage, CanonicalSBOM, SBOMSource
@@ -48,6 +62,40 @@ SYFT_TYPE_TO_ECOSYSTEM: dict[str, str] = {
     "cran": "cran",
 }
 
+# Bound lookup for the per-artifact hot path. Mapped names are never empty, so
+# `_ecosystem_for_type(t) or t` behaves like `.get(t, t)`.
+_ecosystem_for_type = SYFT_TYPE_TO_ECOSYSTEM.get
+
+# Upper bound on Syft processes run at once by execute_many
+MAX_CONCURRENT_SCANS = 4
+
+# Syft JSON output larger than this is streamed artifact by artifact with ijson
+# (if installed) instead of being loaded into memory as a single dict
+SBOM_STREAM_THRESHOLD_BYTES = 10 * 1024 * 1024
+
+# Decoder for whole Syft outputs; orjson parses large artifact arrays several
+# times faster than the stdlib and, like it, raises ValueError subclasses
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Package tuple cached by _transform_artifact: (name, ecosystem, version,
+# license, source file, purl)
+_PackageKey = tuple[str, str, str | None, str | None, str | None, str | None]
+
+
+@lru_cache(maxsize=4096)
+def _join_licenses(values: tuple[str, ...]) -> str:
+    """Join license values into one SPDX-style expression.
+
+    Cached, since the same few license combinations repeat across artifacts.
+
+    Args:
+        values: License values in Syft order
+
+    Returns:
+        Non-empty values joined with AND
+    """
+    return " AND ".join(filter(None, values))
+
 
 class SyftAdapter(SBOMAdapter):
     """SBOM adapter using Anchore Syft.
@@ -75,43 +123,66 @@ class SyftAdapter(SBOMAdapter):
         """
         super().__init__(name=name)
         self._dependency_resolver = dependency_resolver
+        # Packages already built during the current transform, so artifacts
+        # Syft reports more than once share one CanonicalPackage
+        self._package_cache: dict[_PackageKey, CanonicalPackage] = {}
+        # Direct dependency keys from the resolver, taken once per transform
+        self._direct_set: frozenset[tuple[str, str]] = frozenset()
+        # Result of `syft version`, shared by check_available and get_version so
+        # the command runs once per adapter rather than on every scan
+        self._version_result: subprocess.CompletedProcess[str] | None = None
+        self._version_checked = False
+
+    def refresh(self) -> None:
+        """Forget cached availability and version, e.g. after installing Syft."""
+        self._version_result = None
+        self._version_checked = False
+        self._version = None
+
+    def _run_version(self) -> subprocess.CompletedProcess[str] | None:
+        """Run `syft version` once and cache the result.
+
+        Returns:
+            Completed process, or None if Syft could not be run
+        """
+        if not self._version_checked:
+            # Skip spawning a process at all when Syft is not on PATH
+            if locate_tool("syft") is None:
+                self._version_checked = True
+                return None
+            try:
+                self._version_result = subprocess.run(
+                    ["syft", "version"],
+                    capture_output=True,
+                    text=True,
+                    timeout=10,
+                )
+            except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
+                self._version_result = None
+            self._version_checked = True
+        return self._version_result
 
     def check_available(self) -> bool:
         """Check if Syft is installed and accessible."""
-        try:
-            result = subprocess.run(
-                ["syft", "version"],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            return result.returncode == 0
-        except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
-            return False
+        result = self._run_version()
+        return result is not None and result.returncode == 0
 
     def get_version(self) -> str | None:
         """Get Syft version string."""
-        try:
-            result = subprocess.run(
-                ["syft", "version"],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            if result.returncode == 0:
-                # Output format: "syft x.y.z" or just version info
-                output = result.stdout.strip()
-                # Try to extract version from various output formats
-                for line in output.split("\n"):
-                    if "version" in line.lower() or line.strip().startswith("syft"):
-                        parts = line.split()
-                        if len(parts) >= 2:
-                            return parts[-1].strip()
-                # Fallback: return first line
-                return output.split("\n")[0].strip() if output else None
-            return None
-        except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
+        result = self._run_version()
+        if result is None or result.returncode != 0:
             return None
+        # Output format: "syft x.y.z" or just version info
+        output = result.stdout.strip()
+        # Try to extract version from various output formats, stopping at the
+        # first line that carries one
+        for line in output.splitlines():
+            if "version" in line.lower() or line.lstrip().startswith("syft"):
+                parts = line.split()
+                if len(parts) >= 2:
+                    return parts[-1]
+        # Fallback: return first line
+        return output.partition("\n")[0].strip() if output else None
 
     def execute(self, input_path: Path) -> CanonicalSBOM:
         """Generate SBOM for the given path using Syft.
@@ -133,17 +204,88 @@ class SyftAdapter(SBOMAdapter):
                 "https://raw.githubusercontent.com/anchore/syft/main/install.sh | sh -s",
             )
 
-        # Run syft with JSON output
+        # The SBOM's scan time, taken once when the scan starts
+        scanned_at = datetime.now(UTC)
+
+        # Syft writes its JSON to a file rather than stdout, so the output is
+        # never held in memory as one string and large SBOMs can be streamed.
+        with tempfile.TemporaryDirectory(prefix="orisha_syft_") as temp_dir:
+            output_path = Path(temp_dir) / "sbom.json"
+            stderr = self._run_syft(input_path, output_path)
+            return self._transform_output(output_path, input_path, stderr, scanned_at)
+
+    def execute_many(self, input_paths: Sequence[Path]) -> list[CanonicalSBOM]:
+        """Generate SBOMs for several paths, running the Syft scans concurrently.
+
+        Syft scans one source per invocation, so each path still gets its own
+        process, but up to MAX_CONCURRENT_SCANS of them run at once. Outputs
+        are then transformed one at a time, since the transform caches and the
+        dependency resolver belong to this adapter.
+
+        Args:
+            input_paths: Repository or directory paths to scan
+
+        Returns:
+            One CanonicalSBOM per input path, in the same order
+
+        Raises:
+            ToolNotAvailableError: If Syft is not installed
+            ToolExecutionError: If any Syft execution fails
+        """
+        if not input_paths:
+            return []
+        if len(input_paths) == 1:
+            return [self.execute(input_paths[0])]
+
+        if not self.check_available():
+            raise ToolNotAvailableError(
+                self.name,
+                "Syft is not installed. Install with: curl -sSfL "
+                "https://raw.githubusercontent.com/anchore/syft/main/install.sh | sh -s",
+            )
+
+        # Scans all start together, so they share one scan time
+        scanned_at = datetime.now(UTC)
+        with tempfile.TemporaryDirectory(prefix="orisha_syft_") as temp_dir:
+            output_paths = [
+                Path(temp_dir) / f"sbom-{index}.json" for index in range(len(input_paths))
+            ]
+            with ThreadPoolExecutor(
+                max_workers=min(MAX_CONCURRENT_SCANS, len(input_paths))
+            ) as executor:
+                stderrs = list(executor.map(self._run_syft, input_paths, output_paths))
+
+            return [
+                self._transform_output(output_path, input_path, stderr, scanned_at)
+                for input_path, output_path, stderr in zip(
+                    input_paths, output_paths, stderrs, strict=True
+                )
+            ]
+
+    def _run_syft(self, input_path: Path, output_path: Path) -> str:
+        """Run a Syft scan, writing its JSON output to a file.
+
+        Args:
+            input_path: Repository or directory path to scan
+            output_path: File for Syft's JSON output
+
+        Returns:
+            Syft stderr
+
+        Raises:
+            ToolExecutionError: If Syft fails, times out or cannot be run
+        """
         try:
             logger.info("Running Syft on %s", input_path)
             result = subprocess.run(
                 [
                     "syft",
                     str(input_path),
-                    "-o", "json",
+                    "-o", f"json={output_path}",
                     "--quiet",  # Suppress progress output
                 ],
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
                 timeout=300,  # 5 minute timeout for large repos
             )
@@ -166,23 +308,86 @@ class SyftAdapter(SBOMAdapter):
                 exit_code=result.returncode,
                 stderr=result.stderr,
             )
+        return result.stderr
 
-        # Parse JSON output
-        try:
-            syft_output = json.loads(result.stdout)
-        except json.JSONDecodeError as e:
-            raise ToolExecutionError(
-                self.name,
-                f"Failed to parse Syft JSON output: {e}",
-                stderr=result.stderr,
-            )
+    def _transform_output(
+        self,
+        output_path: Path,
+        input_path: Path,
+        stderr: str,
+        scanned_at: datetime | None = None,
+    ) -> CanonicalSBOM:
+        """Resolve direct dependencies and transform a Syft output file.
+
+        Args:
+            output_path: File holding Syft's JSON output
+            input_path: Path that was scanned
+            stderr: Syft stderr, for error reporting
+            scanned_at: When the scan started (defaults to now)
 
+        Returns:
+            CanonicalSBOM for the scanned path
+        """
         # Resolve direct dependencies if resolver provided
         if self._dependency_resolver:
             self._dependency_resolver.resolve_from_directory(input_path)
 
-        # Transform to canonical format
-        return self._transform_to_canonical(syft_output, input_path)
+        # Parse JSON output and transform to canonical format
+        return self._load_output(output_path, input_path, stderr, scanned_at)
+
+    def _load_output(
+        self,
+        output_path: Path,
+        input_path: Path,
+        stderr: str,
+        scanned_at: datetime | None = None,
+    ) -> CanonicalSBOM:
+        """Parse Syft's JSON output file and transform it to CanonicalSBOM.
+
+        Outputs over SBOM_STREAM_THRESHOLD_BYTES are streamed with ijson when it
+        is installed, so artifacts are transformed as they are parsed.
+
+        Args:
+            output_path: Path to Syft's JSON output
+            input_path: Original scan target path
+            stderr: Syft stderr, attached to parse errors
+            scanned_at: When the scan started (defaults to now)
+
+        Returns:
+            CanonicalSBOM with transformed package data
+
+        Raises:
+            ToolExecutionError: If the output is missing or cannot be parsed
+        """
+        try:
+            output_size = output_path.stat().st_size
+            if ijson is not None and output_size > SBOM_STREAM_THRESHOLD_BYTES:
+                with output_path.open("rb") as f:
+                    try:
+                        return self._transform_artifacts(
+                            ijson.items(f, "artifacts.item"), input_path, scanned_at
+                        )
+                    except ijson.JSONError as e:
+                        raise ToolExecutionError(
+                            self.name,
+                            f"Failed to parse Syft JSON output: {e}",
+                            stderr=stderr,
+                        ) from e
+            syft_output = _json_loads(output_path.read_bytes())
+        except OSError as e:
+            raise ToolExecutionError(
+                self.name,
+                f"Failed to read Syft JSON output: {e}",
+                stderr=stderr,
+            ) from e
+        except ValueError as e:  # Invalid JSON or UTF-8
+            raise ToolExecutionError(
+                self.name,
+                f"Failed to parse Syft JSON output: {e}",
+                stderr=stderr,
+            ) from e
+
+        return self._transform_to_canonical(syft_output, input_path, scanned_at)
 
     def get_supported_ecosystems(self) -> list[str]:
         """Get list of package ecosystems Syft supports."""
@@ -192,35 +397,58 @@ class SyftAdapter(SBOMAdapter):
         self,
         syft_output: dict[str, Any],
         input_path: Path,
+        scanned_at: datetime | None = None,
     ) -> CanonicalSBOM:
         """Transform Syft JSON output to CanonicalSBOM.
 
         Args:
             syft_output: Parsed Syft JSON output
             input_path: Original scan target path
+            scanned_at: When the scan started (defaults to now)
 
         Returns:
             CanonicalSBOM with transformed package data
         """
-        # Extract source metadata
+        return self._transform_artifacts(
+            syft_output.get("artifacts", []), input_path, scanned_at
+        )
+
+    def _transform_artifacts(
+        self,
+        artifacts: Iterable[dict[str, Any]],
+        input_path: Path,
+        scanned_at: datetime | None = None,
+    ) -> CanonicalSBOM:
+        """Transform Syft artifacts to CanonicalSBOM.
+
+        Args:
+            artifacts: Syft artifacts, as a list or lazily from a stream
+            input_path: Original scan target path
+            scanned_at: When the scan started (defaults to now)
+
+        Returns:
+            CanonicalSBOM with transformed package data
+        """
+        # Extract source metadata. The timestamp is SBOM-wide and set here
+        # once; per-package data in _transform_artifact must not take its own.
         source_info = SBOMSource(
             tool="syft",
             tool_version=self.version or "unknown",
-            scanned_at=datetime.now(UTC),
+            scanned_at=scanned_at or datetime.now(UTC),
             target=str(input_path),
         )
 
         # Create SBOM
         sbom = CanonicalSBOM(source=source_info)
 
-        # Extract packages from artifacts
-        artifacts = syft_output.get("artifacts", [])
-        logger.debug("Found %d artifacts in Syft output", len(artifacts))
-
-        for artifact in artifacts:
-            package = self._transform_artifact(artifact)
-            if package:
-                sbom.add_package(package)
+        # Extract packages from artifacts in one pass. Direct dependencies are
+        # resolved per scan, so cached packages are too.
+        self._package_cache.clear()
+        if self._dependency_resolver:
+            self._direct_set = self._dependency_resolver.as_set()
+        sbom.add_packages(
+            package for package in map(self._transform_artifact, artifacts) if package
+        )
 
         logger.info(
             "Transformed %d packages (%d direct, %s ecosystems)",
@@ -245,8 +473,11 @@ class SyftAdapter(SBOMAdapter):
             return None
 
         # Get package type and map to ecosystem
-        pkg_type = artifact.get("type", "").lower()
-        ecosystem = SYFT_TYPE_TO_ECOSYSTEM.get(pkg_type, pkg_type)
+        pkg_type = artifact.get("type", "")
+        # Syft types are almost always lowercase already
+        if not pkg_type.islower():
+            pkg_type = pkg_type.lower()
+        ecosystem = _ecosystem_for_type(pkg_type) or pkg_type
 
         if not ecosystem:
             logger.debug("Unknown package type: %s for %s", pkg_type, name)
@@ -259,7 +490,12 @@ class SyftAdapter(SBOMAdapter):
         license_str: str | None = None
         licenses = artifact.get("licenses", [])
         if licenses:
-            if isinstance(licenses, list):
+            if isinstance(licenses, list) and len(licenses) == 1:
+                # Most packages carry a single license: nothing to join
+                lic = licenses[0]
+                value = lic.get("value", str(lic)) if isinstance(lic, dict) else str(lic)
+                license_str = value or ""
+            elif isinstance(licenses, list):
                 # Join multiple licenses with AND
                 license_parts = []
                 for lic in licenses:
@@ -267,7 +503,7 @@ class SyftAdapter(SBOMAdapter):
                         license_parts.append(lic.get("value", str(lic)))
                     else:
                         license_parts.append(str(lic))
-                license_str = " AND ".join(filter(None, license_parts))
+                license_str = _join_licenses(tuple(license_parts))
             else:
                 license_str = str(licenses)
 
@@ -284,12 +520,18 @@ class SyftAdapter(SBOMAdapter):
             elif isinstance(first_loc, str):
                 source_file = first_loc
 
+        # Reuse the package built for an identical earlier artifact
+        key = (name, ecosystem, version, license_str, source_file, purl)
+        package = self._package_cache.get(key)
+        if package is not None:
+            return package
+
         # Check if this is a direct dependency
         is_direct = False
         if self._dependency_resolver:
-            is_direct = self._dependency_resolver.is_direct(name, ecosystem)
+            is_direct = self._dependency_resolver.package_key(name, ecosystem) in self._direct_set
 
-        return CanonicalPackage(
+        package = CanonicalPackage(
             name=name,
             ecosystem=ecosystem,
             version=version,
@@ -298,3 +540,5 @@ class SyftAdapter(SBOMAdapter):
             purl=purl,
             is_direct=is_direct,
         )
+        self._package_cache[key] = package
+        return package
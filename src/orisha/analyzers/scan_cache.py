@@ -0,0 +1,147 @@
+"""Persisted per-file scan results keyed by file mtime and size.
+
+Used by the entry point and integration detectors so that unchanged files are
+not rescanned between runs. Results are stored as JSON under a repository's
+.orisha directory, by path relative to the repository root.
+"""
+
+import json
+import logging
+import os
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, Generic, TypeVar
+
+logger = logging.getLogger(__name__)
+
+# Per-file scan result type
+R = TypeVar("R")
+
+
+class ScanCache(Generic[R]):
+    """mtime/size-keyed JSON cache of per-file scan results.
+
+    Attributes:
+        path: JSON file holding the cache
+        version: Format version; a file with any other version is ignored
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        version: int,
+        encode: Callable[[R], Any],
+        decode: Callable[[Any], R],
+        description: str,
+    ) -> None:
+        """Initialize the cache, loading any persisted results.
+
+        Args:
+            path: JSON file holding the cache
+            version: Format version; bump when the detection rules change
+            encode: Converts a result to JSON-serializable data
+            decode: Converts JSON data back to a result
+            description: What is cached, for log messages (e.g. "entry point")
+        """
+        self.path = path
+        self.version = version
+        self._encode = encode
+        self._decode = decode
+        self._description = description
+        # Relative path -> (mtime_ns, size, result)
+        self._entries: dict[str, tuple[int, int, R]] = self._load()
+
+    def split(
+        self,
+        repo_path: Path,
+        file_paths: list[Path],
+        stats: dict[Path, tuple[str, int, int]],
+        found: dict[Path, R],
+    ) -> list[Path]:
+        """Split files into cache hits and files that need scanning.
+
+        Args:
+            repo_path: Repository root the cached paths are relative to
+            file_paths: Files to scan
+            stats: Filled with (relative path, mtime_ns, size) for every cacheable file
+            found: Filled with the cached result for every cache hit
+
+        Returns:
+            Files whose cached results are missing or stale
+        """
+        misses: list[Path] = []
+        for file_path in file_paths:
+            try:
+                st = file_path.stat()
+                rel_path = str(file_path.relative_to(repo_path))
+            except (OSError, ValueError):
+                misses.append(file_path)
+                continue
+            stats[file_path] = (rel_path, st.st_mtime_ns, st.st_size)
+            cached = self._entries.get(rel_path)
+            if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+                found[file_path] = cached[2]
+            else:
+                misses.append(file_path)
+        return misses
+
+    def update(
+        self,
+        stats: dict[Path, tuple[str, int, int]],
+        found: dict[Path, R],
+        complete: bool,
+    ) -> None:
+        """Record this run's results, persisting them if anything changed.
+
+        Args:
+            stats: (relative path, mtime_ns, size) per file, as filled by split
+            found: Result per successfully scanned (or cached) file
+            complete: Whether the run covered every file of the repository, in
+                which case the cache is rebuilt and deleted files are dropped
+        """
+        scanned = {
+            rel_path: (mtime_ns, size, found[file_path])
+            for file_path, (rel_path, mtime_ns, size) in stats.items()
+            if file_path in found
+        }
+        entries = scanned if complete else {**self._entries, **scanned}
+        if entries != self._entries:
+            self._entries = entries
+            self._save()
+
+    def _load(self) -> dict[str, tuple[int, int, R]]:
+        """Load persisted results, ignoring a missing or unreadable cache.
+
+        Returns:
+            Cached results by relative file path
+        """
+        try:
+            data = json.loads(self.path.read_bytes())
+            if data.get("version") != self.version:
+                return {}
+            return {
+                rel_path: (mtime_ns, size, self._decode(result))
+                for rel_path, (mtime_ns, size, result) in data["files"].items()
+            }
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError, TypeError, KeyError, AttributeError) as e:
+            logger.debug(f"Ignoring unreadable {self._description} cache {self.path}: {e}")
+            return {}
+
+    def _save(self) -> None:
+        """Persist results, logging rather than failing on write errors."""
+        data = {
+            "version": self.version,
+            "files": {
+                rel_path: [mtime_ns, size, self._encode(result)]
+                for rel_path, (mtime_ns, size, result) in self._entries.items()
+            },
+        }
+        tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(data))
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Failed to write {self._description} cache {self.path}: {e}")
@@ -10,17 +10,23 @@ Global options:
 - --config: Path to configuration file
 - --verbose: Enable verbose output with timestamps
 - --quiet: Suppress info messages
+- --no-config-cache: Always re-parse the configuration file (skip the parse cache)
 - --version: Show version and exit
 """
 
+from functools import cache
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 import typer
 
 from orisha import __version__
-from orisha.config import OrishaConfig, load_config
-from orisha.utils.logging import configure_from_cli, get_logger
+from orisha.utils.logging import get_logger
+
+if TYPE_CHECKING:
+    from jinja2 import Environment
+
+    from orisha.config import OrishaConfig
 
 # Create Typer app
 app = typer.Typer(
@@ -31,7 +37,7 @@ app = typer.Typer(
 )
 
 # Global state
-_config: OrishaConfig | None = None
+_config: "OrishaConfig | None" = None
 _logger = get_logger()
 
 
@@ -42,50 +48,48 @@ def version_callback(value: bool) -> None:
         raise typer.Exit()
 
 
+# Global options
+_CONFIG_OPT = typer.Option(
+    "--config",
+    "-c",
+    help="Path to configuration file",
+    exists=True,
+    dir_okay=False,
+)
+_VERBOSE_OPT = typer.Option(
+    "--verbose",
+    "-v",
+    help="Enable verbose output with timestamps",
+)
+_QUIET_OPT = typer.Option(
+    "--quiet",
+    "-q",
+    help="Suppress info messages (warnings and errors only)",
+)
+_CI_OPT = typer.Option(
+    "--ci",
+    help="Enable CI mode with JSON output",
+)
+_NO_CONFIG_CACHE_OPT = typer.Option(
+    "--no-config-cache",
+    help="Always re-parse the configuration file (skip the parse cache)",
+)
+_VERSION_OPT = typer.Option(
+    "--version",
+    callback=version_callback,
+    is_eager=True,
+    help="Show version and exit",
+)
+
+
 @app.callback()
 def main(
-    config: Annotated[
-        Path | None,
-        typer.Option(
-            "--config",
-            "-c",
-            help="Path to configuration file",
-            exists=True,
-            dir_okay=False,
-        ),
-    ] = None,
-    verbose: Annotated[
-        bool,
-        typer.Option(
-            "--verbose",
-            "-v",
-            help="Enable verbose output with timestamps",
-        ),
-    ] = False,
-    quiet: Annotated[
-        bool,
-        typer.Option(
-            "--quiet",
-            "-q",
-            help="Suppress info messages (warnings and errors only)",
-        ),
-    ] = False,
-    ci: Annotated[
-        bool,
-        typer.Option(
-            "--ci",
-            help="Enable CI mode with JSON output",
-        ),
-    ] = False,
-    version: Annotated[
-        bool,
-        typer.Option(
-            "--version",
-            callback=version_callback,
-            is_eager=True,
-            help="Show version and exit",
-        ),
-    ] = False,
+    config: Annotated[Path | None, _CONFIG_OPT] = None,
+    verbose: Annotated[bool, _VERBOSE_OPT] = False,
+    quiet: Annotated[bool, _QUIET_OPT] = False,
+    ci: Annotated[bool, _CI_OPT] = False,
+    no_config_cache: Annotated[bool, _NO_CONFIG_CACHE_OPT] = False,
+    version: Annotated[bool, _VERSION_OPT] = False,
 ) -> None:
     """Orisha - Automated System Documentation Generator.
 
@@ -94,12 +98,16 @@ def main(
     """
     global _config
 
+    # Deferred so that --version (handled eagerly above) skips config loading
+    from orisha.config import load_config
+    from orisha.utils.logging import configure_from_cli
+
     # Configure logging based on CLI flags
     configure_from_cli(verbose=verbose, quiet=quiet, ci=ci)
 
     # Load configuration
     try:
-        _config = load_config(config_path=config)
+        _config = load_config(config_path=config, use_cache=not no_config_cache)
         if _config.config_path:
             _logger.debug(f"Loaded config from: {_config.config_path}")
     except FileNotFoundError as e:
@@ -110,30 +118,40 @@ def main(
         raise typer.Exit(1)
 
 
+def _dumps_json(data: object) -> str:
+    """Serialize data as indented JSON, with orjson when it is installed."""
+    try:
+        import orjson
+    except ImportError:  # Optional: install with `pip install orisha[fast-json]`
+        import json
+
+        return json.dumps(data, indent=2)
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+
+
 # =============================================================================
 # check command (Principle III: Preflight Validation)
 # =============================================================================
 
 
+# check options
+_JSON_OPT = typer.Option(
+    "--json",
+    help="Output results as JSON",
+)
+_CHECK_REPO_OPT = typer.Option(
+    "--repo",
+    "-r",
+    help="Repository path (for context-aware checks)",
+    exists=True,
+    file_okay=False,
+)
+
+
 @app.command()
 def check(
-    json_output: Annotated[
-        bool,
-        typer.Option(
-            "--json",
-            help="Output results as JSON",
-        ),
-    ] = False,
-    repo: Annotated[
-        Path | None,
-        typer.Option(
-            "--repo",
-            "-r",
-            help="Repository path (for context-aware checks)",
-            exists=True,
-            file_okay=False,
-        ),
-    ] = None,
+    json_output: Annotated[bool, _JSON_OPT] = False,
+    repo: Annotated[Path | None, _CHECK_REPO_OPT] = None,
 ) -> None:
     """Validate external tool availability.
 
@@ -145,8 +163,6 @@ def check(
         1: One or more required tools missing
         2: Only optional tools missing (warnings)
     """
-    import json as json_module
-
     from orisha.utils.preflight import PreflightChecker
 
     checker = PreflightChecker()
@@ -170,10 +186,12 @@ def check(
         llm_api_key=llm_api_key,
         llm_api_base=llm_api_base,
         llm_model=llm_model,
+        max_cache_age=0,
+        config_path=_config.config_path if _config else None,
     )
 
     if json_output:
-        typer.echo(json_module.dumps(result.to_dict(), indent=2))
+        typer.echo(_dumps_json(result.to_dict()))
     else:
         # Human-readable output
         typer.echo("\n🔍 Preflight Check Results\n")
@@ -211,62 +229,51 @@ def check(
 # =============================================================================
 
 
+# write options
+_OUTPUT_OPT = typer.Option(
+    "--output",
+    "-o",
+    help="Output file path (overrides config)",
+)
+_WRITE_FORMAT_OPT = typer.Option(
+    "--format",
+    "-f",
+    help="Output format: markdown, html, confluence",
+)
+_WRITE_REPO_OPT = typer.Option(
+    "--repo",
+    "-r",
+    help="Repository path to analyze",
+    exists=True,
+    file_okay=False,
+)
+_SKIP_SBOM_OPT = typer.Option(
+    "--skip-sbom",
+    help="Skip SBOM generation",
+)
+_SKIP_ARCHITECTURE_OPT = typer.Option(
+    "--skip-architecture",
+    help="Skip architecture diagram generation",
+)
+_SKIP_LLM_OPT = typer.Option(
+    "--skip-llm",
+    help="Skip LLM summary generation (use placeholder text instead)",
+)
+_DRY_RUN_OPT = typer.Option(
+    "--dry-run",
+    help="Preview output without writing files",
+)
+
+
 @app.command()
 def write(
-    output: Annotated[
-        Path | None,
-        typer.Option(
-            "--output",
-            "-o",
-            help="Output file path (overrides config)",
-        ),
-    ] = None,
-    format: Annotated[
-        str | None,
-        typer.Option(
-            "--format",
-            "-f",
-            help="Output format: markdown, html, confluence",
-        ),
-    ] = None,
-    repo: Annotated[
-        Path,
-        typer.Option(
-            "--repo",
-            "-r",
-            help="Repository path to analyze",
-            exists=True,
-            file_okay=False,
-        ),
-    ] = Path("."),
-    skip_sbom: Annotated[
-        bool,
-        typer.Option(
-            "--skip-sbom",
-            help="Skip SBOM generation",
-        ),
-    ] = False,
-    skip_architecture: Annotated[
-        bool,
-        typer.Option(
-            "--skip-architecture",
-            help="Skip architecture diagram generation",
-        ),
-    ] = False,
-    skip_llm: Annotated[
-        bool,
-        typer.Option(
-            "--skip-llm",
-            help="Skip LLM summary generation (use placeholder text instead)",
-        ),
-    ] = False,
-    dry_run: Annotated[
-        bool,
-        typer.Option(
-            "--dry-run",
-            help="Preview output without writing files",
-        ),
-    ] = False,
+    output: Annotated[Path | None, _OUTPUT_OPT] = None,
+    format: Annotated[str | None, _WRITE_FORMAT_OPT] = None,
+    repo: Annotated[Path, _WRITE_REPO_OPT] = Path("."),
+    skip_sbom: Annotated[bool, _SKIP_SBOM_OPT] = False,
+    skip_architecture: Annotated[bool, _SKIP_ARCHITECTURE_OPT] = False,
+    skip_llm: Annotated[bool, _SKIP_LLM_OPT] = False,
+    dry_run: Annotated[bool, _DRY_RUN_OPT] = False,
 ) -> None:
     """Generate documentation for a repository.
 
@@ -305,7 +312,7 @@ def write(
         raise typer.Exit(1)
 
     # Run preflight checks (Principle III: Preflight Validation)
-    from orisha.utils.preflight import PreflightChecker
+    from orisha.utils.preflight import PREFLIGHT_CACHE_TTL_SECONDS, PreflightChecker
 
     _logger.info("Running preflight checks...")
     checker = PreflightChecker()
@@ -320,6 +327,8 @@ def write(
         skip_sbom=skip_sbom,
         skip_architecture=skip_architecture,
         skip_llm=skip_llm,
+        max_cache_age=PREFLIGHT_CACHE_TTL_SECONDS,
+        config_path=_config.config_path if _config else None,
     )
 
     if not preflight_result.success:
@@ -411,105 +420,28 @@ def write(
 # =============================================================================
 
 
-def _generate_config_yaml(
-    llm_provider: str,
-    llm_model: str,
-    llm_api_key: str | None,
-    llm_api_base: str,
-) -> str:
-    """Generate YAML configuration content.
-
-    Args:
-        llm_provider: LLM provider (ollama, claude, gemini, bedrock)
-        llm_model: Model identifier
-        llm_api_key: API key (may be env var reference like ${ANTHROPIC_API_KEY})
-        llm_api_base: API base URL (for Ollama)
-
-    Returns:
-        YAML configuration string
-    """
-    # Build LLM section based on provider
-    if llm_provider == "ollama":
-        llm_section = f'''llm:
-  provider: "ollama"
-  model: "{llm_model}"
-  api_base: "{llm_api_base}"
-  temperature: 0  # MUST be 0 for reproducibility (Principle II)
-  max_tokens: 4096'''
-    elif llm_provider in {"claude", "gemini"}:
-        api_key_line = f'  api_key: "{llm_api_key}"' if llm_api_key else f'  # api_key: "${{{"ANTHROPIC_API_KEY" if llm_provider == "claude" else "GOOGLE_API_KEY"}}}"'
-        llm_section = f'''llm:
-  provider: "{llm_provider}"
-  model: "{llm_model}"
-{api_key_line}
-  temperature: 0  # MUST be 0 for reproducibility (Principle II)
-  max_tokens: 4096'''
-    else:  # bedrock
-        llm_section = f'''llm:
-  provider: "bedrock"
-  model: "{llm_model}"
-  # AWS credentials loaded from environment or ~/.aws/credentials
-  temperature: 0  # MUST be 0 for reproducibility (Principle II)
-  max_tokens: 4096'''
-
-    return f'''# Orisha Configuration
-# Documentation: https://github.com/orisha/orisha
-
-# Output settings
-output:
-  path: "docs/SYSTEM.md"
-  format: "markdown"  # markdown, html, confluence
-
-# Tool selection (Principle V: Tool Agnosticism)
-tools:
-  sbom: "syft"           # SBOM tool: syft, trivy
-  diagrams: "terravision"  # Diagram tool: terravision
-
-# LLM settings (REQUIRED for generating documentation summaries)
-{llm_section}
-
-# Human section content (Principle VI: Human Annotation Persistence)
-# sections:
-#   overview:
-#     file: ".orisha/sections/overview.md"
-#     strategy: "prepend"  # prepend, append, replace
-#   security:
-#     file: ".orisha/sections/security.md"
-#     strategy: "append"
-
-# CI/CD settings
-ci:
-  fail_on_warning: false
-  json_output: false
-  timeout: 300
-'''
+# init options
+_INIT_FORMAT_OPT = typer.Option(
+    "--format",
+    "-f",
+    help="Config format: yaml or toml",
+)
+_FORCE_OPT = typer.Option(
+    "--force",
+    help="Overwrite existing config",
+)
+_NON_INTERACTIVE_OPT = typer.Option(
+    "--non-interactive",
+    "-y",
+    help="Use defaults without prompting",
+)
 
 
 @app.command()
 def init(
-    format: Annotated[
-        str,
-        typer.Option(
-            "--format",
-            "-f",
-            help="Config format: yaml or toml",
-        ),
-    ] = "yaml",
-    force: Annotated[
-        bool,
-        typer.Option(
-            "--force",
-            help="Overwrite existing config",
-        ),
-    ] = False,
-    non_interactive: Annotated[
-        bool,
-        typer.Option(
-            "--non-interactive",
-            "-y",
-            help="Use defaults without prompting",
-        ),
-    ] = False,
+    format: Annotated[str, _INIT_FORMAT_OPT] = "yaml",
+    force: Annotated[bool, _FORCE_OPT] = False,
+    non_interactive: Annotated[bool, _NON_INTERACTIVE_OPT] = False,
 ) -> None:
     """Initialize Orisha configuration.
 
@@ -610,7 +542,9 @@ def init(
 
     # Generate config content
     if format == "yaml":
-        config_content = _generate_config_yaml(
+        from orisha.config import generate_config_yaml
+
+        config_content = generate_config_yaml(
             llm_provider=llm_provider,
             llm_model=llm_model,
             llm_api_key=llm_api_key,
@@ -645,29 +579,41 @@ def init(
 # =============================================================================
 
 
+@cache
+def _get_jinja_env() -> "Environment":
+    """Get the Jinja2 environment used for template validation.
+
+    Built on first use (Environment setup compiles the lexer rules) and
+    reused for every later template.
+    """
+    from jinja2 import Environment
+
+    return Environment()
+
+
+# validate arguments
+_TEMPLATE_ARG = typer.Argument(
+    help="Path to Jinja2 template to validate",
+    exists=True,
+    dir_okay=False,
+)
+
+
 @app.command()
 def validate(
-    template: Annotated[
-        Path,
-        typer.Argument(
-            help="Path to Jinja2 template to validate",
-            exists=True,
-            dir_okay=False,
-        ),
-    ],
+    template: Annotated[Path, _TEMPLATE_ARG],
 ) -> None:
     """Validate a Jinja2 template.
 
     Checks syntax and reports unsupported placeholders.
     """
-    from jinja2 import Environment, TemplateSyntaxError
+    from jinja2 import TemplateSyntaxError
 
     _logger.info(f"Validating template: {template}")
 
     try:
-        env = Environment()
         template_content = template.read_text()
-        env.parse(template_content)
+        _get_jinja_env().parse(template_content)
 
         _logger.info("Template syntax is valid")
         typer.echo(f"✅ Template is valid: {template}")
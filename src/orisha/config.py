@@ -9,20 +9,72 @@ Configuration file discovery (in priority order):
 3. ./orisha.yaml
 """
 
+import hashlib
+import json
 import os
 import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+# libyaml-backed loader when PyYAML was built with it (the PyPI wheels are),
+# several times faster than the pure-Python SafeLoader
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+# Format version of cached parsed config files; bump to ignore old entries
+CONFIG_CACHE_VERSION = 1
+
+# Most parsed config files kept on disk; the least recently written go first
+CONFIG_CACHE_MAX_ENTRIES = 32
+
+# Supported LLM providers
+_VALID_LLM_PROVIDERS = frozenset({"claude", "gemini", "ollama", "bedrock"})
+
+# Cloud LLM providers that need an API key (Bedrock uses AWS credentials)
+_CLOUD_LLM_PROVIDERS = frozenset({"claude", "gemini"})
+
+# Ways of merging a human-authored section into generated content
+_VALID_MERGE_STRATEGIES = frozenset({"replace", "prepend", "append"})
+
+# Keys read from each config file section (anything else is ignored)
+_OUTPUT_KEYS = frozenset({"path", "format"})
+_TOOLS_KEYS = frozenset({"sbom", "diagrams"})
+_LLM_KEYS = frozenset(
+    {"provider", "model", "api_key", "api_base", "temperature", "max_tokens", "enabled"}
+)
+_SECTION_KEYS = frozenset({"file", "strategy"})
+_CI_KEYS = frozenset({"fail_on_warning", "json_output", "timeout"})
+
+# Environment variable reference in a config value: ${VAR_NAME}
+_ENV_VAR_RE = re.compile(r"\$\{([^}]+)\}")
+
+
+def _replace_env_var(match: re.Match[str]) -> str:
+    """Get the value of the environment variable named by a ${VAR} match."""
+    var_name = match.group(1)
+    env_value = os.environ.get(var_name)
+    if env_value is None:
+        raise ValueError(f"Environment variable not set: {var_name}")
+    return env_value
+
+
+def _known_keys(section_data: dict[str, Any], keys: frozenset[str]) -> dict[str, Any]:
+    """Select the recognised keys of a config section (dataclass defaults fill the rest)."""
+    return {key: value for key, value in section_data.items() if key in keys}
+
+
 # =============================================================================
 # Configuration Dataclasses
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class OutputConfig:
     """Output configuration.
 
@@ -35,7 +87,7 @@ class OutputConfig:
     format: str = "markdown"
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolConfig:
     """Tool selection configuration (Principle V: Tool Agnosticism).
 
@@ -52,7 +104,7 @@ class ToolConfig:
     code_packager: str = "repomix"
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMConfig:
     """LLM configuration.
 
@@ -86,12 +138,13 @@ class LLMConfig:
             )
 
         # Validate provider
-        valid_providers = {"claude", "gemini", "ollama", "bedrock"}
-        if self.provider not in valid_providers:
-            raise ValueError(f"Invalid LLM provider: {self.provider}. Valid: {valid_providers}")
+        if self.provider not in _VALID_LLM_PROVIDERS:
+            raise ValueError(
+                f"Invalid LLM provider: {self.provider}. Valid: {sorted(_VALID_LLM_PROVIDERS)}"
+            )
 
         # API key required for cloud providers (except bedrock which uses AWS credentials)
-        if self.provider in {"claude", "gemini"} and not self.api_key:
+        if self.provider in _CLOUD_LLM_PROVIDERS and not self.api_key:
             raise ValueError(f"API key required for {self.provider}")
 
         # API base defaults for Ollama
@@ -104,7 +157,7 @@ class LLMConfig:
         return self.provider == "ollama"
 
 
-@dataclass
+@dataclass(slots=True)
 class SectionConfig:
     """Configuration for a human-authored section (Principle VI).
 
@@ -118,12 +171,14 @@ class SectionConfig:
 
     def __post_init__(self) -> None:
         """Validate section configuration."""
-        valid_strategies = {"replace", "prepend", "append"}
-        if self.strategy not in valid_strategies:
-            raise ValueError(f"Invalid merge strategy: {self.strategy}. Valid: {valid_strategies}")
+        if self.strategy not in _VALID_MERGE_STRATEGIES:
+            raise ValueError(
+                f"Invalid merge strategy: {self.strategy}. "
+                f"Valid: {sorted(_VALID_MERGE_STRATEGIES)}"
+            )
 
 
-@dataclass
+@dataclass(slots=True)
 class CIConfig:
     """CI/CD-specific configuration.
 
@@ -138,7 +193,7 @@ class CIConfig:
     timeout: int = 300
 
 
-@dataclass
+@dataclass(slots=True)
 class OrishaConfig:
     """Top-level Orisha configuration.
 
@@ -185,25 +240,39 @@ def substitute_env_vars(value: Any) -> Any:
         Value with environment variables substituted
     """
     if isinstance(value, str):
-        # Pattern: ${VAR_NAME}
-        pattern = re.compile(r"\$\{([^}]+)\}")
-
-        def replace_var(match: re.Match[str]) -> str:
-            var_name = match.group(1)
-            env_value = os.environ.get(var_name)
-            if env_value is None:
-                raise ValueError(f"Environment variable not set: {var_name}")
-            return env_value
-
-        return pattern.sub(replace_var, value)
-
-    elif isinstance(value, dict):
-        return {k: substitute_env_vars(v) for k, v in value.items()}
-
-    elif isinstance(value, list):
-        return [substitute_env_vars(v) for v in value]
-
-    return value
+        return _substitute_str(value)
+    if not isinstance(value, dict | list):
+        return value
+
+    # Walk nested containers with an explicit stack rather than recursion,
+    # building copies (the parsed config is memoized, so it must not be
+    # mutated in place)
+    root: dict[Any, Any] | list[Any] = {} if isinstance(value, dict) else [None] * len(value)
+    stack = [(value, root)]
+    while stack:
+        source, target = stack.pop()
+        items = source.items() if isinstance(source, dict) else enumerate(source)
+        for key, item in items:
+            if isinstance(item, str):
+                target[key] = _substitute_str(item)
+            elif isinstance(item, dict):
+                target[key] = child = {}
+                stack.append((item, child))
+            elif isinstance(item, list):
+                target[key] = child = [None] * len(item)
+                stack.append((item, child))
+            else:
+                target[key] = item
+
+    return root
+
+
+def _substitute_str(value: str) -> str:
+    """Substitute environment variables in a single string."""
+    # Most values reference no variables, so skip the regex entirely
+    if "${" not in value:
+        return value
+    return _ENV_VAR_RE.sub(_replace_env_var, value)
 
 
 # =============================================================================
@@ -247,6 +316,145 @@ def find_config_file(start_path: Path | None = None) -> Path | None:
 # =============================================================================
 
 
+def get_cache_dir() -> Path:
+    """Get the per-user directory for Orisha's caches.
+
+    Returns:
+        `$XDG_CACHE_HOME/orisha`, defaulting to `~/.cache/orisha`
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "orisha"
+
+
+def get_config_cache_dir() -> Path:
+    """Get the directory holding parsed config files.
+
+    Returns:
+        `$XDG_CACHE_HOME/orisha/config`, defaulting to `~/.cache/orisha/config`
+    """
+    return get_cache_dir() / "config"
+
+
+def _read_config_file(path: Path, use_cache: bool = True) -> Any:
+    """Parse a YAML config file, reusing an earlier parse if the file is unchanged.
+
+    The raw parsed data (before environment variable substitution) is
+    memoized in-process and cached as JSON on disk per config path, both
+    keyed by mtime and size. Files holding a literal API key are never cached
+    on disk. Cache read or write failures fall back to parsing the file.
+
+    Args:
+        path: Config file path
+        use_cache: Whether to use the in-process memo and the on-disk cache
+
+    Returns:
+        Parsed YAML data (shared between calls; callers must not mutate it)
+    """
+    if not use_cache:
+        with open(path) as f:
+            return yaml.load(f, Loader=_YamlLoader)
+
+    resolved = path.resolve()
+    stat = resolved.stat()
+    return _load_config_data(str(resolved), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=8)
+def _load_config_data(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a config file, or load its parse from the on-disk cache.
+
+    Memoized on (path, mtime, size), so loading an unchanged file again in
+    the same process costs only a stat.
+
+    Args:
+        path: Resolved config file path
+        mtime_ns: File modification time in nanoseconds
+        size: File size in bytes
+
+    Returns:
+        Parsed YAML data
+    """
+    cache_key = hashlib.blake2b(path.encode(), digest_size=16).hexdigest()
+    cache_file = get_config_cache_dir() / f"{cache_key}.json"
+
+    try:
+        cached = json.loads(cache_file.read_bytes())
+        if (
+            cached["version"] == CONFIG_CACHE_VERSION
+            and cached["path"] == path
+            and cached["mtime_ns"] == mtime_ns
+            and cached["size"] == size
+        ):
+            return cached["data"]
+    except (OSError, ValueError, TypeError, KeyError):
+        pass
+
+    with open(path) as f:
+        data = yaml.load(f, Loader=_YamlLoader)
+
+    # A literal API key must not be copied out of the config file
+    if _has_literal_api_key(data):
+        return data
+
+    # Only cache data that survives a JSON round trip unchanged (YAML also
+    # allows dates, sets and non-string keys)
+    try:
+        payload = json.dumps(
+            {
+                "version": CONFIG_CACHE_VERSION,
+                "path": path,
+                "mtime_ns": mtime_ns,
+                "size": size,
+                "data": data,
+            }
+        )
+        if json.loads(payload)["data"] == data:
+            tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+            cache_file.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w") as f:
+                f.write(payload)
+            os.replace(tmp_file, cache_file)
+            _prune_config_cache(cache_file.parent)
+    except (OSError, TypeError, ValueError):
+        pass
+
+    return data
+
+
+def _prune_config_cache(cache_dir: Path) -> None:
+    """Bound the parsed config cache after a new entry is written.
+
+    Entries whose config file no longer exists (or that cannot be read) are
+    removed, then the oldest beyond CONFIG_CACHE_MAX_ENTRIES.
+
+    Args:
+        cache_dir: Directory holding parsed config files
+    """
+    entries: list[tuple[int, Path]] = []
+    for cache_file in cache_dir.glob("*.json"):
+        try:
+            if os.path.exists(json.loads(cache_file.read_bytes())["path"]):
+                entries.append((cache_file.stat().st_mtime_ns, cache_file))
+                continue
+        except (OSError, ValueError, TypeError, KeyError):
+            pass
+        cache_file.unlink(missing_ok=True)
+
+    entries.sort(reverse=True)
+    for _, cache_file in entries[CONFIG_CACHE_MAX_ENTRIES:]:
+        cache_file.unlink(missing_ok=True)
+
+
+def _has_literal_api_key(data: Any) -> bool:
+    """Check whether parsed config data sets llm.api_key to anything but a ${VAR} reference."""
+    llm_data = data.get("llm") if isinstance(data, dict) else None
+    api_key = llm_data.get("api_key") if isinstance(llm_data, dict) else None
+    if api_key is None:
+        return False
+    return not (isinstance(api_key, str) and _ENV_VAR_RE.fullmatch(api_key))
+
+
 def load_config_from_dict(data: dict[str, Any]) -> OrishaConfig:
     """Load configuration from a dictionary.
 
@@ -263,50 +471,27 @@ def load_config_from_dict(data: dict[str, Any]) -> OrishaConfig:
 
     # Output config
     if "output" in data:
-        output_data = data["output"]
-        config.output = OutputConfig(
-            path=output_data.get("path", config.output.path),
-            format=output_data.get("format", config.output.format),
-        )
+        config.output = OutputConfig(**_known_keys(data["output"], _OUTPUT_KEYS))
 
     # Tools config
     if "tools" in data:
-        tools_data = data["tools"]
-        config.tools = ToolConfig(
-            sbom=tools_data.get("sbom", config.tools.sbom),
-            diagrams=tools_data.get("diagrams", config.tools.diagrams),
-        )
+        config.tools = ToolConfig(**_known_keys(data["tools"], _TOOLS_KEYS))
 
     # LLM config (always present - LLM is required)
     if "llm" in data:
-        llm_data = data["llm"]
-        config.llm = LLMConfig(
-            provider=llm_data.get("provider", "ollama"),
-            model=llm_data.get("model", "llama3.2"),
-            api_key=llm_data.get("api_key"),
-            api_base=llm_data.get("api_base"),
-            temperature=llm_data.get("temperature", 0),
-            max_tokens=llm_data.get("max_tokens", 4096),
-            enabled=llm_data.get("enabled", True),
-        )
+        config.llm = LLMConfig(**_known_keys(data["llm"], _LLM_KEYS))
 
     # Sections config
     if "sections" in data:
         for section_id, section_data in data["sections"].items():
             if isinstance(section_data, dict):
                 config.sections[section_id] = SectionConfig(
-                    file=section_data.get("file", ""),
-                    strategy=section_data.get("strategy", "append"),
+                    **{"file": "", **_known_keys(section_data, _SECTION_KEYS)}
                 )
 
     # CI config
     if "ci" in data:
-        ci_data = data["ci"]
-        config.ci = CIConfig(
-            fail_on_warning=ci_data.get("fail_on_warning", False),
-            json_output=ci_data.get("json_output", False),
-            timeout=ci_data.get("timeout", 300),
-        )
+        config.ci = CIConfig(**_known_keys(data["ci"], _CI_KEYS))
 
     return config
 
@@ -314,12 +499,15 @@ def load_config_from_dict(data: dict[str, Any]) -> OrishaConfig:
 def load_config(
     config_path: Path | None = None,
     auto_discover: bool = True,
+    use_cache: bool = True,
 ) -> OrishaConfig:
     """Load configuration from file.
 
     Args:
         config_path: Explicit path to config file
         auto_discover: Whether to search for config file if not specified
+        use_cache: Whether to reuse the parsed config from an earlier run
+            while the file is unchanged
 
     Returns:
         OrishaConfig instance
@@ -339,8 +527,7 @@ def load_config(
 
     # Load config
     if found_path is not None:
-        with open(found_path) as f:
-            data = yaml.safe_load(f) or {}
+        data = _read_config_file(found_path, use_cache=use_cache) or {}
         config = load_config_from_dict(data)
         config._config_path = found_path
     else:
@@ -349,13 +536,9 @@ def load_config(
     return config
 
 
-def create_default_config() -> str:
-    """Create default configuration YAML content.
-
-    Returns:
-        YAML string with default configuration and comments
-    """
-    return '''# Orisha Configuration
+# Config file written by `orisha init`; {llm_section} is filled from
+# _LLM_SECTION_TEMPLATES (or _DEFAULT_LLM_SECTION)
+_CONFIG_YAML_TEMPLATE = """# Orisha Configuration
 # Documentation: https://github.com/orisha/orisha
 
 # Output settings
@@ -369,14 +552,7 @@ tools:
   diagrams: "terravision"  # Diagram tool: terravision
 
 # LLM settings (REQUIRED for generating documentation summaries)
-# Default: Ollama for security-conscious enterprises (no data leaves machine)
-llm:
-  provider: "ollama"     # ollama (local/secure), claude, gemini
-  model: "llama3.2"      # Model to use
-  # api_key: "${ANTHROPIC_API_KEY}"  # Required for claude/gemini
-  api_base: "http://localhost:11434"  # Ollama server URL
-  temperature: 0         # MUST be 0 for reproducibility (Principle II)
-  max_tokens: 4096
+{llm_section}
 
 # Human section content (Principle VI: Human Annotation Persistence)
 # sections:
@@ -392,4 +568,83 @@ ci:
   fail_on_warning: false
   json_output: false
   timeout: 300
-'''
+"""
+
+# Provider-specific LLM sections (format fields: provider, model, api_base,
+# api_key_line)
+_LLM_SECTION_TEMPLATES = {
+    "ollama": """llm:
+  provider: "ollama"
+  model: "{model}"
+  api_base: "{api_base}"
+  temperature: 0  # MUST be 0 for reproducibility (Principle II)
+  max_tokens: 4096""",
+    "claude": """llm:
+  provider: "{provider}"
+  model: "{model}"
+{api_key_line}
+  temperature: 0  # MUST be 0 for reproducibility (Principle II)
+  max_tokens: 4096""",
+    "bedrock": """llm:
+  provider: "bedrock"
+  model: "{model}"
+  # AWS credentials loaded from environment or ~/.aws/credentials
+  temperature: 0  # MUST be 0 for reproducibility (Principle II)
+  max_tokens: 4096""",
+}
+_LLM_SECTION_TEMPLATES["gemini"] = _LLM_SECTION_TEMPLATES["claude"]
+
+# Environment variable suggested for the API key of each cloud provider
+_API_KEY_ENV_VARS = {"claude": "ANTHROPIC_API_KEY", "gemini": "GOOGLE_API_KEY"}
+
+# LLM section of the default config (documents the alternatives)
+_DEFAULT_LLM_SECTION = """# Default: Ollama for security-conscious enterprises (no data leaves machine)
+llm:
+  provider: "ollama"     # ollama (local/secure), claude, gemini
+  model: "llama3.2"      # Model to use
+  # api_key: "${ANTHROPIC_API_KEY}"  # Required for claude/gemini
+  api_base: "http://localhost:11434"  # Ollama server URL
+  temperature: 0         # MUST be 0 for reproducibility (Principle II)
+  max_tokens: 4096"""
+
+
+def create_default_config() -> str:
+    """Create default configuration YAML content.
+
+    Returns:
+        YAML string with default configuration and comments
+    """
+    return _CONFIG_YAML_TEMPLATE.format(llm_section=_DEFAULT_LLM_SECTION)
+
+
+def generate_config_yaml(
+    llm_provider: str,
+    llm_model: str,
+    llm_api_key: str | None,
+    llm_api_base: str,
+) -> str:
+    """Generate YAML configuration content for a chosen LLM provider.
+
+    Args:
+        llm_provider: LLM provider (ollama, claude, gemini, bedrock)
+        llm_model: Model identifier
+        llm_api_key: API key (may be env var reference like ${ANTHROPIC_API_KEY})
+        llm_api_base: API base URL (for Ollama)
+
+    Returns:
+        YAML configuration string
+    """
+    if llm_api_key:
+        api_key_line = f'  api_key: "{llm_api_key}"'
+    else:
+        api_key_line = f'  # api_key: "${{{_API_KEY_ENV_VARS.get(llm_provider, "")}}}"'
+
+    llm_section = _LLM_SECTION_TEMPLATES.get(
+        llm_provider, _LLM_SECTION_TEMPLATES["bedrock"]
+    ).format(
+        provider=llm_provider,
+        model=llm_model,
+        api_base=llm_api_base,
+        api_key_line=api_key_line,
+    )
+    return _CONFIG_YAML_TEMPLATE.format(llm_section=llm_section)
@@ -4,6 +4,7 @@ Standard architecture format produced by all diagram/infrastructure tool adapter
 Uses a hybrid format: adjacency list for connections plus node metadata dict.
 """
 
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
@@ -79,6 +80,32 @@ class CanonicalGraph:
         if to_node not in self.connections[from_node]:
             self.connections[from_node].append(to_node)
 
+    def add_nodes(self, nodes: Iterable[tuple[str, NodeMetadata]]) -> None:
+        """Add multiple (node_id, metadata) pairs to the graph in one call."""
+        new_nodes = dict(nodes)
+        self.nodes.update(new_nodes)
+        providers = self.cloud_providers
+        for metadata in new_nodes.values():
+            if metadata.provider not in providers:
+                providers.append(metadata.provider)
+
+    def add_connections_from(self, from_node: str, to_nodes: Iterable[str]) -> None:
+        """Add connections from one node to several targets.
+
+        Stores the target list directly in the adjacency list instead of going
+        through per-edge (from, to) pairs. Duplicate connections are ignored.
+        """
+        existing = self.connections.get(from_node)
+        if existing is None:
+            # dict.fromkeys drops duplicates while keeping first-seen order
+            targets = list(dict.fromkeys(to_nodes))
+            if targets:
+                self.connections[from_node] = targets
+            return
+        for to_node in to_nodes:
+            if to_node not in existing:
+                existing.append(to_node)
+
     def get_node_ids(self) -> list[str]:
         """Get all node IDs in the graph."""
         return list(self.nodes.keys())
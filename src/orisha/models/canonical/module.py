@@ -74,10 +74,12 @@ class EntryPoint:
     method: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ExternalIntegration:
     """Represents a detected external service integration.
 
+    Uses __slots__, so instances carry no per-instance attribute dict.
+
     Attributes:
         name: Service/library name (e.g., "PostgreSQL", "Redis")
         type: Type of integration (database, http, queue, cache, storage)
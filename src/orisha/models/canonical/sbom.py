@@ -4,6 +4,7 @@ Standard SBOM format produced by all SBOM tool adapters (Syft, Trivy, etc.).
 The rest of the codebase MUST only consume this format, never tool-specific output.
 """
 
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Any
@@ -100,13 +101,17 @@ class CanonicalSBOM:
         """Add a package to the SBOM."""
         self.packages.append(package)
 
+    def add_packages(self, packages: Iterable[CanonicalPackage]) -> None:
+        """Add several packages to the SBOM at once."""
+        self.packages.extend(packages)
+
     def get_packages_by_ecosystem(self, ecosystem: str) -> list[CanonicalPackage]:
         """Get all packages for a specific ecosystem."""
         return [p for p in self.packages if p.ecosystem == ecosystem]
 
     def get_unique_ecosystems(self) -> list[str]:
         """Get list of unique ecosystems in this SBOM."""
-        return sorted(set(p.ecosystem for p in self.packages))
+        return sorted({p.ecosystem for p in self.packages})
 
     def get_direct_packages(self) -> list[CanonicalPackage]:
         """Get only direct dependencies (declared in manifest files).
@@ -132,7 +137,7 @@ class CanonicalSBOM:
     @property
     def direct_package_count(self) -> int:
         """Return number of direct dependencies."""
-        return len(self.get_direct_packages())
+        return sum(1 for p in self.packages if p.is_direct)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
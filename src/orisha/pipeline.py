@@ -19,9 +19,13 @@ from orisha.analyzers import (
     setup_default_adapters,
 )
 from orisha.analyzers.diagrams.mermaid import generate_module_flowchart
-from orisha.analyzers.entry_points import detect_entry_points
+from orisha.analyzers.entry_points import (
+    ENTRY_POINT_CACHE_FILE,
+    detect_entry_points,
+    find_source_files,
+)
 from orisha.analyzers.import_graph import build_import_graph
-from orisha.analyzers.integrations import detect_external_integrations
+from orisha.analyzers.integrations import INTEGRATION_CACHE_FILE, detect_external_integrations
 from orisha.analyzers.config_context import collect_config_context
 from orisha.analyzers.module_detector import detect_modules
 from orisha.config import OrishaConfig
@@ -344,6 +348,11 @@ class AnalysisPipeline:
             if options.fail_fast:
                 raise
 
+        # One walk of the source tree, shared by the import graph, entry point
+        # and integration detection, which all scan the same files. It lists
+        # every source file, so the detectors' scan caches drop deleted files.
+        source_files = find_source_files(repo_path)
+
         # Build import graph (requires AST result)
         import_graph = None
         if result.source_analysis:
@@ -352,6 +361,7 @@ class AnalysisPipeline:
                     repo_path,
                     result.source_analysis,
                     detected_modules,
+                    source_files,
                 )
                 logger.info(
                 "Built import graph: %d nodes, %d edges",
@@ -370,9 +380,18 @@ class AnalysisPipeline:
                 if options.fail_fast:
                     raise
 
+        # Persist scan results only where the repo already keeps Orisha state
+        orisha_dir = repo_path / ".orisha"
+        use_scan_cache = orisha_dir.is_dir()
+
         # Detect entry points
         try:
-            entry_points = detect_entry_points(repo_path)
+            entry_points = detect_entry_points(
+                repo_path,
+                source_files,
+                cache_path=orisha_dir / ENTRY_POINT_CACHE_FILE if use_scan_cache else None,
+                complete=True,
+            )
             result.entry_points = entry_points
             logger.info("Detected %d entry points", len(entry_points))
         except Exception as e:
@@ -389,7 +408,12 @@ class AnalysisPipeline:
 
         # Detect external integrations
         try:
-            integrations = detect_external_integrations(repo_path)
+            integrations = detect_external_integrations(
+                repo_path,
+                source_files,
+                cache_path=orisha_dir / INTEGRATION_CACHE_FILE if use_scan_cache else None,
+                complete=True,
+            )
             result.external_integrations = integrations
             logger.info(
                 "Detected %d external integrations", len(integrations)
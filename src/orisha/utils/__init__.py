@@ -3,11 +3,18 @@
 - logging: Standardized logging with human/verbose/JSON modes
 - preflight: External tool availability checks (Principle III)
 - version: Version history tracking (SC-011)
+
+Exports are imported on first access so that importing a single utility
+module (e.g. orisha.utils.logging) does not load the others.
 """
 
-from orisha.utils.logging import get_logger, setup_logging
-from orisha.utils.preflight import PreflightChecker, PreflightResult
-from orisha.utils.version import VersionTracker
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from orisha.utils.logging import get_logger, setup_logging
+    from orisha.utils.preflight import PreflightChecker, PreflightResult
+    from orisha.utils.version import VersionTracker
 
 __all__ = [
     "get_logger",
@@ -16,3 +23,20 @@ __all__ = [
     "PreflightResult",
     "VersionTracker",
 ]
+
+# Lazily imported exports: attribute name -> defining module
+_LAZY_EXPORTS = {
+    "get_logger": "orisha.utils.logging",
+    "setup_logging": "orisha.utils.logging",
+    "PreflightChecker": "orisha.utils.preflight",
+    "PreflightResult": "orisha.utils.preflight",
+    "VersionTracker": "orisha.utils.version",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import an export on first access (PEP 562)."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module_name), name)
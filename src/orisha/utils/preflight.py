@@ -7,13 +7,35 @@ NO FALLBACKS: If a required dependency is unavailable, analysis MUST fail immedi
 This prevents partial/degraded results and ensures consistent, reproducible output.
 """
 
+import hashlib
 import importlib.util
+import json
+import os
 import shutil
 import subprocess
+import sys
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
 from typing import Any
 
+# Upper bound on preflight checks run at once (most spawn a process or make
+# a network request, so they spend their time waiting)
+MAX_PREFLIGHT_WORKERS = 8
+
+# How long a successful preflight result may be reused by a later run
+# (covers `orisha check` followed straight away by `orisha write`)
+PREFLIGHT_CACHE_TTL_SECONDS = 5.0
+
+# Bump when the cached preflight result layout changes
+PREFLIGHT_CACHE_VERSION = 1
+
+# Executables whose location and mtime are part of the preflight cache key
+_CACHE_KEY_TOOLS = ("git", "syft", "repomix", "npx", "terravision", "dot")
+
 
 @dataclass
 class ToolCheck:
@@ -82,6 +104,138 @@ class PreflightResult:
             "warnings": self.warnings,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "PreflightResult":
+        """Create from dictionary (inverse of to_dict)."""
+        return cls(
+            success=data["success"],
+            checks=[ToolCheck(**c) for c in data["checks"]],
+            errors=list(data["errors"]),
+            warnings=list(data["warnings"]),
+        )
+
+
+def get_preflight_cache_path() -> Path:
+    """Get the file holding the most recent successful preflight result.
+
+    Returns:
+        `preflight.json` in the per-user Orisha cache directory
+    """
+    from orisha.config import get_cache_dir
+
+    return get_cache_dir() / "preflight.json"
+
+
+def _preflight_cache_key(inputs: dict[str, Any]) -> str:
+    """Build the cache key for a preflight run.
+
+    Covers the check inputs, the interpreter (for the Python package checks),
+    PATH, and the location and mtime of each external tool, so installing,
+    upgrading or removing a tool invalidates the cached result.
+
+    Args:
+        inputs: check_all arguments that affect which checks run and how
+
+    Returns:
+        Hex digest (the inputs, including any API key, are not stored)
+    """
+    tools: dict[str, list[Any] | None] = {}
+    for tool in _CACHE_KEY_TOOLS:
+        path = shutil.which(tool)
+        try:
+            tools[tool] = [path, os.stat(path).st_mtime_ns] if path else None
+        except OSError:
+            tools[tool] = [path, None]
+
+    payload = json.dumps(
+        {
+            "inputs": inputs,
+            "python": sys.executable,
+            "path": os.environ.get("PATH", ""),
+            "tools": tools,
+        },
+        sort_keys=True,
+    )
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+def _file_digest(path: Path) -> str | None:
+    """Hash a file's contents for a cache key.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        Hex digest, or None if the file cannot be read
+    """
+    try:
+        return hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest()
+    except OSError:
+        return None
+
+
+def _load_cached_result(key: str, max_age: float) -> PreflightResult | None:
+    """Load the cached preflight result if it matches key and is fresh enough.
+
+    Args:
+        key: Cache key for this run
+        max_age: Maximum age of the cached result in seconds
+
+    Returns:
+        Cached PreflightResult, or None on a miss or unreadable cache
+    """
+    try:
+        cached = json.loads(get_preflight_cache_path().read_bytes())
+        age = time.time() - cached["created"]
+        if (
+            cached["version"] == PREFLIGHT_CACHE_VERSION
+            and cached["key"] == key
+            and 0 <= age < max_age
+        ):
+            return PreflightResult.from_dict(cached["result"])
+    except (OSError, ValueError, TypeError, KeyError):
+        pass
+    return None
+
+
+def _store_cached_result(key: str, result: PreflightResult) -> None:
+    """Atomically replace the cached preflight result.
+
+    Cache write failures are ignored; the next run simply checks again.
+
+    Args:
+        key: Cache key for this run
+        result: Successful preflight result
+    """
+    cache_file = get_preflight_cache_path()
+    payload = json.dumps(
+        {
+            "version": PREFLIGHT_CACHE_VERSION,
+            "key": key,
+            "created": time.time(),
+            "result": result.to_dict(),
+        }
+    )
+    try:
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file.write_text(payload)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
+
+
+def _run_in_order(checks: list[Callable[[], ToolCheck]]) -> list[ToolCheck]:
+    """Run a group of dependent checks one after another.
+
+    Args:
+        checks: Checks in the order they must run
+
+    Returns:
+        Check results in the same order
+    """
+    return [run_check() for run_check in checks]
+
 
 class PreflightChecker:
     """Validates external tool availability before analysis.
@@ -809,6 +963,8 @@ class PreflightChecker:
         skip_ast: bool = False,
         skip_llm: bool = False,
         skip_repomix: bool = False,
+        max_cache_age: float | None = None,
+        config_path: Path | None = None,
     ) -> PreflightResult:
         """Run all preflight checks.
 
@@ -829,47 +985,98 @@ class PreflightChecker:
             skip_ast: Whether AST analysis will be skipped
             skip_llm: Whether LLM validation will be skipped
             skip_repomix: Whether Repomix compression will be skipped
+            max_cache_age: Reuse a cached successful result younger than this
+                many seconds and cache a successful result of this run (0 only
+                caches). None disables the cache.
+            config_path: Config file the other arguments were read from; its
+                contents are part of the cache key
 
         Returns:
             PreflightResult with all check results
         """
-        result = PreflightResult()
+        cache_key = None
+        if max_cache_age is not None:
+            cache_key = _preflight_cache_key(
+                {
+                    "repo_path": str(repo_path.resolve()) if repo_path else None,
+                    "config": _file_digest(config_path) if config_path else None,
+                    "sbom_tool": sbom_tool,
+                    "diagram_tool": diagram_tool,
+                    "code_packager": code_packager,
+                    "llm_provider": llm_provider,
+                    "llm_api_key": llm_api_key,
+                    # Same default as check_llm_provider, so callers passing
+                    # None and the explicit default share a cache entry
+                    "llm_api_base": llm_api_base or "http://localhost:11434",
+                    "llm_model": llm_model,
+                    "skip_sbom": skip_sbom,
+                    "skip_architecture": skip_architecture,
+                    "skip_ast": skip_ast,
+                    "skip_llm": skip_llm,
+                    "skip_repomix": skip_repomix,
+                    "timeout": self.timeout,
+                }
+            )
+            if max_cache_age > 0:
+                cached = _load_cached_result(cache_key, max_cache_age)
+                if cached is not None:
+                    return cached
+
+        # Groups of checks; a check that depends on another shares its group
+        # and runs after it
+        groups: list[list[Callable[[], ToolCheck]]] = []
 
         # Git is always required
-        result.add_check(self.check_git(required=True))
+        groups.append([partial(self.check_git, required=True)])
 
         # tree-sitter is required for AST parsing (no fallback)
         if not skip_ast:
-            result.add_check(self.check_tree_sitter(required=True))
+            groups.append([partial(self.check_tree_sitter, required=True)])
 
         # SBOM tool
         if not skip_sbom and sbom_tool == "syft":
-            result.add_check(self.check_syft(required=True))
+            groups.append([partial(self.check_syft, required=True)])
 
         # Repomix for codebase compression (required for holistic LLM analysis)
         if not skip_repomix:
-            result.add_check(self.check_repomix(required=True))
+            groups.append([partial(self.check_repomix, required=True)])
 
         # Diagram tool - always required unless explicitly skipped
         if not skip_architecture:
             if diagram_tool == "terravision":
-                result.add_check(self.check_terravision(required=True))
-                result.add_check(self.check_graphviz(required=True))
+                groups.append([partial(self.check_terravision, required=True)])
+                groups.append([partial(self.check_graphviz, required=True)])
 
         # LLM - required for generating documentation summaries
         # Uses LiteLLM as unified interface (per research.md)
         if not skip_llm:
-            # First check LiteLLM package is installed
-            result.add_check(self.check_litellm(required=True))
-
-            # Then check provider-specific requirements with actual connectivity test
-            result.add_check(
-                self.check_llm_provider(
-                    provider=llm_provider,
-                    api_key=llm_api_key,
-                    api_base=llm_api_base,
-                    model=llm_model,
-                )
+            groups.append(
+                [
+                    # First check LiteLLM package is installed
+                    partial(self.check_litellm, required=True),
+                    # Then check provider-specific requirements with actual
+                    # connectivity test, which goes through LiteLLM
+                    partial(
+                        self.check_llm_provider,
+                        provider=llm_provider,
+                        api_key=llm_api_key,
+                        api_base=llm_api_base,
+                        model=llm_model,
+                    ),
+                ]
             )
 
+        # The groups are independent and mostly wait on subprocesses or the
+        # network, so run them concurrently; results keep the order above
+        result = PreflightResult()
+        with ThreadPoolExecutor(max_workers=min(MAX_PREFLIGHT_WORKERS, len(groups))) as executor:
+            for checks in executor.map(_run_in_order, groups):
+                for check in checks:
+                    result.add_check(check)
+
+        # Only successful results are cached, so a fix made straight after a
+        # failed check is always picked up
+        if cache_key is not None and result.success:
+            _store_cached_result(cache_key, result)
+
         return result
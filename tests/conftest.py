@@ -12,6 +12,22 @@ from typing import Any
 
 import pytest
 
+from orisha.analyzers.base import clear_tool_locations
+
+
+@pytest.fixture(autouse=True)
+def _clear_tool_locations() -> None:
+    """Start each test without executable paths remembered by earlier tests."""
+    clear_tool_locations()
+
+
+@pytest.fixture(autouse=True)
+def _isolate_cache_home(
+    monkeypatch: pytest.MonkeyPatch, tmp_path_factory: pytest.TempPathFactory
+) -> None:
+    """Keep Orisha's per-user caches out of the real ~/.cache during tests."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path_factory.mktemp("cache_home")))
+
 # =============================================================================
 # Path Fixtures
 # =============================================================================
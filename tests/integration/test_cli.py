@@ -217,6 +217,24 @@ class TestOrishaCheck:
         check_names = [c.get("name", "") for c in data["checks"]]
         assert "git" in check_names
 
+    @pytest.mark.parametrize("have_orjson", [True, False])
+    def test_json_output_encoders_agree(
+        self, have_orjson: bool, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test --json output is the same JSON with or without orjson installed."""
+        from orisha.cli import _dumps_json
+
+        data = {"success": True, "checks": [{"name": "git", "version": None}], "errors": []}
+        if have_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setitem(sys.modules, "orjson", None)
+
+        output = _dumps_json(data)
+
+        assert json.loads(output) == data
+        assert output.startswith('{\n  "success": true')
+
     def test_check_exit_codes(self) -> None:
         """Test that check returns appropriate exit codes."""
         result = runner.invoke(app, ["check"])
@@ -310,3 +328,46 @@ class TestOrishaValidate:
 
         assert result.exit_code == 1
         assert "error" in result.output.lower()
+
+    def test_validate_reuses_environment(self, tmp_path: Path) -> None:
+        """Test that repeated validations share one Jinja2 environment."""
+        from orisha.cli import _get_jinja_env
+
+        template = tmp_path / "test.md.j2"
+        template.write_text("# {{ title }}")
+
+        runner.invoke(app, ["validate", str(template)])
+        env = _get_jinja_env()
+        result = runner.invoke(app, ["validate", str(template)])
+
+        assert result.exit_code == 0
+        assert _get_jinja_env() is env
+
+
+class TestOrishaVersion:
+    """Integration tests for `orisha --version`."""
+
+    def test_version_output(self) -> None:
+        """Test that --version prints the version and exits cleanly."""
+        result = runner.invoke(app, ["--version"])
+
+        assert result.exit_code == 0
+        assert result.output.startswith("orisha ")
+
+    def test_version_skips_config_and_tool_imports(self) -> None:
+        """Test that --version does not import config loading or preflight modules."""
+        code = (
+            "import sys\n"
+            "from orisha.cli import app\n"
+            "try:\n"
+            "    app(['--version'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print(sorted({'orisha.config', 'orisha.utils.preflight'} & set(sys.modules)))\n"
+        )
+
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.splitlines()[-1] == "[]"
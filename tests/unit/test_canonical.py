@@ -40,6 +40,20 @@ class TestCanonicalSBOM:
         assert sbom.package_count == 1
         assert sbom.get_unique_ecosystems() == ["npm"]
 
+    def test_add_packages(self) -> None:
+        """Test adding several packages to SBOM at once, keeping order."""
+        sbom = CanonicalSBOM(packages=[CanonicalPackage(name="flask", ecosystem="pypi")])
+
+        sbom.add_packages(
+            CanonicalPackage(name=name, ecosystem="npm", is_direct=name == "express")
+            for name in ("express", "lodash")
+        )
+
+        assert [p.name for p in sbom.packages] == ["flask", "express", "lodash"]
+        assert sbom.package_count == 3
+        assert sbom.direct_package_count == 1
+        assert sbom.get_unique_ecosystems() == ["npm", "pypi"]
+
     def test_get_packages_by_ecosystem(self) -> None:
         """Test filtering packages by ecosystem."""
         sbom = CanonicalSBOM(packages=[
@@ -220,6 +234,31 @@ class TestCanonicalArchitecture:
         assert graph.connection_count == 1
         assert "aws" in graph.cloud_providers
 
+    def test_add_nodes_bulk(self) -> None:
+        """Test bulk node insertion."""
+        graph = CanonicalGraph()
+
+        graph.add_nodes([
+            ("aws_s3_bucket.data", NodeMetadata(type="aws_s3_bucket", provider="aws")),
+            ("google_compute_instance.vm", NodeMetadata(
+                type="google_compute_instance", provider="gcp",
+            )),
+        ])
+
+        assert graph.node_count == 2
+        assert graph.cloud_providers == ["aws", "gcp"]
+
+    def test_add_connections_from(self) -> None:
+        """Test adding a node's adjacency list in one call."""
+        graph = CanonicalGraph()
+
+        graph.add_connections_from("a", ["b", "c", "b"])
+        graph.add_connections_from("a", ["c", "d"])
+        graph.add_connections_from("e", [])
+
+        assert graph.connections == {"a": ["b", "c", "d"]}
+        assert graph.connection_count == 3
+
     def test_multi_cloud(self) -> None:
         """Test multi-cloud architecture."""
         graph = CanonicalGraph()
@@ -1,13 +1,20 @@
 """Unit tests for configuration system."""
 
+import json
+import os
 from pathlib import Path
 
 import pytest
+import yaml
 
+from orisha import config as config_module
 from orisha.config import (
     LLMConfig,
     SectionConfig,
+    create_default_config,
     find_config_file,
+    generate_config_yaml,
+    load_config,
     load_config_from_dict,
     substitute_env_vars,
 )
@@ -52,11 +59,45 @@ class TestSubstituteEnvVars:
 
         assert result == ["static", "value"]
 
+    def test_substitute_nested_without_mutating_input(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test nested containers are substituted into copies, leaving the input intact."""
+        monkeypatch.setenv("ITEM", "value")
+
+        data = {"a": [{"b": "${ITEM}", "c": 1}, ["${ITEM}"]], "d": {"e": None}}
+        result = substitute_env_vars(data)
+
+        assert result == {"a": [{"b": "value", "c": 1}, ["value"]], "d": {"e": None}}
+        assert data["a"][0]["b"] == "${ITEM}"
+
+    def test_deeply_nested_config(self) -> None:
+        """Test nesting deeper than the recursion limit is handled."""
+        data: dict = {}
+        node = data
+        for _ in range(5000):
+            node["child"] = node = {}
+
+        result = substitute_env_vars(data)
+
+        depth = 0
+        while result:
+            result = result["child"]
+            depth += 1
+        assert depth == 5000
+
     def test_missing_env_var_raises(self) -> None:
         """Test that missing env var raises ValueError."""
         with pytest.raises(ValueError, match="Environment variable not set"):
             substitute_env_vars("${NONEXISTENT_VAR}")
 
+    def test_strings_without_references_unchanged(self) -> None:
+        """Test strings without a ${VAR} reference are returned as-is."""
+        value = "costs $5 {per} month"
+
+        assert substitute_env_vars(value) is value
+        assert substitute_env_vars({"a": [{"b": value}]}) == {"a": [{"b": value}]}
+
     def test_passthrough_non_string(self) -> None:
         """Test that non-string values pass through unchanged."""
         assert substitute_env_vars(123) == 123
@@ -102,6 +143,23 @@ class TestFindConfigFile:
 
         assert result == orisha_config
 
+    def test_orisha_dir_without_config_falls_back_to_root(self, tmp_path: Path) -> None:
+        """Test an .orisha directory without config.yaml does not hide orisha.yaml."""
+        (tmp_path / ".orisha").mkdir()
+        (tmp_path / ".orisha" / "other.yaml").write_text("# unrelated")
+        root_config = tmp_path / "orisha.yaml"
+        root_config.write_text("# fallback")
+
+        result = find_config_file(tmp_path)
+
+        assert result == root_config
+
+    def test_missing_start_path_returns_none(self, tmp_path: Path) -> None:
+        """Test returns None when the start directory does not exist."""
+        result = find_config_file(tmp_path / "missing")
+
+        assert result is None
+
     def test_no_config_returns_none(self, tmp_path: Path) -> None:
         """Test returns None when no config found."""
         result = find_config_file(tmp_path)
@@ -174,6 +232,26 @@ class TestLoadConfigFromDict:
         assert config.sections["overview"].file == ".orisha/sections/overview.md"
         assert config.sections["overview"].strategy == "prepend"
 
+    def test_unknown_keys_ignored_and_missing_keys_default(self) -> None:
+        """Test unrecognised keys are dropped and omitted keys take the defaults."""
+        config = load_config_from_dict(
+            {
+                "output": {"format": "html", "colour": "blue"},
+                "llm": {"model": "llama2", "top_p": 0.5},
+                "sections": {"overview": {"strategy": "replace", "owner": "docs"}},
+                "ci": {"timeout": 60, "retries": 3},
+            }
+        )
+
+        assert config.output.path == "docs/SYSTEM.md"
+        assert config.output.format == "html"
+        assert config.llm.provider == "ollama"
+        assert config.llm.model == "llama2"
+        assert config.sections["overview"].file == ""
+        assert config.sections["overview"].strategy == "replace"
+        assert config.ci.timeout == 60
+        assert config.ci.fail_on_warning is False
+
 
 class TestLLMConfig:
     """Tests for LLM configuration validation."""
@@ -232,3 +310,195 @@ class TestSectionConfig:
         for strategy in ["prepend", "append", "replace"]:
             config = SectionConfig(file="test.md", strategy=strategy)
             assert config.strategy == strategy
+
+
+class TestGenerateConfigYaml:
+    """Tests for the config files written by `orisha init`."""
+
+    @pytest.mark.parametrize("provider", ["ollama", "claude", "gemini", "bedrock"])
+    def test_generated_config_loads(self, provider: str) -> None:
+        """Test each provider's generated config parses back to its settings."""
+        content = generate_config_yaml(
+            llm_provider=provider,
+            llm_model="some-model",
+            llm_api_key="literal-key",
+            llm_api_base="http://localhost:11434",
+        )
+
+        config = load_config_from_dict(yaml.safe_load(content))
+
+        assert config.llm.provider == provider
+        assert config.llm.model == "some-model"
+        assert config.llm.temperature == 0
+
+    def test_api_key_placeholder_commented_out(self) -> None:
+        """Test a missing API key leaves a commented env var hint."""
+        content = generate_config_yaml("gemini", "gemini-pro", None, "")
+
+        assert '  # api_key: "${GOOGLE_API_KEY}"' in content
+        assert yaml.safe_load(content)["llm"].get("api_key") is None
+
+    def test_default_config_loads(self) -> None:
+        """Test the default config parses to the default settings."""
+        config = load_config_from_dict(yaml.safe_load(create_default_config()))
+
+        assert config.llm.provider == "ollama"
+        assert config.output.path == "docs/SYSTEM.md"
+
+
+class TestLoadConfig:
+    """Tests for loading configuration files."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_config_memo(self) -> None:
+        """Start each test without config parses memoized by earlier tests."""
+        config_module._load_config_data.cache_clear()
+
+    @pytest.mark.parametrize("loader", [yaml.SafeLoader, config_module._YamlLoader])
+    def test_load_config_file(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path, loader: type
+    ) -> None:
+        """Test a config file loads the same with the C and pure-Python YAML loaders."""
+        monkeypatch.setattr(config_module, "_YamlLoader", loader)
+        config_file = tmp_path / "orisha.yaml"
+        config_file.write_text(
+            "output:\n  path: out/SYSTEM.md\n  format: html\n"
+            "tools:\n  sbom: syft\n"
+        )
+
+        config = load_config(config_path=config_file)
+
+        assert config.output.path == "out/SYSTEM.md"
+        assert config.output.format == "html"
+        assert config.tools.sbom == "syft"
+        assert config.config_path == config_file
+
+    def test_load_empty_config_file(self, tmp_path: Path) -> None:
+        """Test an empty config file gives the defaults."""
+        config_file = tmp_path / "orisha.yaml"
+        config_file.write_text("")
+
+        config = load_config(config_path=config_file)
+
+        assert config.output.path == "docs/SYSTEM.md"
+
+    def test_parsed_config_cached_until_file_changes(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Test an unchanged config file is not re-parsed, and a changed one is."""
+        config_file = tmp_path / "orisha.yaml"
+        config_file.write_text("output:\n  format: html\n")
+        parses: list[Path] = []
+        real_load = yaml.load
+        monkeypatch.setattr(
+            config_module.yaml,
+            "load",
+            lambda stream, Loader: parses.append(Path(stream.name)) or real_load(stream, Loader),
+        )
+
+        assert load_config(config_path=config_file).output.format == "html"
+        assert load_config(config_path=config_file).output.format == "html"
+        assert len(parses) == 1
+        assert len(list(config_module.get_config_cache_dir().glob("*.json"))) == 1
+
+        config_file.write_text("output:\n  format: confluence\n")
+        assert load_config(config_path=config_file).output.format == "confluence"
+        assert len(parses) == 2
+
+        load_config(config_path=config_file, use_cache=False)
+        assert len(parses) == 3
+
+    def test_env_vars_not_cached(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Test env var placeholders are cached unsubstituted and resolved on each load."""
+        config_file = tmp_path / "orisha.yaml"
+        config_file.write_text("output:\n  path: ${ORISHA_TEST_OUTPUT}\n")
+
+        monkeypatch.setenv("ORISHA_TEST_OUTPUT", "first.md")
+        assert load_config(config_path=config_file).output.path == "first.md"
+        monkeypatch.setenv("ORISHA_TEST_OUTPUT", "second.md")
+        assert load_config(config_path=config_file).output.path == "second.md"
+
+        (cache_file,) = config_module.get_config_cache_dir().glob("*.json")
+        assert "first.md" not in cache_file.read_text()
+
+    def test_literal_api_key_never_cached(self, tmp_path: Path) -> None:
+        """Test a config holding a literal API key is not copied into the cache."""
+        config_file = tmp_path / "orisha.yaml"
+        config_file.write_text('llm:\n  provider: claude\n  api_key: "sk-literal-secret"\n')
+
+        assert load_config(config_path=config_file).llm.api_key == "sk-literal-secret"
+
+        cache_dir = config_module.get_config_cache_dir()
+        cached = [p.read_text() for p in cache_dir.glob("*")] if cache_dir.exists() else []
+        assert not any("sk-literal-secret" in text for text in cached)
+
+    def test_api_key_reference_cached_privately(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Test a ${VAR} API key is cached unresolved in an owner-only file."""
+        config_file = tmp_path / "orisha.yaml"
+        config_file.write_text('llm:\n  provider: claude\n  api_key: "${ORISHA_TEST_KEY}"\n')
+        monkeypatch.setenv("ORISHA_TEST_KEY", "sk-from-env")
+
+        assert load_config(config_path=config_file).llm.api_key == "sk-from-env"
+
+        (cache_file,) = config_module.get_config_cache_dir().glob("*.json")
+        assert "sk-from-env" not in cache_file.read_text()
+        assert cache_file.stat().st_mode & 0o077 == 0
+        assert cache_file.parent.stat().st_mode & 0o077 == 0
+
+    def test_unreadable_cache_is_ignored(self, tmp_path: Path) -> None:
+        """Test a corrupt cache entry falls back to parsing the file."""
+        config_file = tmp_path / "orisha.yaml"
+        config_file.write_text("output:\n  format: html\n")
+        load_config(config_path=config_file)
+        (cache_file,) = config_module.get_config_cache_dir().glob("*.json")
+        cache_file.write_text("{not json")
+        config_module._load_config_data.cache_clear()
+
+        assert load_config(config_path=config_file).output.format == "html"
+
+    def test_cache_evicts_deleted_and_oldest_entries(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Test writing an entry drops those of deleted files and the oldest beyond the cap."""
+        monkeypatch.setattr(config_module, "CONFIG_CACHE_MAX_ENTRIES", 2)
+        cache_dir = config_module.get_config_cache_dir()
+
+        def cached_paths() -> set[str]:
+            return {json.loads(f.read_text())["path"] for f in cache_dir.glob("*.json")}
+
+        config_files = [tmp_path / f"{name}.yaml" for name in ("a", "b", "c", "d")]
+        for config_file in config_files:
+            config_file.write_text("output:\n  format: html\n")
+        _, b, c, d = (str(f.resolve()) for f in config_files)
+
+        load_config(config_path=config_files[0])
+        config_files[0].unlink()
+        load_config(config_path=config_files[1])
+        assert cached_paths() == {b}
+
+        load_config(config_path=config_files[2])
+        for cache_file in cache_dir.glob("*.json"):
+            if json.loads(cache_file.read_text())["path"] == b:
+                os.utime(cache_file, ns=(0, 0))
+        load_config(config_path=config_files[3])
+        assert cached_paths() == {c, d}
+
+    def test_unchanged_file_memoized_in_process(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Test reloading an unchanged file in one process reads neither it nor the disk cache."""
+        config_file = tmp_path / "orisha.yaml"
+        config_file.write_text("output:\n  format: html\n")
+        assert load_config(config_path=config_file).output.format == "html"
+
+        def fail(*_: object, **__: object) -> None:
+            raise AssertionError("config was re-read")
+
+        monkeypatch.setattr(config_module.yaml, "load", fail)
+        monkeypatch.setattr(config_module.json, "loads", fail)
+
+        assert load_config(config_path=config_file).output.format == "html"
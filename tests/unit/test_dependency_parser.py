@@ -327,6 +327,30 @@ aws-cdk-lib
         assert resolver.is_direct("aws_cdk_lib", "pypi")
         assert resolver.is_direct("aws-cdk-lib", "pypi")
 
+    def test_as_set_matches_is_direct(
+        self, resolver: DirectDependencyResolver, tmp_path: Path
+    ) -> None:
+        """Test membership in as_set agrees with is_direct."""
+        (tmp_path / "requirements.txt").write_text("Flask\naws-cdk-lib\n")
+        (tmp_path / "package.json").write_text(
+            '{"dependencies": {"@nestjs/core": "^10.0.0", "express": "^4.18.0"}}'
+        )
+        resolver.resolve_from_directory(tmp_path)
+
+        direct = resolver.as_set()
+
+        for name, ecosystem in [
+            ("FLASK", "pypi"),
+            ("aws_cdk_lib", "pypi"),
+            ("werkzeug", "pypi"),
+            ("@nestjs/core", "npm"),
+            ("express", "npm"),
+            ("Express", "npm"),
+            ("express", "cargo"),
+        ]:
+            in_set = resolver.package_key(name, ecosystem) in direct
+            assert in_set == resolver.is_direct(name, ecosystem), (name, ecosystem)
+
     def test_npm_scoped_packages(self, resolver: DirectDependencyResolver, tmp_path: Path) -> None:
         """Test npm scoped package handling (T064f)."""
         pkg_json = tmp_path / "package.json"
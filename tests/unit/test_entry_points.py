@@ -4,7 +4,14 @@ from pathlib import Path
 
 import pytest
 
-from orisha.analyzers.entry_points import EntryPointDetector, detect_entry_points
+from orisha.analyzers import entry_points as entry_points_module
+from orisha.analyzers.entry_points import (
+    PARALLEL_SCAN_MIN_FILES,
+    EntryPointDetector,
+    detect_entry_points,
+    find_source_files,
+)
+from orisha.models.canonical.module import EntryPoint
 
 
 class TestEntryPointDetector:
@@ -142,6 +149,35 @@ if __name__ == "__main__":
         assert len(main_eps) == 1
         assert main_eps[0].name == "__main__"
 
+    def test_decorator_must_start_line(self, tmp_path: Path) -> None:
+        """Test indented decorators are found and commented-out ones are not."""
+        (tmp_path / "cli.py").write_text(
+            "# @app.command()\n"
+            "def disabled():\n"
+            "    pass\n"
+            "\n"
+            "class Commands:\n"
+            '\t@app.command("sync")\n'
+            "    def sync(self):\n"
+            "        pass\n"
+        )
+
+        entry_points = EntryPointDetector(tmp_path).detect_entry_points()
+
+        assert [(ep.name, ep.line) for ep in entry_points] == [("sync", 7)]
+
+    def test_main_block_requires_comparison(self, tmp_path: Path) -> None:
+        """Test only real __name__ == "__main__" comparisons are main blocks."""
+        (tmp_path / "tool.py").write_text(
+            '"""Runs when __name__ is __main__."""\n'
+            "if '__main__' == __name__:\n"
+            "    run()\n"
+        )
+
+        entry_points = EntryPointDetector(tmp_path).detect_entry_points()
+
+        assert [(ep.name, ep.line) for ep in entry_points] == [("__main__", 2)]
+
     def test_detect_express_endpoints(self, tmp_path: Path) -> None:
         """Test detecting Express.js endpoints."""
         express_file = tmp_path / "server.js"
@@ -336,3 +372,234 @@ def documented_command():
             # Should have extracted docstring
             ep = entry_points[0]
             assert ep.description is not None or ep.description == ""
+
+    def test_mixed_language_repository(self, tmp_path: Path) -> None:
+        """Test exact entry points detected across Python, JS, Go and Java files."""
+        (tmp_path / "api.py").write_text('''import typer
+from fastapi import APIRouter
+
+app = typer.Typer()
+router = APIRouter()
+
+
+@app.command()
+def hello(name: str):
+    """Say hello."""
+
+
+@cli.command("sync")
+async def sync_all():
+    \'\'\'Sync everything.\'\'\'
+
+
+@router.get("/items/{item_id}")
+@requires_auth
+async def read_item(item_id: int):
+    # comment
+    """Read one item."""
+
+
+@app.route("/health")
+def health():
+    return "ok"
+
+
+if __name__ == "__main__":
+    app()
+''')
+        (tmp_path / "server.js").write_text('''const express = require("express");
+const app = express();
+const router = express.Router();
+
+app.get("/users", (req, res) => res.send([]));
+router.post('/users/:id', handler);
+
+exports.handler = async (event) => event;
+''')
+        (tmp_path / "main.go").write_text('''package main
+
+func main() {
+\thttp.HandleFunc("/ping", ping)
+}
+''')
+        (tmp_path / "App.java").write_text('''public class App {
+    @GetMapping("/orders")
+    public List<Order> list() { return null; }
+
+    @RequestMapping
+    public void root() {}
+
+    public static void main(String[] args) {}
+}
+''')
+
+        entry_points = EntryPointDetector(tmp_path).detect_entry_points()
+
+        found = sorted(
+            (ep.file, ep.line, ep.name, ep.type, ep.method, ep.description)
+            for ep in entry_points
+        )
+        assert found == [
+            ("App.java", 2, "GET /orders", "api_endpoint", "GET", None),
+            ("App.java", 8, "main", "main", None, None),
+            ("api.py", 9, "hello", "cli_command", None, "Say hello."),
+            ("api.py", 14, "sync", "cli_command", None, "Sync everything."),
+            ("api.py", 20, "GET /items/{item_id}", "api_endpoint", "GET", "Read one item."),
+            ("api.py", 26, "/health", "api_endpoint", None, None),
+            ("api.py", 30, "__main__", "main", None, "Main entry point"),
+            ("main.go", 3, "main", "main", None, None),
+            ("main.go", 4, "/ping", "api_endpoint", None, None),
+            ("server.js", 5, "GET /users", "api_endpoint", "GET", None),
+            ("server.js", 6, "POST /users/:id", "api_endpoint", "POST", None),
+            ("server.js", 8, "handler", "handler", None, "Lambda/Cloud function handler"),
+        ]
+
+    def test_non_utf8_file_is_scanned(self, tmp_path: Path) -> None:
+        """Test files with invalid UTF-8 bytes are still scanned."""
+        (tmp_path / "legacy.py").write_bytes(
+            b'# caf\xe9\n@app.command("sync")\ndef sync():\n    pass\n'
+        )
+
+        entry_points = EntryPointDetector(tmp_path).detect_entry_points()
+
+        assert [(ep.name, ep.line) for ep in entry_points] == [("sync", 3)]
+
+    def test_memory_mapped_file_is_scanned(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test files above the mmap threshold give the same entry points."""
+        monkeypatch.setattr(entry_points_module, "MMAP_MIN_BYTES", 1)
+        (tmp_path / "cli.py").write_text(
+            "# padding\n" * 50
+            + '@app.command("sync")\ndef sync():\n    """Sync data."""\n'
+            + 'if __name__ == "__main__":\n    app()'
+        )
+        (tmp_path / "handler.js").write_text("// padding\n" * 5 + "exports.handler = fn;\n")
+
+        entry_points = EntryPointDetector(tmp_path).detect_entry_points()
+
+        assert sorted((ep.file, ep.line, ep.name, ep.description) for ep in entry_points) == [
+            ("cli.py", 52, "sync", "Sync data."),
+            ("cli.py", 54, "__main__", "Main entry point"),
+            ("handler.js", 6, "handler", "Lambda/Cloud function handler"),
+        ]
+
+    def test_skips_oversized_binary_and_generated_files(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test huge, binary and generated files are not scanned."""
+        monkeypatch.setattr(entry_points_module, "MAX_SCAN_FILE_BYTES", 64)
+        decorated = '@app.command("sync")\ndef sync():\n    pass\n'
+        (tmp_path / "cli.py").write_text(decorated)
+        (tmp_path / "big.py").write_text(decorated + "#" * 64)
+        (tmp_path / "blob.py").write_bytes(b"\0" + decorated.encode())
+        (tmp_path / "service_pb2.py").write_text(decorated)
+        (tmp_path / "app.min.js").write_text("exports.handler = fn;\n")
+
+        entry_points = EntryPointDetector(tmp_path).detect_entry_points()
+
+        assert [(ep.file, ep.name) for ep in entry_points] == [("cli.py", "sync")]
+
+    def test_cache_reuses_results_for_unchanged_files(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a persisted cache skips unchanged files and rescans changed ones."""
+        cache_path = tmp_path / ".orisha" / "entry_points_cache.json"
+        (tmp_path / "cli.py").write_text('@app.command("sync")\ndef sync():\n    pass\n')
+        (tmp_path / "old.py").write_text('if __name__ == "__main__":\n    main()\n')
+
+        first = detect_entry_points(tmp_path, cache_path=cache_path)
+        assert cache_path.exists()
+
+        scanned: list[Path] = []
+        detect_in_file = EntryPointDetector._detect_in_file
+
+        def recording_detect(self: EntryPointDetector, file_path: Path) -> list[EntryPoint]:
+            scanned.append(file_path)
+            return detect_in_file(self, file_path)
+
+        monkeypatch.setattr(EntryPointDetector, "_detect_in_file", recording_detect)
+
+        assert detect_entry_points(tmp_path, cache_path=cache_path) == first
+        assert scanned == []
+
+        (tmp_path / "cli.py").write_text('@app.command("push")\ndef push():\n    pass\n')
+        (tmp_path / "old.py").unlink()
+        entry_points = detect_entry_points(tmp_path, cache_path=cache_path)
+
+        assert scanned == [tmp_path / "cli.py"]
+        assert [ep.name for ep in entry_points] == ["push"]
+        assert "old.py" not in cache_path.read_text()
+
+    def test_complete_file_list_prunes_cache(self, tmp_path: Path) -> None:
+        """Test deleted files leave the cache only when the file list is complete."""
+        cache_path = tmp_path / ".orisha" / "entry_points_cache.json"
+        (tmp_path / "cli.py").write_text('@app.command("sync")\ndef sync():\n    pass\n')
+        (tmp_path / "old.py").write_text('if __name__ == "__main__":\n    main()\n')
+        detect_entry_points(tmp_path, find_source_files(tmp_path), cache_path, complete=True)
+
+        (tmp_path / "old.py").unlink()
+        detect_entry_points(tmp_path, [tmp_path / "cli.py"], cache_path)
+        assert "old.py" in cache_path.read_text()
+
+        detect_entry_points(tmp_path, find_source_files(tmp_path), cache_path, complete=True)
+        assert "old.py" not in cache_path.read_text()
+
+    def test_unreadable_cache_is_ignored(self, tmp_path: Path) -> None:
+        """Test a corrupt or outdated cache file falls back to a full scan."""
+        (tmp_path / "cli.py").write_text('@app.command("sync")\ndef sync():\n    pass\n')
+        cache_path = tmp_path / "cache.json"
+
+        for stale in ("not json", '{"version": 0, "files": {"cli.py": [0, 0, []]}}'):
+            cache_path.write_text(stale)
+            entry_points = detect_entry_points(tmp_path, cache_path=cache_path)
+            assert [ep.name for ep in entry_points] == ["sync"]
+
+    def test_sequential_scan_reuses_detector(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test in-process scans use the calling detector instead of building one per file."""
+        for name in ("a.py", "b.py", "c.py"):
+            (tmp_path / name).write_text('@app.command("sync")\ndef sync():\n    pass\n')
+        detector = EntryPointDetector(tmp_path)
+        created: list[EntryPointDetector] = []
+        init = EntryPointDetector.__init__
+
+        def recording_init(self: EntryPointDetector, *args: object, **kwargs: object) -> None:
+            created.append(self)
+            init(self, *args, **kwargs)
+
+        monkeypatch.setattr(EntryPointDetector, "__init__", recording_init)
+
+        assert len(detector.detect_entry_points()) == 3
+        assert created == []
+
+    def test_parallel_scan_matches_sequential(self, tmp_path: Path) -> None:
+        """Test scans above the parallel threshold find the same entry points."""
+        for i in range(PARALLEL_SCAN_MIN_FILES + 8):
+            (tmp_path / f"cmd_{i}.py").write_text(
+                f'@app.command("cmd{i}")\ndef cmd_{i}():\n    pass\n'
+            )
+        detector = EntryPointDetector(tmp_path)
+        file_paths = sorted(tmp_path.glob("*.py"))
+
+        parallel = detector.detect_entry_points(file_paths)
+        sequential = detector.detect_entry_points(file_paths[:PARALLEL_SCAN_MIN_FILES])
+
+        assert len(parallel) == PARALLEL_SCAN_MIN_FILES + 8
+        assert parallel[:PARALLEL_SCAN_MIN_FILES] == sequential
+
+    def test_find_source_files_prunes_skip_dirs(self, tmp_path: Path) -> None:
+        """Test source discovery skips excluded directories and other extensions."""
+        (tmp_path / "app" / "api").mkdir(parents=True)
+        (tmp_path / "app" / "api" / "routes.py").write_text("")
+        (tmp_path / "server.ts").write_text("")
+        (tmp_path / "README.md").write_text("")
+        (tmp_path / "node_modules" / "pkg").mkdir(parents=True)
+        (tmp_path / "node_modules" / "pkg" / "index.js").write_text("")
+        (tmp_path / "tests").mkdir()
+        (tmp_path / "tests" / "test_app.py").write_text("")
+
+        files = EntryPointDetector(tmp_path)._find_source_files()
+
+        assert sorted(files) == [tmp_path / "app" / "api" / "routes.py", tmp_path / "server.ts"]
@@ -1,9 +1,13 @@
 """Unit tests for import graph builder."""
 
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any
 
 import pytest
 
+from orisha.analyzers import import_graph as import_graph_module
 from orisha.analyzers.import_graph import ImportGraphBuilder, build_import_graph
 from orisha.models.canonical.ast import CanonicalAST, CanonicalModule
 
@@ -234,3 +238,136 @@ class TestImportGraphBuilder:
 
         assert graph is not None
         assert len(graph.nodes) >= 0
+
+    def test_module_name_normalization_is_memoized(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test each distinct path is normalized once per builder."""
+        builder = ImportGraphBuilder(tmp_path)
+        calls: list[str] = []
+        resolve = builder._resolve_module_name
+
+        def counting_resolve(path: str) -> str | None:
+            calls.append(path)
+            return resolve(path)
+
+        monkeypatch.setattr(builder, "_resolve_module_name", counting_resolve)
+
+        absolute = str(tmp_path / "src" / "pkg" / "__init__.py")
+        assert builder._normalize_module_name(absolute) == "pkg"
+        assert builder._normalize_module_name(absolute) == "pkg"
+        assert builder._normalize_module_name("/elsewhere/mod.py") is None
+        assert builder._normalize_module_name("/elsewhere/mod.py") is None
+        assert calls == [absolute, "/elsewhere/mod.py"]
+
+    def test_internal_modules_include_parent_packages(self, tmp_path: Path) -> None:
+        """Test every parent package of an internal module is internal."""
+        (tmp_path / "pkg" / "sub").mkdir(parents=True)
+        (tmp_path / "pkg" / "sub" / "__init__.py").write_text("")
+        ast = CanonicalAST(
+            modules=[
+                CanonicalModule(
+                    name="a.b.c.d",
+                    path="src/a/b/c/d.py",
+                    language="python",
+                    imports=[],
+                ),
+            ],
+            classes=[],
+            functions=[],
+            entry_points=[],
+        )
+
+        internal = ImportGraphBuilder(tmp_path)._identify_internal_modules(ast)
+
+        assert internal == {"a", "a/b", "a/b/c", "a/b/c/d", "pkg.sub", "pkg/sub"}
+
+    def test_internal_packages_from_source_listing(self, tmp_path: Path) -> None:
+        """Test packages come from the given listing, skipping vendored trees."""
+        for pkg in ("app", ".venv/lib/requests"):
+            (tmp_path / pkg).mkdir(parents=True)
+            (tmp_path / pkg / "__init__.py").write_text("")
+        ast = CanonicalAST(modules=[], classes=[], functions=[], entry_points=[])
+        builder = ImportGraphBuilder(tmp_path)
+
+        assert builder._identify_internal_modules(ast) == {"app"}
+        assert builder._identify_internal_modules(
+            ast, source_files=[tmp_path / "core" / "__init__.py", tmp_path / "core" / "x.py"]
+        ) == {"core"}
+
+    def test_packages_under_test_and_build_dirs_not_discovered(self, tmp_path: Path) -> None:
+        """Test SKIP_DIRS packages are only internal when the AST has their modules."""
+        for pkg in ("app", "tests/helpers", "build/lib/app"):
+            (tmp_path / pkg).mkdir(parents=True)
+            (tmp_path / pkg / "__init__.py").write_text("")
+        builder = ImportGraphBuilder(tmp_path)
+
+        empty = CanonicalAST(modules=[], classes=[], functions=[], entry_points=[])
+        assert builder._identify_internal_modules(empty) == {"app"}
+
+        ast = CanonicalAST(
+            modules=[
+                CanonicalModule(
+                    name="tests.helpers.fixtures",
+                    path="tests/helpers/fixtures.py",
+                    language="python",
+                ),
+            ],
+            classes=[],
+            functions=[],
+            entry_points=[],
+        )
+        assert "tests/helpers" in builder._identify_internal_modules(ast)
+
+    def test_threaded_build_matches_sequential(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the thread pool path runs without the GIL and builds the same graph."""
+        ast = CanonicalAST(
+            modules=[
+                CanonicalModule(
+                    name=f"myapp.mod{i}",
+                    path=f"myapp/mod{i}.py",
+                    language="python",
+                    imports=[f"from myapp.mod{(i + 1) % 8} import x", "import os"],
+                )
+                for i in range(8)
+            ],
+            classes=[],
+            functions=[],
+            entry_points=[],
+        )
+        sequential = ImportGraphBuilder(tmp_path).build_import_graph(ast)
+
+        pools: list[ThreadPoolExecutor] = []
+
+        class RecordingExecutor(ThreadPoolExecutor):
+            def __init__(self, *args: Any, **kwargs: Any) -> None:
+                super().__init__(*args, **kwargs)
+                pools.append(self)
+
+        monkeypatch.setattr(import_graph_module, "ThreadPoolExecutor", RecordingExecutor)
+        monkeypatch.setattr(import_graph_module, "PARALLEL_MODULES_MIN", 0)
+        monkeypatch.setattr(sys, "_is_gil_enabled", lambda: True, raising=False)
+        ImportGraphBuilder(tmp_path).build_import_graph(ast)
+        assert pools == []
+
+        monkeypatch.setattr(sys, "_is_gil_enabled", lambda: False, raising=False)
+        threaded = ImportGraphBuilder(tmp_path).build_import_graph(ast)
+
+        assert len(pools) == 1
+        assert threaded.nodes == sequential.nodes
+        assert sorted(threaded.edges) == sorted(sequential.edges)
+        assert len(threaded.edges) == 8
+
+    def test_normalize_module_name_paths(self, tmp_path: Path) -> None:
+        """Test module names for relative, absolute and dotted paths."""
+        builder = ImportGraphBuilder(tmp_path)
+
+        assert builder._normalize_module_name("./src/orisha/cli.py") == "orisha/cli"
+        assert builder._normalize_module_name(f"{tmp_path}/lib/util/__init__.py") == "util"
+        assert builder._normalize_module_name(f"{tmp_path}-other/mod.py") is None
+        assert builder._normalize_module_name("web/app.component.ts") == "web/app.component"
+        assert builder._normalize_module_name("config/.env.py") == "config/.env"
+        assert builder._normalize_module_name("scripts/.hidden") == "scripts/.hidden"
+        assert builder._normalize_module_name("README.md") == "README.md"
@@ -4,6 +4,11 @@ from pathlib import Path
 
 import pytest
 
+from orisha.analyzers.entry_points import (
+    MMAP_MIN_BYTES,
+    PARALLEL_SCAN_MIN_FILES,
+    find_source_files,
+)
 from orisha.analyzers.integrations import IntegrationDetector, detect_external_integrations
 
 
@@ -310,3 +315,216 @@ requests.get("https://api.example.com")
         http_integrations = [i for i in integrations if i.type == "http"]
         # Should have 1 integration object (same service, library, type)
         assert len(http_integrations) == 1
+
+    def test_mixed_language_repository(self, tmp_path: Path) -> None:
+        """Test exact integrations detected across Python, TypeScript and Go files."""
+        (tmp_path / "svc").mkdir()
+        (tmp_path / "web").mkdir()
+        (tmp_path / "cmd").mkdir()
+        (tmp_path / "svc" / "clients.py").write_text(
+            "import requests\n"
+            "import redis\n"
+            "from sqlalchemy import create_engine\n"
+            "import boto3  # sqs client\n"
+            "\n"
+            'engine = create_engine("sqlite://")\n'
+            "cache = redis.Redis()\n"
+            "requests.get(url)\n"
+            'sqs.send_message(QueueUrl="q", MessageBody=body)\n'
+        )
+        (tmp_path / "svc" / "extra.py").write_text("import requests\nrequests.post(url)\n")
+        (tmp_path / "svc" / "llm.py").write_text(
+            "import litellm\n\nlitellm.completion(model=model, messages=messages)\n"
+        )
+        (tmp_path / "web" / "api.ts").write_text(
+            "import axios from 'axios';\n"
+            'const { PrismaClient } = require("prisma");\n'
+            "await prisma.user.findMany();\n"
+            'axios.get("/api");\n'
+        )
+        (tmp_path / "cmd" / "main.go").write_text(
+            "package main\n"
+            "\n"
+            'import "net/http"\n'
+            'import "database/sql"\n'
+            "\n"
+            "func main() {\n"
+            '\tdb, _ := sql.Open("postgres", "")\n'
+            '\thttp.Get("http://example.com")\n'
+            "}\n"
+        )
+
+        integrations = IntegrationDetector(tmp_path).detect_external_integrations()
+
+        found = sorted((i.name, i.type, i.library, i.locations) for i in integrations)
+        assert found == [
+            ("axios", "http", "axios", ["web/api.ts"]),
+            ("database/sql", "database", "database/sql", ["cmd/main.go"]),
+            ("litellm", "llm", "litellm", ["svc/llm.py"]),
+            ("net/http", "http", "net/http", ["cmd/main.go"]),
+            ("prisma", "database", "prisma", ["web/api.ts"]),
+            ("redis", "cache", "redis", ["svc/clients.py"]),
+            ("requests", "http", "requests", ["svc/clients.py", "svc/extra.py"]),
+            ("sqlalchemy", "database", "sqlalchemy", ["svc/clients.py"]),
+        ]
+
+    def test_sequential_scan_reuses_detector(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test in-process scans use the calling detector instead of building one per file."""
+        for name in ("a.py", "b.py", "c.py"):
+            (tmp_path / name).write_text("import requests\nrequests.get(url)\n")
+        detector = IntegrationDetector(tmp_path)
+        created: list[IntegrationDetector] = []
+        init = IntegrationDetector.__init__
+
+        def recording_init(self: IntegrationDetector, *args: object, **kwargs: object) -> None:
+            created.append(self)
+            init(self, *args, **kwargs)
+
+        monkeypatch.setattr(IntegrationDetector, "__init__", recording_init)
+
+        integrations = detector.detect_external_integrations()
+
+        assert [(i.name, i.locations) for i in integrations] == [
+            ("requests", ["a.py", "b.py", "c.py"])
+        ]
+        assert created == []
+
+    def test_parallel_scan_matches_sequential(self, tmp_path: Path) -> None:
+        """Test scans above the parallel threshold find the same integrations."""
+        for i in range(PARALLEL_SCAN_MIN_FILES + 8):
+            (tmp_path / f"client_{i}.py").write_text("import requests\nrequests.get(url)\n")
+        detector = IntegrationDetector(tmp_path)
+        file_paths = sorted(tmp_path.glob("*.py"))
+
+        parallel = detector.detect_external_integrations(file_paths)
+        sequential = detector.detect_external_integrations(file_paths[:PARALLEL_SCAN_MIN_FILES])
+
+        assert [i.name for i in parallel] == ["requests"]
+        assert len(parallel[0].locations) == PARALLEL_SCAN_MIN_FILES + 8
+        assert set(sequential[0].locations) <= set(parallel[0].locations)
+
+    def test_results_grouped_in_sorted_order(self, tmp_path: Path) -> None:
+        """Test integrations and their locations come out sorted regardless of scan order."""
+        (tmp_path / "b.py").write_text(
+            "import requests\nimport redis\nrequests.get(url)\nredis.Redis()\n"
+        )
+        (tmp_path / "a.py").write_text("import requests\nrequests.post(url)\n")
+        detector = IntegrationDetector(tmp_path)
+
+        integrations = detector.detect_external_integrations(
+            [tmp_path / "b.py", tmp_path / "a.py", tmp_path / "b.py"]
+        )
+
+        assert [(i.name, i.locations) for i in integrations] == [
+            ("redis", ["b.py"]),
+            ("requests", ["a.py", "b.py"]),
+        ]
+
+    def test_file_outside_repo_is_skipped(self, tmp_path: Path) -> None:
+        """Test a listed file outside the repository is skipped, not fatal."""
+        repo = tmp_path / "repo"
+        repo.mkdir()
+        (repo / "client.py").write_text("import requests\nrequests.get(url)\n")
+        outside = tmp_path / "outside.py"
+        outside.write_text("import redis\nredis.Redis()\n")
+
+        integrations = IntegrationDetector(repo).detect_external_integrations(
+            [outside, repo / "client.py"]
+        )
+
+        assert [(i.name, i.locations) for i in integrations] == [("requests", ["client.py"])]
+
+    def test_memory_mapped_and_binary_files(self, tmp_path: Path) -> None:
+        """Test large files are scanned in place and binary files are skipped."""
+        padding = "# filler\n" * (MMAP_MIN_BYTES // 9 + 1)
+        (tmp_path / "big.py").write_text(f"import requests\n{padding}requests.get(url)\n")
+        (tmp_path / "blob.py").write_bytes(b"\0import redis\nredis.Redis()\n")
+
+        integrations = IntegrationDetector(tmp_path).detect_external_integrations()
+
+        assert [(i.name, i.locations) for i in integrations] == [("requests", ["big.py"])]
+
+    def test_cache_reuses_results_for_unchanged_files(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a persisted cache skips unchanged files and rescans changed ones."""
+        cache_path = tmp_path / ".orisha" / "integrations_cache.json"
+        (tmp_path / "client.py").write_text("import requests\nrequests.get(url)\n")
+        (tmp_path / "cache.py").write_text("import redis\nredis.Redis()\n")
+
+        first = detect_external_integrations(tmp_path, cache_path=cache_path)
+        assert cache_path.exists()
+
+        scanned: list[Path] = []
+        detect_in_file = IntegrationDetector._detect_in_file
+
+        def recording_detect(
+            self: IntegrationDetector, file_path: Path
+        ) -> list[tuple[str, str, str]]:
+            scanned.append(file_path)
+            return detect_in_file(self, file_path)
+
+        monkeypatch.setattr(IntegrationDetector, "_detect_in_file", recording_detect)
+
+        assert detect_external_integrations(tmp_path, cache_path=cache_path) == first
+        assert scanned == []
+
+        (tmp_path / "client.py").write_text("import httpx\nhttpx.get(url)\n")
+        (tmp_path / "cache.py").unlink()
+        integrations = detect_external_integrations(tmp_path, cache_path=cache_path)
+
+        assert scanned == [tmp_path / "client.py"]
+        assert [(i.name, i.locations) for i in integrations] == [("httpx", ["client.py"])]
+        assert "cache.py" not in cache_path.read_text()
+
+    def test_complete_file_list_prunes_cache(self, tmp_path: Path) -> None:
+        """Test deleted files leave the cache only when the file list is complete."""
+        cache_path = tmp_path / ".orisha" / "integrations_cache.json"
+        (tmp_path / "client.py").write_text("import requests\nrequests.get(url)\n")
+        (tmp_path / "cache.py").write_text("import redis\nredis.Redis()\n")
+        detect_external_integrations(
+            tmp_path, find_source_files(tmp_path), cache_path, complete=True
+        )
+
+        (tmp_path / "cache.py").unlink()
+        detect_external_integrations(tmp_path, [tmp_path / "client.py"], cache_path)
+        assert "cache.py" in cache_path.read_text()
+
+        detect_external_integrations(
+            tmp_path, find_source_files(tmp_path), cache_path, complete=True
+        )
+        assert "cache.py" not in cache_path.read_text()
+
+    def test_unreadable_cache_is_ignored(self, tmp_path: Path) -> None:
+        """Test a corrupt or outdated cache file falls back to a full scan."""
+        (tmp_path / "client.py").write_text("import requests\nrequests.get(url)\n")
+        cache_path = tmp_path / "cache.json"
+
+        for stale in ("not json", '{"version": 0, "files": {"client.py": [0, 0, []]}}'):
+            cache_path.write_text(stale)
+            integrations = detect_external_integrations(tmp_path, cache_path=cache_path)
+            assert [i.name for i in integrations] == ["requests"]
+
+    def test_files_without_patterns_are_not_scanned(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test files whose language has no integration patterns are filtered out up front."""
+        (tmp_path / "Client.java").write_text("import requests;\nrequests.get(url);\n")
+        (tmp_path / "client.py").write_text("import requests\nrequests.get(url)\n")
+        scanned: list[Path] = []
+        detect_in_file = IntegrationDetector._detect_in_file
+
+        def recording_detect(
+            self: IntegrationDetector, file_path: Path
+        ) -> list[tuple[str, str, str]]:
+            scanned.append(file_path)
+            return detect_in_file(self, file_path)
+
+        monkeypatch.setattr(IntegrationDetector, "_detect_in_file", recording_detect)
+
+        integrations = IntegrationDetector(tmp_path).detect_external_integrations()
+
+        assert scanned == [tmp_path / "client.py"]
+        assert [i.name for i in integrations] == ["requests"]
@@ -5,6 +5,12 @@ from pathlib import Path
 import pytest
 
 from orisha.analyzers.module_detector import ModuleDetector, detect_modules
+from orisha.models.canonical.ast import (
+    CanonicalAST,
+    CanonicalClass,
+    CanonicalFunction,
+)
+from orisha.models.canonical.ast import CanonicalModule as ASTModule
 
 
 class TestModuleDetector:
@@ -120,6 +126,18 @@ class TestModuleDetector:
         assert len(modules) == 1
         assert modules[0].name == "valid_package"
 
+    def test_exclude_nested_and_egg_info_directories(self, tmp_path: Path) -> None:
+        """Test that skipped directories are excluded at any depth, including *.egg-info."""
+        for exclude_dir in ["shop/tests", "shop/vendor/lib", "shop.egg-info"]:
+            dir_path = tmp_path / exclude_dir
+            dir_path.mkdir(parents=True)
+            (dir_path / "module.py").write_text("pass")
+        (tmp_path / "shop" / "__init__.py").write_text("")
+
+        modules = ModuleDetector(tmp_path).detect_modules()
+
+        assert [(m.path, m.files) for m in modules] == [("shop", ["shop/__init__.py"])]
+
     def test_detect_module_files(self, tmp_path: Path) -> None:
         """Test that module files are correctly detected."""
         pkg = tmp_path / "mylib"
@@ -170,3 +188,102 @@ from .utils import helper_function
 
         assert len(modules) == 1
         assert len(modules[0].files) == 4  # __init__ + 3 modules
+
+    def test_mixed_language_repository(self, tmp_path: Path) -> None:
+        """Test exact modules detected and enriched in a mixed-language tree."""
+        for rel_path in (
+            "src/shop/__init__.py",
+            "src/shop/core.py",
+            "src/shop/api/routes.py",
+            "src/shop/api/schemas.py",
+            "web/index.ts",
+            "web/util.js",
+            "web/widget.tsx",
+            "cmd/main.go",
+            "Main.java",
+            "node_modules/lib/index.js",
+            "tests/test_core.py",
+            "app.egg-info/setup.py",
+            "README.md",
+        ):
+            (tmp_path / rel_path).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / rel_path).write_text("")
+        ast = CanonicalAST(
+            modules=[ASTModule(name="cmd", path="cmd", language="go", imports=["fmt"])],
+            classes=[
+                CanonicalClass(name="Engine", file="src/shop/core.py", line=1),
+                CanonicalClass(name="Engine", file="src/shop/core.py", line=9),
+                CanonicalClass(name="Orphan", file="scripts/tool.py", line=1),
+            ],
+            functions=[
+                CanonicalFunction(name="route", file="src/shop/api/routes.py", line=3),
+                CanonicalFunction(name="main", file="cmd/main.go", line=5),
+            ],
+        )
+
+        modules = ModuleDetector(tmp_path).detect_modules(ast)
+
+        found = sorted(
+            (m.path, m.name, m.language, m.files, m.classes, m.functions, m.imports)
+            for m in modules
+        )
+        assert found == [
+            (".", "root", "java", ["Main.java"], [], [], []),
+            ("cmd", "cmd", "go", ["cmd/main.go"], [], ["main"], ["fmt"]),
+            (
+                "src/shop",
+                "shop",
+                "python",
+                ["src/shop/__init__.py", "src/shop/core.py"],
+                ["Engine"],
+                [],
+                [],
+            ),
+            (
+                "src/shop/api",
+                "shop/api",
+                "python",
+                ["src/shop/api/routes.py", "src/shop/api/schemas.py"],
+                [],
+                ["route"],
+                [],
+            ),
+            (
+                "web",
+                "web",
+                "typescript",
+                ["web/index.ts", "web/util.js", "web/widget.tsx"],
+                [],
+                [],
+                [],
+            ),
+        ]
+
+    def test_detect_primary_language(self, detector: ModuleDetector, tmp_path: Path) -> None:
+        """Test the most common language wins, with ties going to the first seen."""
+
+        def language(*names: str) -> str | None:
+            module = detector._detect_module_from_directory(
+                "pkg", [tmp_path / "pkg" / name for name in names]
+            )
+            return module.language if module else None
+
+        assert language("a.go", "b.PY", "c.py") == "python"
+        assert language("a.ts", "b.go") == "typescript"
+        assert language("README.md") is None
+
+    def test_enrich_dedupes_names_in_first_seen_order(self, tmp_path: Path) -> None:
+        """Test names from several files of a module are deduplicated in AST order."""
+        (tmp_path / "shop").mkdir()
+        for name in ("__init__.py", "a.py", "b.py"):
+            (tmp_path / "shop" / name).write_text("")
+        ast = CanonicalAST(
+            functions=[
+                CanonicalFunction(name=name, file=f"shop/{file}", line=1)
+                for name, file in [("zeta", "b.py"), ("alpha", "a.py"), ("zeta", "a.py")]
+            ],
+        )
+
+        modules = ModuleDetector(tmp_path).detect_modules(ast)
+
+        assert [m.functions for m in modules] == [["zeta", "alpha"]]
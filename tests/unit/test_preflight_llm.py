@@ -1,8 +1,12 @@
 """Unit tests for LLM preflight checks (T023j)."""
 
+import threading
+import time
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-from orisha.utils.preflight import PreflightChecker, ToolCheck
+from orisha.utils import preflight as preflight_module
+from orisha.utils.preflight import PreflightChecker, PreflightResult, ToolCheck
 
 
 class TestLiteLLMCheck:
@@ -347,3 +351,156 @@ class TestCheckAllLLM:
 
             mock_litellm.assert_not_called()
             mock_provider.assert_not_called()
+
+
+class TestCheckAllConcurrency:
+    """Tests for running check_all's checks concurrently."""
+
+    def test_checks_run_concurrently_in_order(self) -> None:
+        """Test checks overlap in time but results keep their declared order."""
+        checker = PreflightChecker()
+        barrier = threading.Barrier(3, timeout=5)
+
+        def slow_check(name: str) -> ToolCheck:
+            # Only completes if all three checks are running at once
+            barrier.wait()
+            return ToolCheck(name=name, available=name != "syft")
+
+        with (
+            patch.object(checker, "check_git", lambda **_: slow_check("git")),
+            patch.object(checker, "check_syft", lambda **_: slow_check("syft")),
+            patch.object(checker, "check_repomix", lambda **_: slow_check("repomix")),
+        ):
+            result = checker.check_all(skip_architecture=True, skip_ast=True, skip_llm=True)
+
+        assert [c.name for c in result.checks] == ["git", "syft", "repomix"]
+        assert result.success is False
+        assert result.errors == ["Required tool not found: syft"]
+
+    def test_provider_check_runs_after_litellm_check(self) -> None:
+        """Test the LLM provider check starts only once the LiteLLM check has finished."""
+        checker = PreflightChecker()
+        events: list[str] = []
+
+        def litellm_check(**_: object) -> ToolCheck:
+            events.append("litellm started")
+            time.sleep(0.05)
+            events.append("litellm finished")
+            return ToolCheck(name="litellm", available=True)
+
+        def provider_check(**_: object) -> ToolCheck:
+            events.append("provider started")
+            return ToolCheck(name="ollama", available=True)
+
+        with (
+            patch.object(checker, "check_git", lambda **_: ToolCheck(name="git", available=True)),
+            patch.object(checker, "check_litellm", litellm_check),
+            patch.object(checker, "check_llm_provider", provider_check),
+        ):
+            result = checker.check_all(
+                sbom_tool="none", skip_architecture=True, skip_ast=True, skip_repomix=True
+            )
+
+        assert [c.name for c in result.checks] == ["git", "litellm", "ollama"]
+        assert events == ["litellm started", "litellm finished", "provider started"]
+
+
+class TestCheckAllCache:
+    """Tests for reusing a recent preflight result between runs."""
+
+    @staticmethod
+    def _run(checker: PreflightChecker, git_check: MagicMock, **kwargs) -> PreflightResult:
+        with (
+            patch.object(checker, "check_git", git_check),
+            patch.object(
+                checker, "check_repomix", lambda **_: ToolCheck(name="repomix", available=True)
+            ),
+        ):
+            return checker.check_all(
+                sbom_tool="none", skip_architecture=True, skip_ast=True, skip_llm=True, **kwargs
+            )
+
+    def test_recent_result_is_reused(self) -> None:
+        """Test a run within the TTL reuses the result written by an earlier run."""
+        checker = PreflightChecker()
+        git_check = MagicMock(
+            return_value=ToolCheck(name="git", available=True, version="git 2.43")
+        )
+
+        first = self._run(checker, git_check, max_cache_age=0)
+        second = self._run(checker, git_check, max_cache_age=5)
+
+        assert git_check.call_count == 1
+        assert second == first
+
+    def test_different_inputs_miss(self) -> None:
+        """Test changing a check input does not reuse the cached result."""
+        checker = PreflightChecker()
+        git_check = MagicMock(return_value=ToolCheck(name="git", available=True))
+
+        self._run(checker, git_check, max_cache_age=0)
+        self._run(checker, git_check, max_cache_age=5, llm_model="other-model")
+
+        assert git_check.call_count == 2
+
+    def test_different_repo_or_config_contents_miss(self, tmp_path: Path) -> None:
+        """Test another repository or an edited config file does not reuse the result."""
+        checker = PreflightChecker()
+        git_check = MagicMock(return_value=ToolCheck(name="git", available=True))
+        config_file = tmp_path / "orisha.yaml"
+        config_file.write_text("llm:\n  provider: ollama\n")
+        other_repo = tmp_path / "other"
+        other_repo.mkdir()
+
+        self._run(checker, git_check, max_cache_age=0, repo_path=tmp_path, config_path=config_file)
+        self._run(checker, git_check, max_cache_age=5, repo_path=tmp_path, config_path=config_file)
+        assert git_check.call_count == 1
+
+        self._run(checker, git_check, max_cache_age=5, repo_path=other_repo, config_path=config_file)
+        assert git_check.call_count == 2
+
+        self._run(checker, git_check, max_cache_age=0, repo_path=tmp_path, config_path=config_file)
+        config_file.write_text("llm:\n  provider: ollama\n  temperature: 0.5\n")
+        self._run(checker, git_check, max_cache_age=5, repo_path=tmp_path, config_path=config_file)
+        assert git_check.call_count == 4
+
+    def test_expired_result_is_not_reused(self) -> None:
+        """Test a cached result older than the TTL is ignored."""
+        checker = PreflightChecker()
+        git_check = MagicMock(return_value=ToolCheck(name="git", available=True))
+
+        with patch.object(preflight_module.time, "time", return_value=1000.0):
+            self._run(checker, git_check, max_cache_age=0)
+        with patch.object(preflight_module.time, "time", return_value=1010.0):
+            self._run(checker, git_check, max_cache_age=5)
+
+        assert git_check.call_count == 2
+
+    def test_failed_result_is_not_cached(self) -> None:
+        """Test a failing preflight run is never reused."""
+        checker = PreflightChecker()
+        git_check = MagicMock(return_value=ToolCheck(name="git", available=False))
+
+        self._run(checker, git_check, max_cache_age=5)
+        self._run(checker, git_check, max_cache_age=5)
+
+        assert git_check.call_count == 2
+        assert not preflight_module.get_preflight_cache_path().exists()
+
+    def test_cache_disabled_by_default(self) -> None:
+        """Test check_all neither reads nor writes the cache unless asked to."""
+        checker = PreflightChecker()
+        git_check = MagicMock(return_value=ToolCheck(name="git", available=True))
+
+        self._run(checker, git_check)
+
+        assert not preflight_module.get_preflight_cache_path().exists()
+
+    def test_api_key_not_stored(self) -> None:
+        """Test the cache file holds only a digest of the inputs."""
+        checker = PreflightChecker()
+        git_check = MagicMock(return_value=ToolCheck(name="git", available=True))
+
+        self._run(checker, git_check, max_cache_age=0, llm_api_key="sk-secret")
+
+        assert "sk-secret" not in preflight_module.get_preflight_cache_path().read_text()
@@ -1,5 +1,6 @@
 """Unit tests for ToolRegistry (T023l)."""
 
+import threading
 
 import pytest
 
@@ -232,6 +233,73 @@ class TestToolRegistry:
         assert availability["diagram"]["available"] is True
         assert availability["diagram"]["unavailable"] is False
 
+    def test_check_tool_availability_probes_concurrently(self) -> None:
+        """Test availability probes overlap instead of running one after another."""
+        barrier = threading.Barrier(2, timeout=5)
+
+        class SlowSBOMAdapter(MockSBOMAdapter):
+            def check_available(self) -> bool:
+                barrier.wait()
+                return True
+
+        class SlowDiagramGenerator(MockDiagramGenerator):
+            def check_available(self) -> bool:
+                barrier.wait()
+                return True
+
+        registry = ToolRegistry()
+        registry.register_sbom_adapter("slow", SlowSBOMAdapter)
+        registry.register_diagram_adapter("slow", SlowDiagramGenerator)
+
+        # Each probe waits for the other, so this only completes if both run at once
+        availability = registry.check_tool_availability()
+
+        assert availability == {"sbom": {"slow": True}, "diagram": {"slow": True}}
+
+    def test_check_tool_availability_failed_probe(self) -> None:
+        """Test an adapter that raises, or fails to load, is reported unavailable."""
+
+        class BrokenSBOMAdapter(MockSBOMAdapter):
+            def check_available(self) -> bool:
+                raise RuntimeError("probe failed")
+
+        def load_missing() -> type[SBOMAdapter]:
+            raise ImportError("adapter module missing")
+
+        registry = ToolRegistry()
+        registry.register_sbom_adapter("broken", BrokenSBOMAdapter)
+        registry.register_sbom_adapter("missing", load_missing)
+
+        availability = registry.check_tool_availability()
+
+        assert availability == {"sbom": {"broken": False, "missing": False}, "diagram": {}}
+
+    def test_registry_from_adapter_entries(self) -> None:
+        """Test a registry can be built pre-populated, with the last default winning."""
+        registry = ToolRegistry(
+            sbom_adapters=[
+                ("first", MockSBOMAdapter, True),
+                ("second", lambda: MockSBOMAdapterUnavailable, True),
+                ("third", MockSBOMAdapter, False),
+            ],
+            diagram_adapters=[("mock", MockDiagramGenerator, True)],
+        )
+
+        assert registry.list_sbom_adapters() == ["first", "second", "third"]
+        assert isinstance(registry.get_sbom_adapter(), MockSBOMAdapterUnavailable)
+        assert isinstance(registry.get_diagram_adapter(), MockDiagramGenerator)
+
+    def test_default_registry_matches_setup(self) -> None:
+        """Test the baked default registry matches registering the defaults."""
+        from orisha.analyzers import create_default_registry, setup_default_adapters
+
+        baked = create_default_registry()
+        registered = setup_default_adapters(ToolRegistry())
+
+        assert baked.get_metadata() == registered.get_metadata()
+        assert baked.get_metadata()["default_sbom"] == "syft"
+        assert baked.get_metadata()["default_diagram"] == "terravision"
+
     def test_get_metadata(self) -> None:
         """Test getting registry metadata."""
         registry = ToolRegistry()
@@ -281,3 +349,21 @@ class TestGlobalRegistry:
         assert isinstance(registry, ToolRegistry)
         assert len(registry.list_sbom_adapters()) == 0
         assert len(registry.list_diagram_adapters()) == 0
+
+    def test_sbom_adapter_factory_resolved_on_first_use(self) -> None:
+        """Test a registered factory is called once, when the adapter is first needed."""
+        registry = ToolRegistry()
+        calls: list[str] = []
+
+        def load_adapter() -> type[SBOMAdapter]:
+            calls.append("load")
+            return MockSBOMAdapter
+
+        registry.register_sbom_adapter("mock", load_adapter, is_default=True)
+        assert registry.list_sbom_adapters() == ["mock"]
+        assert calls == []
+
+        assert isinstance(registry.get_sbom_adapter(), MockSBOMAdapter)
+        assert isinstance(registry.get_sbom_adapter("mock"), MockSBOMAdapter)
+        assert registry.check_tool_availability()["sbom"]["mock"] is True
+        assert calls == ["load"]
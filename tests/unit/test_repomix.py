@@ -150,3 +150,116 @@ class TestRepomixAdapter:
         except RuntimeError:
             # Repomix not installed
             pass
+
+    def test_extract_metadata(self) -> None:
+        """Test token count, file count and version are read from Repomix stdout."""
+        from orisha.analyzers.repomix.adapter import RepomixAdapter
+
+        # Metadata parsing does not need the Repomix command
+        adapter = RepomixAdapter.__new__(RepomixAdapter)
+        stdout = (
+            "📦 Repomix v0.2.41\n"
+            "Total Files: 12 files packed\n"
+            "Total Tokens: 4500 tokens\n"
+            "Total Tokens: 9999 tokens\n"
+        )
+
+        assert adapter._extract_metadata(stdout) == (4500, 12, "0.2.41")
+        assert adapter._extract_metadata("") == (0, 0, None)
+
+    def test_read_output(self, tmp_path: Path) -> None:
+        """Test the output file is decoded with newlines normalized like read_text."""
+        from orisha.analyzers.repomix.adapter import _read_output
+
+        output = tmp_path / "repomix-output.txt"
+        output.write_bytes("def héllo():\r\n    pass\rend\n".encode())
+        empty = tmp_path / "empty.txt"
+        empty.write_bytes(b"")
+
+        assert _read_output(output) == output.read_text(encoding="utf-8")
+        assert _read_output(output) == "def héllo():\n    pass\nend\n"
+        assert _read_output(empty) == ""
+
+    def test_compress_default_path_reports_summary(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Test compress without an output path keeps Repomix's token count and cleans up."""
+        import shutil
+        import subprocess
+
+        from orisha.analyzers.repomix import adapter as adapter_module
+
+        packed = '<file path="a.py">\ndef a(): ...\n</file>\n'
+        summary = "📦 Repomix v0.2.41\nTotal Files: 2 files packed\nTotal Tokens: 4500 tokens\n"
+        outputs: list[Path] = []
+
+        def run(cmd: list[str], **_: object) -> subprocess.CompletedProcess[str]:
+            output = Path(cmd[cmd.index("--output") + 1])
+            output.write_text(packed)
+            outputs.append(output)
+            return subprocess.CompletedProcess(cmd, 0, stdout=summary, stderr="")
+
+        monkeypatch.setattr(shutil, "which", lambda cmd: f"/usr/bin/{cmd}")
+        monkeypatch.setattr(adapter_module.subprocess, "run", run)
+
+        compressed = adapter_module.RepomixAdapter().compress(tmp_path)
+
+        assert compressed.compressed_content == packed
+        assert compressed.token_count == 4500
+        assert compressed.file_count == 2
+        assert compressed.tool_version == "0.2.41"
+        assert compressed.source_path == tmp_path.resolve()
+        assert not outputs[0].parent.exists()
+
+    @pytest.mark.parametrize(
+        ("stdout", "expected"),
+        [("0.2.41\n", "0.2.41"), ("\nv1.4.0\nUpdate available\n", "1.4.0"), ("dev\n", "dev")],
+    )
+    def test_get_version(
+        self, monkeypatch: pytest.MonkeyPatch, stdout: str, expected: str
+    ) -> None:
+        """Test the version is taken from the first line of `repomix --version`."""
+        import subprocess
+
+        from orisha.analyzers.repomix.adapter import RepomixAdapter
+
+        adapter = RepomixAdapter.__new__(RepomixAdapter)
+        adapter._repomix_cmd = ["repomix"]
+        monkeypatch.setattr(
+            subprocess,
+            "run",
+            lambda cmd, **_: subprocess.CompletedProcess(cmd, 0, stdout=stdout, stderr=""),
+        )
+
+        assert adapter.get_version() == expected
+
+    def test_repomix_command_lookup_is_cached(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test a found Repomix is remembered per PATH, but a failed search is retried."""
+        import shutil
+
+        from orisha.analyzers.repomix.adapter import RepomixAdapter
+
+        found: dict[str, str | None] = {"repomix": None, "npx": None}
+        searched: list[str] = []
+
+        def which(cmd: str) -> str | None:
+            searched.append(cmd)
+            return found[cmd]
+
+        monkeypatch.setattr(shutil, "which", which)
+        monkeypatch.setenv("PATH", "/usr/bin")
+
+        with pytest.raises(RuntimeError, match="not found"):
+            RepomixAdapter()
+
+        found["repomix"] = "/usr/bin/repomix"
+        first = RepomixAdapter()
+        second = RepomixAdapter()
+
+        assert first._repomix_cmd == second._repomix_cmd == ["repomix"]
+        assert searched == ["repomix", "npx", "repomix"]
+
+        # A different PATH is searched afresh
+        monkeypatch.setenv("PATH", "/opt/bin:/usr/bin")
+        RepomixAdapter()
+        assert searched == ["repomix", "npx", "repomix", "repomix"]
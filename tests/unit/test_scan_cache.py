@@ -0,0 +1,46 @@
+"""Unit tests for the persisted per-file scan cache."""
+
+from pathlib import Path
+
+from orisha.analyzers.scan_cache import ScanCache
+
+
+def _cache(path: Path) -> ScanCache[list[str]]:
+    return ScanCache(path, 1, encode=list, decode=list, description="test")
+
+
+class TestScanCache:
+    """Tests for ScanCache."""
+
+    def test_round_trip_and_staleness(self, tmp_path: Path) -> None:
+        """Test results persist across instances until the file changes."""
+        cache_path = tmp_path / ".orisha" / "cache.json"
+        source = tmp_path / "a.py"
+        source.write_text("x = 1\n")
+
+        stats: dict[Path, tuple[str, int, int]] = {}
+        found: dict[Path, list[str]] = {}
+        assert _cache(cache_path).split(tmp_path, [source], stats, found) == [source]
+        found[source] = ["hit"]
+        first = _cache(cache_path)
+        first.update(stats, found, complete=False)
+
+        stats, found = {}, {}
+        assert _cache(cache_path).split(tmp_path, [source], stats, found) == []
+        assert found == {source: ["hit"]}
+
+        source.write_text("x = 22\n")
+        assert _cache(cache_path).split(tmp_path, [source], {}, {}) == [source]
+
+    def test_version_mismatch_ignored(self, tmp_path: Path) -> None:
+        """Test a cache written with another format version is not used."""
+        cache_path = tmp_path / "cache.json"
+        source = tmp_path / "a.py"
+        source.write_text("")
+        stats: dict[Path, tuple[str, int, int]] = {}
+        _cache(cache_path).split(tmp_path, [source], stats, {})
+        _cache(cache_path).update(stats, {source: ["hit"]}, complete=False)
+
+        newer = ScanCache(cache_path, 2, encode=list, decode=list, description="test")
+
+        assert newer.split(tmp_path, [source], {}, {}) == [source]
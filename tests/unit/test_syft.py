@@ -0,0 +1,329 @@
+"""Unit tests for Syft SBOM adapter."""
+
+import json
+import subprocess
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from orisha.analyzers.base import ToolExecutionError
+from orisha.analyzers.dependency import DirectDependencyResolver
+from orisha.analyzers.sbom import syft as syft_module
+from orisha.analyzers.sbom.syft import SyftAdapter
+
+
+@pytest.fixture(autouse=True)
+def syft_on_path(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Treat Syft as found on PATH; tests mock the process itself."""
+    monkeypatch.setattr(syft_module, "locate_tool", lambda tool: f"/usr/bin/{tool}")
+
+
+class TestSyftAdapter:
+    """Tests for SyftAdapter output transformation (no Syft binary needed)."""
+
+    @pytest.fixture
+    def adapter(self) -> SyftAdapter:
+        """Create a Syft adapter instance."""
+        return SyftAdapter()
+
+    @pytest.fixture
+    def syft_output(self) -> dict[str, Any]:
+        """Syft JSON output with a repeated artifact."""
+        requests = {
+            "name": "requests",
+            "type": "python",
+            "version": "2.31.0",
+            "purl": "pkg:pypi/requests@2.31.0",
+            "licenses": [{"value": "Apache-2.0"}],
+            "locations": [{"path": "/requirements.txt"}],
+        }
+        return {
+            "artifacts": [
+                requests,
+                {
+                    "name": "lodash",
+                    "type": "npm",
+                    "version": "4.17.21",
+                    "licenses": [{"value": "MIT"}, "CC0-1.0", {"value": ""}],
+                    "locations": ["/package-lock.json"],
+                },
+                dict(requests),
+                {"name": "", "type": "npm"},
+                {"name": "libfoo", "type": "unknown-type"},
+            ]
+        }
+
+    def test_transform_to_canonical(
+        self, adapter: SyftAdapter, syft_output: dict[str, Any]
+    ) -> None:
+        """Test artifacts are mapped to canonical packages."""
+        sbom = adapter._transform_to_canonical(syft_output, Path("/repo"))
+
+        found = [
+            (p.name, p.ecosystem, p.version, p.license, p.source_file, p.purl)
+            for p in sbom.packages
+        ]
+        assert found == [
+            (
+                "requests",
+                "pypi",
+                "2.31.0",
+                "Apache-2.0",
+                "/requirements.txt",
+                "pkg:pypi/requests@2.31.0",
+            ),
+            ("lodash", "npm", "4.17.21", "MIT AND CC0-1.0", "/package-lock.json", None),
+            (
+                "requests",
+                "pypi",
+                "2.31.0",
+                "Apache-2.0",
+                "/requirements.txt",
+                "pkg:pypi/requests@2.31.0",
+            ),
+            ("libfoo", "unknown-type", None, None, None, None),
+        ]
+        assert sbom.source.target == "/repo"
+
+    def test_package_type_mapping(self, adapter: SyftAdapter) -> None:
+        """Test Syft types map to ecosystems case-insensitively, keeping unknown types."""
+        artifacts = [
+            {"name": "a", "type": "go-module"},
+            {"name": "b", "type": "Java-Archive"},
+            {"name": "c", "type": "R-PACKAGE"},
+            {"name": "d"},
+        ]
+
+        sbom = adapter._transform_to_canonical({"artifacts": artifacts}, Path("/repo"))
+
+        assert [p.ecosystem for p in sbom.packages] == ["go", "maven", "r-package", "unknown"]
+
+    def test_single_license(self, adapter: SyftAdapter) -> None:
+        """Test a lone license is used as-is, matching the multi-license join."""
+        artifacts = [
+            {"name": "a", "type": "npm", "licenses": [{"value": "MIT"}]},
+            {"name": "b", "type": "npm", "licenses": ["ISC"]},
+            {"name": "c", "type": "npm", "licenses": [{"value": ""}]},
+            {"name": "d", "type": "npm", "licenses": [{"spdxExpression": "MIT"}]},
+        ]
+
+        sbom = adapter._transform_to_canonical({"artifacts": artifacts}, Path("/repo"))
+
+        assert [p.license for p in sbom.packages] == [
+            "MIT",
+            "ISC",
+            "",
+            "{'spdxExpression': 'MIT'}",
+        ]
+
+    def test_repeated_artifacts_share_package(
+        self, adapter: SyftAdapter, syft_output: dict[str, Any]
+    ) -> None:
+        """Test identical artifacts reuse one CanonicalPackage within a transform."""
+        sbom = adapter._transform_to_canonical(syft_output, Path("/repo"))
+
+        assert sbom.packages[0] is sbom.packages[2]
+
+        # A new transform does not reuse packages from an earlier scan
+        again = adapter._transform_to_canonical(syft_output, Path("/repo"))
+        assert again.packages[0] is not sbom.packages[0]
+        assert again.packages[0] == sbom.packages[0]
+
+    def test_direct_status_from_resolver(
+        self, tmp_path: Path, syft_output: dict[str, Any]
+    ) -> None:
+        """Test packages declared in manifests are marked direct, at any version."""
+        (tmp_path / "requirements.txt").write_text("Requests\n")
+        resolver = DirectDependencyResolver()
+        resolver.resolve_from_directory(tmp_path)
+        syft_output["artifacts"].append(dict(syft_output["artifacts"][0], version="2.32.0"))
+        adapter = SyftAdapter(dependency_resolver=resolver)
+
+        sbom = adapter._transform_to_canonical(syft_output, tmp_path)
+
+        assert [p.is_direct for p in sbom.packages] == [True, False, True, False, True]
+
+
+class TestSyftExecute:
+    """Tests for running Syft and loading its JSON output (Syft is mocked)."""
+
+    @pytest.fixture
+    def adapter(self, monkeypatch: pytest.MonkeyPatch) -> SyftAdapter:
+        """Create a Syft adapter that reports Syft as installed."""
+        adapter = SyftAdapter()
+        monkeypatch.setattr(adapter, "check_available", lambda: True)
+        return adapter
+
+    def mock_syft(self, monkeypatch: pytest.MonkeyPatch, output: bytes) -> None:
+        """Make subprocess.run write output where Syft was told to write its JSON."""
+
+        def run(cmd: list[str], **_: Any) -> subprocess.CompletedProcess[str]:
+            if cmd == ["syft", "version"]:
+                return subprocess.CompletedProcess(cmd, 0, stdout="Version: 1.0.0", stderr="")
+            output_arg = cmd[cmd.index("-o") + 1]
+            Path(output_arg.removeprefix("json=")).write_bytes(output)
+            return subprocess.CompletedProcess(cmd, 0, stdout=None, stderr="")
+
+        monkeypatch.setattr(syft_module.subprocess, "run", run)
+
+    @pytest.mark.parametrize("stream", [False, True])
+    def test_execute_loads_output_file(
+        self,
+        adapter: SyftAdapter,
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path: Path,
+        stream: bool,
+    ) -> None:
+        """Test Syft output is parsed whole, or streamed when over the threshold."""
+        if stream:
+            pytest.importorskip("ijson")
+            monkeypatch.setattr(syft_module, "SBOM_STREAM_THRESHOLD_BYTES", 0)
+        artifacts = [
+            {"name": "requests", "type": "python", "version": "2.31.0"},
+            {"name": "lodash", "type": "npm", "version": "4.17.21"},
+        ]
+        self.mock_syft(monkeypatch, json.dumps({"artifacts": artifacts}).encode())
+
+        sbom = adapter.execute(tmp_path)
+
+        assert [(p.name, p.ecosystem, p.version) for p in sbom.packages] == [
+            ("requests", "pypi", "2.31.0"),
+            ("lodash", "npm", "4.17.21"),
+        ]
+
+    def test_execute_records_scan_start_time(
+        self, adapter: SyftAdapter, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Test the SBOM's scanned_at is taken once, before Syft runs."""
+        before = datetime.now(UTC)
+        started: list[datetime] = []
+
+        def run(cmd: list[str], **_: Any) -> subprocess.CompletedProcess[str]:
+            if cmd == ["syft", "version"]:
+                return subprocess.CompletedProcess(cmd, 0, stdout="Version: 1.0.0", stderr="")
+            started.append(datetime.now(UTC))
+            output_arg = cmd[cmd.index("-o") + 1]
+            Path(output_arg.removeprefix("json=")).write_text('{"artifacts": []}')
+            return subprocess.CompletedProcess(cmd, 0, stdout=None, stderr="")
+
+        monkeypatch.setattr(syft_module.subprocess, "run", run)
+
+        sbom = adapter.execute(tmp_path)
+
+        assert before <= sbom.source.scanned_at <= started[0]
+
+    def test_execute_with_stdlib_json(
+        self, adapter: SyftAdapter, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Test Syft output is decoded the same without orjson installed."""
+        monkeypatch.setattr(syft_module, "_json_loads", json.loads)
+        self.mock_syft(monkeypatch, b'{"artifacts": [{"name": "six", "type": "python"}]}')
+
+        sbom = adapter.execute(tmp_path)
+
+        assert [(p.name, p.ecosystem) for p in sbom.packages] == [("six", "pypi")]
+
+    @pytest.mark.parametrize("stream", [False, True])
+    def test_execute_invalid_output(
+        self,
+        adapter: SyftAdapter,
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path: Path,
+        stream: bool,
+    ) -> None:
+        """Test unparseable Syft output raises ToolExecutionError."""
+        if stream:
+            pytest.importorskip("ijson")
+            monkeypatch.setattr(syft_module, "SBOM_STREAM_THRESHOLD_BYTES", 0)
+        self.mock_syft(monkeypatch, b'{"artifacts": [{"name": ')
+
+        with pytest.raises(ToolExecutionError, match="Failed to parse Syft JSON output"):
+            adapter.execute(tmp_path)
+
+    def test_execute_many(
+        self, adapter: SyftAdapter, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Test several paths are scanned by separate Syft runs and returned in order."""
+        scanned: list[str] = []
+
+        def run(cmd: list[str], **_: Any) -> subprocess.CompletedProcess[str]:
+            if cmd == ["syft", "version"]:
+                return subprocess.CompletedProcess(cmd, 0, stdout="Version: 1.0.0", stderr="")
+            target = Path(cmd[1]).name
+            scanned.append(target)
+            output = {"artifacts": [{"name": target, "type": "python"}]}
+            output_arg = cmd[cmd.index("-o") + 1]
+            Path(output_arg.removeprefix("json=")).write_text(json.dumps(output))
+            return subprocess.CompletedProcess(cmd, 0, stdout=None, stderr="")
+
+        monkeypatch.setattr(syft_module.subprocess, "run", run)
+        paths = [tmp_path / name for name in ("alpha", "beta", "gamma")]
+
+        sboms = adapter.execute_many(paths)
+
+        assert [[p.name for p in sbom.packages] for sbom in sboms] == [
+            ["alpha"],
+            ["beta"],
+            ["gamma"],
+        ]
+        assert [sbom.source.target for sbom in sboms] == [str(p) for p in paths]
+        assert sorted(scanned) == ["alpha", "beta", "gamma"]
+        assert adapter.execute_many([]) == []
+
+    def test_execute_many_failure(
+        self, adapter: SyftAdapter, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Test a failed scan among several raises ToolExecutionError."""
+
+        def run(cmd: list[str], **_: Any) -> subprocess.CompletedProcess[str]:
+            return subprocess.CompletedProcess(cmd, 1, stdout=None, stderr="boom")
+
+        monkeypatch.setattr(syft_module.subprocess, "run", run)
+
+        with pytest.raises(ToolExecutionError, match="Syft scan failed"):
+            adapter.execute_many([tmp_path / "a", tmp_path / "b"])
+
+    def test_syft_version_runs_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test availability and version share one cached `syft version` run."""
+        calls: list[list[str]] = []
+
+        def run(cmd: list[str], **_: Any) -> subprocess.CompletedProcess[str]:
+            calls.append(cmd)
+            return subprocess.CompletedProcess(cmd, 0, stdout="Version: 1.4.1\n", stderr="")
+
+        monkeypatch.setattr(syft_module.subprocess, "run", run)
+        adapter = SyftAdapter()
+
+        assert adapter.check_available()
+        assert adapter.check_available()
+        assert adapter.version == "1.4.1"
+        assert len(calls) == 1
+
+        adapter.refresh()
+        assert adapter.version == "1.4.1"
+        assert len(calls) == 2
+
+    def test_syft_not_on_path(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test Syft missing from PATH is reported unavailable without running it."""
+        calls: list[list[str]] = []
+        monkeypatch.setattr(syft_module, "locate_tool", lambda _tool: None)
+        monkeypatch.setattr(syft_module.subprocess, "run", lambda cmd, **_: calls.append(cmd))
+        adapter = SyftAdapter()
+
+        assert not adapter.check_available()
+        assert adapter.get_version() is None
+        assert calls == []
+
+    def test_syft_not_installed(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test a Syft binary that cannot be run is reported unavailable with no version."""
+
+        def run(cmd: list[str], **_: Any) -> subprocess.CompletedProcess[str]:
+            raise FileNotFoundError(cmd[0])
+
+        monkeypatch.setattr(syft_module.subprocess, "run", run)
+        adapter = SyftAdapter()
+
+        assert not adapter.check_available()
+        assert adapter.get_version() is None
@@ -0,0 +1,324 @@
+"""Unit tests for Terravision diagram adapter."""
+
+import json
+import subprocess
+from datetime import UTC, datetime
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from orisha.analyzers.base import ToolExecutionError
+from orisha.analyzers.diagrams.terravision import TerravisionAdapter
+
+
+class TestFindTerraformFiles:
+    """Tests for TerravisionAdapter._find_terraform_files."""
+
+    @pytest.fixture
+    def adapter(self) -> TerravisionAdapter:
+        """Create a Terravision adapter instance."""
+        return TerravisionAdapter()
+
+    def test_finds_root_and_nested_files_once(
+        self, adapter: TerravisionAdapter, tmp_path: Path
+    ) -> None:
+        """Test top-level and nested .tf files are each returned exactly once."""
+        (tmp_path / "main.tf").write_text("")
+        (tmp_path / "modules" / "vpc").mkdir(parents=True)
+        (tmp_path / "modules" / "vpc" / "vpc.tf").write_text("")
+
+        result = adapter._find_terraform_files(tmp_path)
+
+        assert result == [tmp_path / "main.tf", tmp_path / "modules" / "vpc" / "vpc.tf"]
+
+    def test_skips_terraform_cache_directory(
+        self, adapter: TerravisionAdapter, tmp_path: Path
+    ) -> None:
+        """Test files under .terraform are excluded."""
+        (tmp_path / "main.tf").write_text("")
+        (tmp_path / ".terraform" / "modules").mkdir(parents=True)
+        (tmp_path / ".terraform" / "modules" / "cached.tf").write_text("")
+
+        result = adapter._find_terraform_files(tmp_path)
+
+        assert result == [tmp_path / "main.tf"]
+
+    def test_single_file_input(self, adapter: TerravisionAdapter, tmp_path: Path) -> None:
+        """Test a single .tf file path is returned as-is."""
+        tf_file = tmp_path / "main.tf"
+        tf_file.write_text("")
+
+        assert adapter._find_terraform_files(tf_file) == [tf_file]
+
+
+class TestVersionProbe:
+    """Tests for cached availability/version probing."""
+
+    def test_single_probe_for_availability_and_version(self) -> None:
+        """Test check_available and get_version share one subprocess call."""
+        adapter = TerravisionAdapter()
+        completed = MagicMock(returncode=0, stdout="terravision 0.8.0\n")
+
+        with (
+            patch("shutil.which", return_value="/usr/local/bin/terravision"),
+            patch("subprocess.run", return_value=completed) as mock_run,
+        ):
+            assert adapter.check_available() is True
+            assert adapter.check_available() is True
+            assert adapter.get_version() == "terravision 0.8.0"
+            assert adapter.version == "terravision 0.8.0"
+
+        assert mock_run.call_count == 1
+        assert mock_run.call_args.args[0] == ["/usr/local/bin/terravision", "--version"]
+        assert adapter._binary_path == "/usr/local/bin/terravision"
+
+    def test_missing_binary_cached_as_unavailable(self) -> None:
+        """Test a binary missing from PATH is reported unavailable without forking."""
+        adapter = TerravisionAdapter()
+
+        with (
+            patch("shutil.which", return_value=None) as mock_which,
+            patch("subprocess.run") as mock_run,
+        ):
+            assert adapter.check_available() is False
+            assert adapter.get_version() is None
+
+        assert mock_which.call_count == 1
+        mock_run.assert_not_called()
+
+    def test_timeout_reported_unavailable(self) -> None:
+        """Test a hung probe is treated as unavailable."""
+        adapter = TerravisionAdapter()
+
+        with (
+            patch("shutil.which", return_value="/usr/local/bin/terravision"),
+            patch("subprocess.run", side_effect=subprocess.TimeoutExpired("terravision", 10)),
+        ):
+            assert adapter.check_available() is False
+
+
+class TestCleanup:
+    """Tests for Terravision temporary file cleanup."""
+
+    def test_removes_present_files_and_ignores_missing(self, tmp_path: Path) -> None:
+        """Test cleanup removes existing temp files even when others are missing."""
+        (tmp_path / "architecture.json").write_text("{}")
+        (tmp_path / "tfdata.json").write_text("{}")
+        (tmp_path / "main.tf").write_text("")
+
+        TerravisionAdapter()._cleanup_terravision_files(tmp_path)
+
+        assert not (tmp_path / "architecture.json").exists()
+        assert not (tmp_path / "tfdata.json").exists()
+        assert (tmp_path / "main.tf").exists()
+
+
+class TestTransformOutput:
+    """Tests for TerravisionAdapter._transform_terravision_output."""
+
+    def test_builds_graph_from_adjacency_list(self, tmp_path: Path) -> None:
+        """Test nodes, connections, attributes and providers are populated."""
+        adapter = TerravisionAdapter()
+        adapter._available = True
+        tf_file = tmp_path / "main.tf"
+        tv_output = {
+            "aws_lambda_function.proxy": ["aws_s3_bucket.data", "", "aws_s3_bucket.data"],
+            "aws_s3_bucket.data": [],
+            "google_storage_bucket.logs": ["aws_lambda_function.proxy"],
+        }
+        tfdata = {
+            "meta_data": {
+                "aws_lambda_function.proxy": {
+                    "runtime": "python3.12",
+                    "arn": True,
+                    "id": "abc",
+                    "layers": [],
+                    "environment": {},
+                    "timeout": 30,
+                    "reserved_concurrent_executions": 0,
+                },
+            },
+        }
+
+        result = adapter._transform_terravision_output(tv_output, tmp_path, [tf_file], tfdata)
+
+        graph = result.graph
+        assert graph.node_count == 3
+        assert graph.connections == {
+            "aws_lambda_function.proxy": ["aws_s3_bucket.data"],
+            "google_storage_bucket.logs": ["aws_lambda_function.proxy"],
+        }
+        assert graph.cloud_providers == ["aws", "gcp"]
+        lambda_node = graph.nodes["aws_lambda_function.proxy"]
+        assert lambda_node.type == "aws_lambda_function"
+        assert lambda_node.name == "proxy"
+        assert lambda_node.attributes == {
+            "runtime": "python3.12",
+            "timeout": 30,
+            "reserved_concurrent_executions": 0,
+        }
+        assert result.source is not None
+        assert result.source.source_files == ["main.tf"]
+
+    def test_uses_given_generated_at(self, tmp_path: Path) -> None:
+        """Test the analysis start time is recorded instead of a fresh clock read."""
+        adapter = TerravisionAdapter()
+        adapter._available = True
+        started = datetime(2026, 1, 1, tzinfo=UTC)
+
+        result = adapter._transform_terravision_output(
+            {"aws_s3_bucket.data": []}, tmp_path, [], generated_at=started
+        )
+
+        assert result.source is not None
+        assert result.source.generated_at == started
+
+    def test_node_id_without_type_prefix(self, tmp_path: Path) -> None:
+        """Test node IDs without a dot fall back to an unknown type."""
+        adapter = TerravisionAdapter()
+        adapter._available = True
+
+        result = adapter._transform_terravision_output({"orphan": []}, tmp_path, [])
+
+        node = result.graph.nodes["orphan"]
+        assert node.type == "unknown"
+        assert node.provider == "unknown"
+        assert node.name == "orphan"
+
+
+class TestExecuteBatch:
+    """Tests for TerravisionAdapter.execute_batch."""
+
+    def test_results_preserve_input_order(self, tmp_path: Path) -> None:
+        """Test batch results are returned in input order."""
+        adapter = TerravisionAdapter()
+        paths = [tmp_path / "a", tmp_path / "b", tmp_path / "c"]
+        results = {path: MagicMock(name=path.name) for path in paths}
+
+        with patch.object(adapter, "execute", side_effect=results.__getitem__) as mock_exec:
+            output = adapter.execute_batch(paths, max_workers=2)
+
+        assert output == [results[path] for path in paths]
+        assert mock_exec.call_count == 3
+
+    def test_empty_batch(self) -> None:
+        """Test an empty batch returns an empty list."""
+        assert TerravisionAdapter().execute_batch([]) == []
+
+
+class TestStreamedGraph:
+    """Tests for streaming architecture.json with ijson."""
+
+    def test_streamed_graph_matches_loaded_graph(self, tmp_path: Path) -> None:
+        """Test streaming produces the same graph as loading the dict."""
+        pytest.importorskip("ijson")
+        adapter = TerravisionAdapter()
+        adapter._available = True
+        tv_output = {
+            "aws_lambda_function.proxy": ["aws_s3_bucket.data"],
+            "aws_s3_bucket.data": [],
+        }
+        graph_json_path = tmp_path / "architecture.json"
+        graph_json_path.write_text(json.dumps(tv_output))
+
+        streamed = adapter._transform_streamed_graph(graph_json_path, tmp_path, [], None)
+        loaded = adapter._transform_terravision_output(tv_output, tmp_path, [])
+
+        assert streamed.graph.to_dict() == loaded.graph.to_dict()
+
+    def test_empty_streamed_graph_raises(self, tmp_path: Path) -> None:
+        """Test an empty streamed graph is reported as missing output."""
+        pytest.importorskip("ijson")
+        graph_json_path = tmp_path / "architecture.json"
+        graph_json_path.write_text("{}")
+
+        with pytest.raises(ToolExecutionError, match="did not produce graph output"):
+            TerravisionAdapter()._transform_streamed_graph(graph_json_path, tmp_path, [], None)
+
+
+class TestRelativeSourceFiles:
+    """Tests for TerravisionAdapter._relative_source_files."""
+
+    def test_matches_relative_to(self, tmp_path: Path) -> None:
+        """Test slicing gives the same result as Path.relative_to."""
+        tf_files = [tmp_path / "main.tf", tmp_path / "modules" / "vpc" / "vpc.tf"]
+
+        result = TerravisionAdapter()._relative_source_files(tmp_path, tf_files)
+
+        assert result == [str(f.relative_to(tmp_path)) for f in tf_files]
+
+    def test_single_file_input(self, tmp_path: Path) -> None:
+        """Test a single-file input path maps to '.' like relative_to."""
+        tf_file = tmp_path / "main.tf"
+
+        assert TerravisionAdapter()._relative_source_files(tf_file, [tf_file]) == ["."]
+
+
+class TestExecuteTerravision:
+    """Tests for TerravisionAdapter._execute_terravision with a faked CLI run."""
+
+    @staticmethod
+    def _fake_draw(outputs: dict[str, bytes]) -> MagicMock:
+        """Create a subprocess.run stand-in that writes Terravision outputs to cwd."""
+
+        def run(_cmd: list[str], **kwargs: object) -> MagicMock:
+            cwd = Path(str(kwargs["cwd"]))
+            for filename, content in outputs.items():
+                (cwd / filename).write_bytes(content)
+            return MagicMock(returncode=0, stdout="", stderr="")
+
+        return MagicMock(side_effect=run)
+
+    def test_debug_output_with_diagram(self, tmp_path: Path) -> None:
+        """Test tfdata.json is used, the diagram is copied and temp files removed."""
+        adapter = TerravisionAdapter()
+        adapter._available = True
+        adapter._binary_path = "/usr/local/bin/terravision"
+        tf_file = tmp_path / "main.tf"
+        tf_file.write_text("")
+        tfdata = {
+            "graphdict": {"aws_s3_bucket.data": []},
+            "meta_data": {"aws_s3_bucket.data": {"bucket": "data"}},
+        }
+        fake_run = self._fake_draw({
+            "tfdata.json": json.dumps(tfdata).encode(),
+            "architecture.dot.png": b"\x89PNG",
+        })
+
+        with patch("subprocess.run", fake_run):
+            result = adapter._execute_terravision(tmp_path, [tf_file])
+
+        assert fake_run.call_args.args[0][:2] == ["/usr/local/bin/terravision", "draw"]
+        assert result.graph.nodes["aws_s3_bucket.data"].attributes == {"bucket": "data"}
+        assert result.rendered_image is not None
+        assert result.rendered_image.path == tmp_path / "docs" / "architecture.png"
+        assert result.rendered_image.path.read_bytes() == b"\x89PNG"
+        assert not (tmp_path / "tfdata.json").exists()
+        assert not (tmp_path / "architecture.dot.png").exists()
+
+    def test_falls_back_to_architecture_json(self, tmp_path: Path) -> None:
+        """Test architecture.json is used when tfdata.json is absent."""
+        adapter = TerravisionAdapter(use_debug=False)
+        adapter._available = True
+        fake_run = self._fake_draw({
+            "architecture.json": json.dumps({"aws_s3_bucket.data": []}).encode(),
+        })
+
+        with patch("subprocess.run", fake_run):
+            result = adapter._execute_terravision(tmp_path, [])
+
+        assert result.graph.get_node_ids() == ["aws_s3_bucket.data"]
+        assert result.rendered_image is None
+        assert not (tmp_path / "docs").exists()
+
+    def test_no_graph_output_raises(self, tmp_path: Path) -> None:
+        """Test missing graph output raises ToolExecutionError."""
+        adapter = TerravisionAdapter()
+        adapter._available = True
+
+        with (
+            patch("subprocess.run", self._fake_draw({})),
+            pytest.raises(ToolExecutionError, match="did not produce graph output"),
+        ):
+            adapter._execute_terravision(tmp_path, [])